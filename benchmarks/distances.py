@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import sys
+    import time
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    import fmc
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Compare the vectorised distance calculation with the scalar one from PyGuymer3.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--flights",
+        default = 20000,
+           help = "the number of flights",
+           type = int,
+    )
+    parser.add_argument(
+        "--routes",
+        default = 1000,
+           help = "the number of unique routes",
+           type = int,
+    )
+    parser.add_argument(
+        "--tolerance",
+        default = 1.0e-3,
+           help = "the largest allowed difference in the distance of any flight (in metres)",
+           type = float,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Create a deterministic set of airports and flights ...
+    rng = numpy.random.default_rng(seed = 0)
+    airports = [
+        {
+            "IATA" : f"{i:03d}",
+             "lat" : float(rng.uniform(-89.0, +89.0)),
+             "lon" : float(rng.uniform(-180.0, +180.0)),
+        }
+        for i in range(1000)
+    ]
+    routes = rng.integers(0, len(airports), size = (args.routes, 2))
+    flights = routes[rng.integers(0, args.routes, size = args.flights), :]
+    flips = rng.random(args.flights) < 0.5
+    flights[flips, :] = flights[flips, ::-1]
+    iatas1 = [f"{i:03d}" for i in flights[:, 0]]
+    iatas2 = [f"{i:03d}" for i in flights[:, 1]]
+
+    # Calculate the distances one flight at a time ...
+    # NOTE: This is what "fmc.run()" used to do for every row.
+    t0 = time.perf_counter()
+    serial = numpy.zeros(args.flights, dtype = numpy.float64)                   # [m]
+    for i, (iata1, iata2) in enumerate(zip(iatas1, iatas2, strict = True)):
+        lon1, lat1 = fmc.coordinates_of_IATA(airports, iata1)                   # [°], [°]
+        lon2, lat2 = fmc.coordinates_of_IATA(airports, iata2)                   # [°], [°]
+        serial[i], _, _ = pyguymer3.geo.calc_dist_between_two_locs(
+            lon1,
+            lat1,
+            lon2,
+            lat2,
+        )                                                                       # [m]
+    t1 = time.perf_counter()
+
+    # Calculate the distances all at once ...
+    batch = fmc.calc_flight_distances(
+        fmc.AirportIndex(airports),
+        iatas1,
+        iatas2,
+    )                                                                           # [m]
+    t2 = time.perf_counter()
+
+    # Print summary ...
+    diff = numpy.abs(batch - serial).max()                                      # [m]
+    print(f"serial: {t1 - t0:,.3f} s, total = {0.001 * serial.sum():,.6f} km")
+    print(f" batch: {t2 - t1:,.3f} s, total = {0.001 * batch.sum():,.6f} km")
+    print(f"largest difference = {diff:.3e} m")
+    if diff > args.tolerance:
+        print(f"FAIL: the largest difference is more than {args.tolerance:.3e} m.")
+        sys.exit(1)
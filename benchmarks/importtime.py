@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import os
+    import subprocess
+    import sys
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Check that \"import fmc\" and the airport lookups start up within their time budgets and without importing the plotting dependencies.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--import-budget",
+        default = 20.0,
+           dest = "importBudget",
+           help = "the start-up time budget for \"import fmc\" (in milliseconds)",
+           type = float,
+    )
+    parser.add_argument(
+        "--lookup-budget",
+        default = 200.0,
+           dest = "lookupBudget",
+           help = "the start-up time budget for \"import fmc\" followed by loading the airport database and looking up an airport (in milliseconds)",
+           type = float,
+    )
+    parser.add_argument(
+        "--repeats",
+        default = 5,
+           help = "the number of fresh processes to time for each case (the best one is used)",
+           type = int,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Define the modules which must not be imported by either case ...
+    forbidden = [
+        "cartopy",
+        "matplotlib",
+        "pyguymer3",
+        "shapely",
+    ]
+
+    # Define the cases (the code to run and the budget for it) ...
+    cases = {
+        "import fmc" : (
+            "import fmc",
+            args.importBudget,
+        ),
+        "lookup" : (
+            "import fmc; fmc.country_of_IATA(fmc.load_airports(debug = False), \"LHR\")",
+            args.lookupBudget,
+        ),
+    }
+
+    # Define a function to parse the "-X importtime" report and return the
+    # cumulative time of each top-level import ...
+    # NOTE: Each line of the "-X importtime" report looks like
+    #       "import time: self [us] | cumulative | imported package",
+    #       where nested imports are indented by two spaces per level.
+    def parse(report):
+        ans = {}
+        for line in report.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, package = line.removeprefix("import time:").split("|")
+            if not cumulative.strip().isdigit():
+                continue
+            if package.startswith("  "):
+                continue
+            ans[package.strip()] = 0.001 * float(cumulative)                    # [ms]
+        return ans
+
+    # Find the top-level imports of a bare interpreter (which are not charged
+    # to either case) ...
+    resp = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+           check = True,
+        encoding = "utf-8",
+          stderr = subprocess.PIPE,
+          stdout = subprocess.DEVNULL,
+         timeout = 600.0,
+    )
+    baseline = parse(resp.stderr)
+
+    # Initialize flag ...
+    failed = False
+
+    # Loop over cases ...
+    for name, (code, budget) in cases.items():
+        # Loop over repeats ...
+        best = None                                                             # [ms]
+        for _ in range(args.repeats):
+            # Run the code in a fresh process and ask it to print the modules
+            # which it imported ...
+            resp = subprocess.run(
+                [
+                    sys.executable,
+                    "-X", "importtime",
+                    "-c", f"{code}; import sys; print(\"\\n\".join(sorted(sys.modules)))",
+                ],
+                   check = True,
+                encoding = "utf-8",
+                     env = os.environ | {"PYTHONPATH" : os.path.dirname(os.path.dirname(os.path.abspath(__file__)))},
+                  stderr = subprocess.PIPE,
+                  stdout = subprocess.PIPE,
+                 timeout = 600.0,
+            )
+
+            # Sum up the cumulative time of the top-level imports which a bare
+            # interpreter does not do ...
+            total = 0.0                                                         # [ms]
+            for package, cumulative in parse(resp.stderr).items():
+                if package in baseline:
+                    continue
+                total += cumulative                                             # [ms]
+            if best is None or total < best:
+                best = total                                                    # [ms]
+
+            # Check that no plotting dependencies were imported ...
+            modules = {module.partition(".")[0] for module in resp.stdout.splitlines()}
+            for module in forbidden:
+                if module in modules:
+                    print(f"FAIL: \"{name}\" imported \"{module}\".")
+                    failed = True
+
+        # Check that it is within budget ...
+        if best > budget:
+            print(f"FAIL: \"{name}\" took {best:,.1f} ms, which is more than {budget:,.1f} ms.")
+            failed = True
+        else:
+            print(f"PASS: \"{name}\" took {best:,.1f} ms, which is less than {budget:,.1f} ms.")
+
+    # Exit with an error if any of the checks failed ...
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import json
+    import os
+    import subprocess
+    import sys
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Compare the time and the memory needed to load the airport database from JSON and from the compiled (memory-mapped) file.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--db",
+        default = None,
+           dest = "dbFile",
+           help = "the JSON airport database (defaults to the one which comes with FMC)",
+    )
+    parser.add_argument(
+        "--repeats",
+        default = 5,
+           help = "the number of fresh processes to time for each method",
+           type = int,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Define the code which is run in each fresh process (it prints the time
+    # taken to load the airport database and the increase in the peak RSS that
+    # loading it caused) ...
+    # NOTE: NumPy is imported before measuring so that both methods are charged
+    #       for the airport database only.
+    code = """
+import json, os, resource, sys, time
+import numpy
+import fmc
+method, dbFile = sys.argv[1], sys.argv[2] or f"{os.path.dirname(fmc.__file__)}/db.json"
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+if method == "json":
+    with open(dbFile, mode = "rt", encoding = "utf-8") as fObj:
+        airports = fmc.AirportIndex(json.load(fObj))
+else:
+    airports = fmc.load_airports(dbFile = dbFile, debug = False)
+airports.country_of_IATA("LHR")
+t1 = time.perf_counter()
+rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"time" : t1 - t0, "rss" : rss1 - rss0}))
+"""
+
+    # Make sure that the compiled airport database exists before timing ...
+    subprocess.run(
+        [sys.executable, "-c", code, "mmap", args.dbFile or ""],
+          check = True,
+            env = os.environ | {"PYTHONPATH" : os.path.dirname(os.path.dirname(os.path.abspath(__file__)))},
+         stdout = subprocess.DEVNULL,
+        timeout = 600.0,
+    )
+
+    # Loop over methods ...
+    for method in ["json", "mmap"]:
+        # Loop over repeats ...
+        results = []
+        for _ in range(args.repeats):
+            # Run the code in a fresh process and save the results ...
+            resp = subprocess.run(
+                [sys.executable, "-c", code, method, args.dbFile or ""],
+                   check = True,
+                encoding = "utf-8",
+                     env = os.environ | {"PYTHONPATH" : os.path.dirname(os.path.dirname(os.path.abspath(__file__)))},
+                  stdout = subprocess.PIPE,
+                 timeout = 600.0,
+            )
+            results.append(json.loads(resp.stdout.splitlines()[-1]))
+
+        # Print summary ...
+        # NOTE: "ru_maxrss" is in kilobytes on Linux and in bytes on MacOS.
+        times = sorted(result["time"] for result in results)                    # [s]
+        rsses = sorted(result["rss"] for result in results)
+        print(f"{method}: best = {1.0e3 * times[0]:,.3f} ms, median = {1.0e3 * times[len(times) // 2]:,.3f} ms, peak RSS increase = {rsses[len(rsses) // 2]:,d} (in units of \"ru_maxrss\")")
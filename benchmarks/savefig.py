@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import io
+    import time
+
+    # Import special modules ...
+    try:
+        import cartopy
+        import cartopy.io.shapereader
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+        matplotlib.rcParams.update(
+            {
+                   "backend" : "Agg",                                           # NOTE: See https://matplotlib.org/stable/gallery/user_interfaces/canvasagg.html
+                "figure.dpi" : 300,
+            }
+        )
+        import matplotlib.pyplot
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    import fmc
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Compare the time taken to save a figure with one artist per country against one artist per style.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--repeats",
+        default = 3,
+           help = "the number of times to save each figure (the best one is used)",
+           type = int,
+    )
+    parser.add_argument(
+        "--resolution",
+        default = "10m",
+        choices = ["10m", "50m", "110m"],
+           help = "the resolution of the Natural Earth country shapes",
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Load the country shapes and pretend that every tenth one was visited ...
+    sfile = cartopy.io.shapereader.natural_earth(
+          category = "cultural",
+              name = "admin_0_countries",
+        resolution = args.resolution,
+    )
+    countries = fmc.load_countries(sfile, debug = False)
+    styles = [
+        ((1.0, 0.0, 0.0, 0.25), (1.0, 0.0, 0.0, 0.25)) if i % 10 == 0 else ((0.0, 0.0, 0.0, 0.25), "none")
+        for i in range(len(countries))
+    ]
+
+    # Loop over methods ...
+    for method in ["one artist per country", "one artist per style"]:
+        # Create figure and axes (just like "fmc.run()" does) ...
+        fg = matplotlib.pyplot.figure(figsize = (2 * 4.8, 2 * 7.2))
+        axes = [
+            pyguymer3.geo.add_axis(
+                fg,
+                add_coastlines = False,
+                 add_gridlines = False,
+                         debug = False,
+                           fov = pyguymer3.EARTH,
+                         index = (1, 2),
+                         ncols = 2,
+                         nrows = 3,
+            ),
+        ]
+        for index, lon, lat, dist in [
+            (3, -97.763, +39.517, 2392.7e3),
+            (4,  +3.156, +49.901, 2346.6e3),
+        ]:
+            axes.append(
+                pyguymer3.geo.add_axis(
+                    fg,
+                      add_coastlines = False,
+                       add_gridlines = False,
+                               debug = False,
+                                dist = dist,
+                               index = index,
+                                 lat = lat,
+                                 lon = lon,
+                               ncols = 2,
+                               nrows = 3,
+                    satellite_height = False,
+                )
+            )
+
+        # Loop over axes ...
+        nArtists = 0                                                            # [#]
+        for ax in axes:
+            # Check which method to use ...
+            if method == "one artist per country":
+                # Draw the countries ...
+                for (_, polys), (edgecolor, facecolor) in zip(countries, styles, strict = True):
+                    ax.add_geometries(
+                        polys,
+                        cartopy.crs.PlateCarree(),
+                        edgecolor = edgecolor,
+                        facecolor = facecolor,
+                        linewidth = 0.5,
+                    )
+                    nArtists += 1                                               # [#]
+            else:
+                # Group the Polygons of the countries by their style and draw
+                # them ...
+                groups = {}
+                for (_, polys), style in zip(countries, styles, strict = True):
+                    groups.setdefault(style, []).extend(polys)
+                for (edgecolor, facecolor), polys in groups.items():
+                    ax.add_geometries(
+                        [shapely.geometry.MultiPolygon(polys)],
+                        cartopy.crs.PlateCarree(),
+                        edgecolor = edgecolor,
+                        facecolor = facecolor,
+                        linewidth = 0.5,
+                    )
+                    nArtists += 1                                               # [#]
+
+        # Save figure (repeatedly) ...
+        times = []                                                              # [s]
+        for _ in range(args.repeats):
+            t0 = time.perf_counter()
+            fg.savefig(io.BytesIO(), format = "png")
+            times.append(time.perf_counter() - t0)                              # [s]
+        matplotlib.pyplot.close(fg)
+
+        # Print summary ...
+        print(f"{method}: {nArtists:,d} artists, best \"savefig\" = {min(times):,.3f} s")
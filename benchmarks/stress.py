@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import concurrent.futures
+    import csv
+    import sys
+    import tempfile
+    import threading
+    import time
+
+    # Import special modules ...
+    try:
+        import cartopy
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+        import matplotlib.image
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    import fmc
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Make PNG maps from deterministic synthetic flight logs concurrently in a pool of threads and check that they are identical to the PNG maps made one at a time and that the global Matplotlib and cartopy configurations do not change whilst they are being made.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--logs",
+        default = 8,
+           help = "the number of synthetic flight logs",
+           type = int,
+    )
+    parser.add_argument(
+        "--max-year",
+        default = 2024,
+           dest = "maxYear",
+           help = "the last year of the synthetic flight logs",
+           type = int,
+    )
+    parser.add_argument(
+        "--rows",
+        default = 100,
+           help = "the number of rows in each synthetic flight log",
+           type = int,
+    )
+    parser.add_argument(
+        "--seed",
+        default = 0,
+           help = "the seed of the random number generator",
+           type = int,
+    )
+    parser.add_argument(
+        "--threads",
+        default = 4,
+           help = "the number of threads",
+           type = int,
+    )
+    parser.add_argument(
+        "--years",
+        default = 20,
+           help = "the number of years spanned by each synthetic flight log",
+           type = int,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Find the IATA codes of all of the airports ...
+    airports = fmc.load_airports(debug = False)
+    iatas = sorted(airports.iataToRow)
+
+    # Define a function to find the global Matplotlib and cartopy
+    # configurations ...
+    def configuration():
+        return {
+            **{f"matplotlib.rcParams[{key!r}]" : str(value) for key, value in matplotlib.rcParams.items()},
+            **{f"cartopy.config[{key!r}]" : str(value) for key, value in cartopy.config.items()},
+        }
+
+    # Find the Matplotlib configuration before any PNG maps are made ...
+    before = dict(matplotlib.rcParams)
+
+    # Create a temporary directory for the synthetic flight logs, the PNG maps
+    # and the on-disk caches ...
+    with tempfile.TemporaryDirectory() as tmpDir:
+        # Loop over synthetic flight logs ...
+        rng = numpy.random.default_rng(seed = args.seed)
+        logFiles = []
+        for iLog in range(args.logs):
+            # Create a deterministic set of flights ...
+            # NOTE: Each flight is between two different airports. The flights
+            #       are in date order (like a real flight log), so that none of
+            #       them are before the default minimum year.
+            ends = rng.choice(len(iatas), size = (args.rows, 2), replace = True)
+            ends = ends[ends[:, 0] != ends[:, 1], :]
+            years = rng.integers(args.maxYear + 1 - args.years, args.maxYear + 1, size = ends.shape[0])
+            months = rng.integers(1, 13, size = ends.shape[0])
+            days = rng.integers(1, 29, size = ends.shape[0])
+            purposes = rng.choice(["Business", "Pleasure"], size = ends.shape[0])
+            order = numpy.lexsort((days, months, years))
+
+            # Write the synthetic flight log ...
+            logFile = f"{tmpDir}/{iLog:d}.csv"
+            with open(logFile, mode = "wt", encoding = "utf-8", newline = "") as fObj:
+                writer = csv.writer(fObj)
+                for i in order.tolist():
+                    writer.writerow(
+                        [
+                            iatas[ends[i, 0]],
+                            iatas[ends[i, 1]],
+                            f"{years[i]:04d}-{months[i]:02d}-{days[i]:02d}",
+                            purposes[i],
+                        ]
+                    )
+            logFiles.append(logFile)
+
+        # Define a function to make a PNG map ...
+        def render(logFile, flightMap):
+            fmc.run(
+                logFile,
+                 cacheDir = f"{tmpDir}/cache",
+                    debug = False,
+                flightMap = flightMap,
+                  maxYear = args.maxYear,
+                 optimise = False,
+            )
+            return flightMap
+
+        # Make the PNG maps one at a time (which also fills the on-disk
+        # caches, so that both sets of PNG maps use them in the same way) ...
+        t0 = time.perf_counter()
+        for logFile in logFiles:
+            render(logFile, logFile.replace(".csv", ".serial.png"))
+        serial = time.perf_counter() - t0                                       # [s]
+
+        # Define a function to watch the global configurations whilst the PNG
+        # maps are being made concurrently and to record the ones which
+        # change ...
+        # NOTE: The configurations are found after the PNG maps have been made
+        #       one at a time, because the dependencies (e.g., pyguymer3) may
+        #       set some of them the first time that they are used.
+        expected = configuration()
+        changed = set()
+        done = threading.Event()
+        def watch():
+            while True:
+                finished = done.is_set()
+                current = configuration()
+                changed.update(key for key in expected.keys() | current.keys() if expected.get(key) != current.get(key))
+                if finished:
+                    return
+                time.sleep(0.01)
+
+        # Make the PNG maps concurrently in a pool of threads (whilst watching
+        # the global configurations) ...
+        watcher = threading.Thread(target = watch)
+        watcher.start()
+        t0 = time.perf_counter()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers = args.threads) as pool:
+                futures = [
+                    pool.submit(render, logFile, logFile.replace(".csv", ".threaded.png"))
+                    for logFile in logFiles
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            threaded = time.perf_counter() - t0                                 # [s]
+            done.set()
+            watcher.join()
+
+        # Compare the PNG maps ...
+        nBad = 0                                                                # [#]
+        for logFile in logFiles:
+            img1 = matplotlib.image.imread(logFile.replace(".csv", ".serial.png"))
+            img2 = matplotlib.image.imread(logFile.replace(".csv", ".threaded.png"))
+            if img1.shape != img2.shape or not numpy.array_equal(img1, img2):
+                print(f"ERROR: The PNG maps of \"{logFile}\" are different.")
+                nBad += 1                                                       # [#]
+
+    # Check that the global configurations did not change whilst the PNG maps
+    # were being made concurrently ...
+    if changed:
+        print(f"ERROR: The global configuration was changed whilst the PNG maps were being made concurrently ({', '.join(sorted(changed))}).")
+        nBad += 1                                                               # [#]
+
+    # Check that the Matplotlib configuration is the same as it was before any
+    # PNG maps were made ...
+    after = dict(matplotlib.rcParams)
+    changed = sorted(key for key in before if str(before[key]) != str(after[key]))
+    if changed:
+        print(f"ERROR: The Matplotlib configuration was changed ({', '.join(changed)}).")
+        nBad += 1                                                               # [#]
+
+    # Print summary ...
+    print(f"Made {args.logs:,d} PNG maps in {serial:.3f} s one at a time and in {threaded:.3f} s with {args.threads:,d} threads; {nBad:,d} problems were found.")
+
+    # Exit with an error (if required) ...
+    if nBad > 0:
+        sys.exit(1)
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import concurrent.futures
+    import contextlib
+    import csv
+    import json
+    import os
+    import platform
+    import subprocess
+    import sys
+    import tempfile
+    import time
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    import fmc
+    from fmc.GreatCircleCache import GreatCircleCache
+
+    # **************************************************************************
+
+    # Define the stages (in the order that "fmc.run()" does them) ...
+    stages = [
+        "ingest",
+        "lookup",
+        "distance",
+        "greatCircles",
+        "countries",
+        "savefig",
+        "optimise",
+    ]
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Time each stage of making a PNG map from deterministic synthetic flight logs of several sizes and write the results as JSON.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--jobs",
+        default = 1,
+           help = "the number of worker processes to find the great circles in (the \"greatCircles\" stage calculates every great circle from scratch, therefore it costs roughly in proportion to the number of unique routes divided by the number of worker processes)",
+           type = int,
+    )
+    parser.add_argument(
+        "--max-year",
+        default = 2024,
+           dest = "maxYear",
+           help = "the last year of the synthetic flight logs",
+           type = int,
+    )
+    parser.add_argument(
+        "--output",
+        default = "benchmarks.json",
+           help = "the JSON file to write the results to",
+    )
+    parser.add_argument(
+        "--routes",
+        default = 100,
+           help = "the maximum number of unique routes in each synthetic flight log (the \"greatCircles\" stage costs roughly in proportion to this, see \"--jobs\")",
+           type = int,
+    )
+    parser.add_argument(
+        "--seed",
+        default = 0,
+           help = "the seed of the random number generator",
+           type = int,
+    )
+    parser.add_argument(
+        "--sizes",
+        default = [10, 1000, 100000, 1000000],
+           help = "the number of rows in each synthetic flight log",
+          nargs = "+",
+           type = int,
+    )
+    parser.add_argument(
+        "--stages",
+        choices = stages,
+        default = stages[:-1],
+           help = "the stages to time (\"optimise\" needs \"optipng\" and \"exiftool\"; \"countries\" and \"savefig\" need the cartopy resources to already be downloaded in order to run offline)",
+          nargs = "+",
+    )
+    parser.add_argument(
+        "--years",
+        default = 20,
+           help = "the number of years spanned by each synthetic flight log",
+           type = int,
+    )
+    parser.add_argument(
+        "--child",
+        default = None,
+           help = argparse.SUPPRESS,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Check if this is a child process ...
+    if args.child is not None:
+        # Import standard modules ...
+        import resource
+
+        # Define a function to find the CPU time of the worker processes which
+        # have exited ...
+        def worker_time():
+            usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+            return usage.ru_utime + usage.ru_stime                              # [s]
+
+        # Define a function to time a stage and to record the peak RSS after
+        # it ...
+        # NOTE: "ru_maxrss" is in kilobytes on Linux and in bytes on MacOS.
+        # NOTE: The CPU time of a worker process is only known once it has
+        #       exited, therefore a stage which uses worker processes must shut
+        #       them down before it returns for their CPU time to be recorded
+        #       (as "workerCpu", separately from the CPU time of this process,
+        #       "cpu").
+        results = {}
+        def timed(stage, func):
+            t0 = time.perf_counter()
+            c0 = time.process_time()
+            w0 = worker_time()                                                  # [s]
+            ans = func()
+            results[stage] = {
+                      "cpu" : time.process_time() - c0,                         # [s]
+                   "maxRSS" : resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                     "wall" : time.perf_counter() - t0,                         # [s]
+                "workerCpu" : worker_time() - w0,                               # [s]
+            }
+            return ans
+
+        # Load the airport database (this is not a stage of its own, as it is
+        # shared by all of the flight logs) ...
+        airports = fmc.load_airports(debug = False)
+
+        # Time the stages which do not need the plotting dependencies ...
+        log = timed(
+            "ingest",
+            lambda : fmc.read_flight_log(args.child, debug = False, maxYear = args.maxYear),
+        )
+        rows1, rows2 = timed(
+            "lookup",
+            lambda : log.rows_of_flights(airports),
+        )
+        dists = timed(
+            "distance",
+            lambda : fmc.calc_route_distances(airports, rows1, rows2),
+        )                                                                       # [m]
+
+        # Time the stages which need the plotting dependencies ...
+        if {"greatCircles", "countries", "savefig", "optimise"} & set(args.stages):
+            # Import special modules ...
+            try:
+                import cartopy
+                import cartopy.io.shapereader
+            except:
+                raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+            try:
+                import shapely
+                import shapely.geometry
+            except:
+                raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+            # Import my modules ...
+            try:
+                import pyguymer3
+                import pyguymer3.image
+            except:
+                raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+            # Define a function to find the great circles of the first flight
+            # of each unique route all at once, in the same way as
+            # "fmc.Renderer.render()" does (using a cache in memory, so that
+            # the results do not depend on previous runs) ...
+            def great_circles():
+                lo = numpy.minimum(log.iatas1, log.iatas2).astype(numpy.int64)
+                hi = numpy.maximum(log.iatas1, log.iatas2).astype(numpy.int64)
+                _, firsts = numpy.unique(lo * log.codes.size + hi, return_index = True)
+                pairs = []
+                for i in numpy.sort(firsts).tolist():
+                    iata1 = str(log.codes[log.iatas1[i]])
+                    iata2 = str(log.codes[log.iatas2[i]])
+                    pairs.append(
+                        (
+                            (iata1, *airports.coordinates_of_IATA(iata1)),
+                            (iata2, *airports.coordinates_of_IATA(iata2)),
+                        )
+                    )
+                with GreatCircleCache(":memory:") as gcCache:
+                    circles = gcCache.great_circles(
+                        pairs,
+                        debug = False,
+                         jobs = args.jobs,
+                         pool = pool,
+                    )
+                if pool is not None:
+                    pool.shutdown(wait = True)
+                return [(shapely.geometry.MultiLineString(lines), (1.0, 0.0, 0.0, 1.0)) for lines in circles]
+
+            # Define a function to load the country shapes and to find the
+            # style of each one (without using the on-disk cache, so that the
+            # results do not depend on previous runs) ...
+            def countries():
+                sfile = cartopy.io.shapereader.natural_earth(
+                      category = "cultural",
+                          name = "admin_0_countries",
+                    resolution = "10m",
+                )
+                shapes = fmc.load_countries(sfile, cache = False, debug = False)
+                visited = set(airports.countries_of_IATAs(log.codes.tolist()).tolist())
+                styles = [
+                    ((1.0, 0.0, 0.0, 0.25), (1.0, 0.0, 0.0, 0.25)) if neName in visited else ((0.0, 0.0, 0.0, 0.25), "none")
+                    for neName, _ in shapes
+                ]
+                return sfile, shapes, styles
+
+            # Time the stages ...
+            # NOTE: The pool of worker processes is created before the
+            #       "greatCircles" stage is timed but it is shut down within it,
+            #       so that the CPU time of the worker processes (including
+            #       starting them, as they are started on demand) is recorded.
+            routes = []
+            if {"greatCircles", "savefig", "optimise"} & set(args.stages):
+                with concurrent.futures.ProcessPoolExecutor(max_workers = args.jobs) if args.jobs > 1 else contextlib.nullcontext() as pool:
+                    routes = timed("greatCircles", great_circles)
+            if {"countries", "savefig", "optimise"} & set(args.stages):
+                sfile, shapes, styles = timed("countries", countries)
+            if {"savefig", "optimise"} & set(args.stages):
+                # Define a function to render the figure and save it ...
+                def savefig():
+                    fg = fmc.render_figure(
+                        ("top", "left", "right", "bottom"),
+                        businessX = [year - 0.2 for year in range(log.minYear, args.maxYear + 1)],
+                        businessY = numpy.bincount(log.years - log.minYear, weights = 1.0e-6 * dists, minlength = args.maxYear + 1 - log.minYear).tolist(),
+                        countries = shapes,
+                            debug = False,
+                          maxYear = args.maxYear,
+                          minYear = log.minYear,
+                           routes = routes,
+                           styles = styles,
+                    )
+                    fg.savefig(f"{args.child}.png", dpi = fg.dpi)
+                timed("savefig", savefig)
+            if "optimise" in args.stages:
+                timed(
+                    "optimise",
+                    lambda : pyguymer3.image.optimise_image(f"{args.child}.png", debug = False),
+                )
+
+        # Print the results (as the last line) ...
+        print(json.dumps({"rows" : len(log), "stages" : results}))
+        sys.exit(0)
+
+    # **************************************************************************
+
+    # Find the IATA codes of all of the airports ...
+    airports = fmc.load_airports(debug = False)
+    iatas = sorted(airports.iataToRow)
+
+    # Initialize the results ...
+    report = {
+            "jobs" : args.jobs,
+         "machine" : platform.machine(),
+         "maxYear" : args.maxYear,
+          "python" : platform.python_version(),
+          "routes" : args.routes,
+            "seed" : args.seed,
+           "sizes" : [],
+          "stages" : args.stages,
+        "unixTime" : time.time(),
+           "years" : args.years,
+    }
+
+    # Create a temporary directory for the synthetic flight logs ...
+    with tempfile.TemporaryDirectory() as tmpDir:
+        # Loop over sizes ...
+        for size in args.sizes:
+            # Create a deterministic set of routes and flights ...
+            # NOTE: Each route is between two different airports and the
+            #       direction of each flight along its route is random. The
+            #       flights are in date order (like a real flight log), so that
+            #       none of them are before the default minimum year.
+            rng = numpy.random.default_rng(seed = args.seed)
+            ends = rng.choice(len(iatas), size = (min(args.routes, size), 2), replace = True)
+            ends = ends[ends[:, 0] != ends[:, 1], :]
+            flights = ends[rng.integers(0, ends.shape[0], size = size), :]
+            flips = rng.random(size) < 0.5
+            flights[flips, :] = flights[flips, ::-1]
+            years = rng.integers(args.maxYear + 1 - args.years, args.maxYear + 1, size = size)
+            months = rng.integers(1, 13, size = size)
+            days = rng.integers(1, 29, size = size)
+            purposes = rng.choice(["Business", "Pleasure"], size = size)
+            order = numpy.lexsort((days, months, years))
+
+            # Write the synthetic flight log ...
+            logFile = f"{tmpDir}/{size:d}.csv"
+            with open(logFile, mode = "wt", encoding = "utf-8", newline = "") as fObj:
+                writer = csv.writer(fObj)
+                for i in order.tolist():
+                    writer.writerow(
+                        [
+                            iatas[flights[i, 0]],
+                            iatas[flights[i, 1]],
+                            f"{years[i]:04d}-{months[i]:02d}-{days[i]:02d}",
+                            purposes[i],
+                        ]
+                    )
+
+            # Time the stages in a fresh process ...
+            t0 = time.perf_counter()
+            resp = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child", logFile, "--jobs", f"{args.jobs:d}", "--max-year", f"{args.maxYear:d}", "--stages", *args.stages],
+                   check = True,
+                encoding = "utf-8",
+                     env = os.environ | {"PYTHONPATH" : os.path.dirname(os.path.dirname(os.path.abspath(__file__)))},
+                  stdout = subprocess.PIPE,
+                 timeout = 3600.0,
+            )
+            result = json.loads(resp.stdout.splitlines()[-1])
+            result["total"] = time.perf_counter() - t0                          # [s]
+            result["routes"] = int(ends.shape[0])
+            report["sizes"].append(result)
+
+            # Print summary ...
+            print(f"{size:,d} rows:")
+            for stage, timings in result["stages"].items():
+                print(f"    {stage:>12s}: {timings['wall']:9.3f} s wall, {timings['cpu']:9.3f} s CPU, peak RSS = {timings['maxRSS']:,d} (in units of \"ru_maxrss\")")
+
+    # Save the results ...
+    with open(args.output, mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            report,
+            fObj,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
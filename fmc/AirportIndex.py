@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+
+# Define class ...
+class AirportIndex:
+    """An index of airports
+
+    This class stores the airport database as columns and builds hash tables
+    which map IATA and ICAO codes on to rows of those columns, so that each
+    lookup costs O(1) rather than a walk over the whole airport list. It also
+    provides bulk lookups which take a sequence of codes and return NumPy
+    arrays.
+
+    Parameters
+    ----------
+    airports : list
+        the list of all of the airports
+
+    Notes
+    -----
+    Airports which cannot be found are reported as being at (0°,0°) in the
+    country "ERROR", just like the scalar functions always have done.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define the airports which are either missing from, or are wrong in, the
+    # airport database (the key is the code and the value is the longitude,
+    # latitude and country of the airport) ...
+    overrides = {
+        "IATA" : {
+            "TXL" : (+13.2877, +52.5597, "Germany"),                            # This airport closed on 4/May/2021.
+        },
+        "ICAO" : {
+            "EDDT" : (+13.2877, +52.5597, "Germany"),                           # This airport closed on 4/May/2021.
+        },
+    }
+
+    # Define the values returned for airports which cannot be found ...
+    default = (0.0, 0.0, "ERROR")
+
+    # Define function ...
+    def __init__(
+        self,
+        airports,
+        /,
+    ):
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # **********************************************************************
+
+        # Initialize columns and hash tables ...
+        lons = []                                                               # [°]
+        lats = []                                                               # [°]
+        countryIDs = []
+        self.countryNames = []
+        self.iataToRow = {}
+        self.icaoToRow = {}
+        countryToID = {}
+
+        # Define a function to append a row to the columns ...
+        def append(lon, lat, country):
+            if country not in countryToID:
+                countryToID[country] = len(self.countryNames)
+                self.countryNames.append(country)
+            lons.append(lon)                                                    # [°]
+            lats.append(lat)                                                    # [°]
+            countryIDs.append(countryToID[country])
+            return len(lons) - 1
+
+        # Add the default row first, so that it is always row zero ...
+        append(*self.default)
+
+        # Add the overrides (these take precedence over the airport
+        # database) ...
+        for iata, override in self.overrides["IATA"].items():
+            self.iataToRow[iata] = append(*override)
+        for icao, override in self.overrides["ICAO"].items():
+            self.icaoToRow[icao] = append(*override)
+
+        # Loop over all airports ...
+        for airport in airports:
+            # Skip this airport if it does not have any codes ...
+            # NOTE: The first airport with a given code wins, just like the
+            #       original linear scans.
+            hasIATA = "IATA" in airport and airport["IATA"] not in self.iataToRow
+            hasICAO = "ICAO" in airport and airport["ICAO"] not in self.icaoToRow
+            if not hasIATA and not hasICAO:
+                continue
+
+            # Add this airport and point its codes at it ...
+            row = append(
+                airport["lon"],
+                airport["lat"],
+                airport.get("ISO 3166-1 English Short Name", self.default[2]),
+            )
+            if hasIATA:
+                self.iataToRow[airport["IATA"]] = row
+            if hasICAO:
+                self.icaoToRow[airport["ICAO"]] = row
+
+        # Convert the columns to arrays ...
+        self.lons = numpy.array(lons, dtype = numpy.float64)                    # [°]
+        self.lats = numpy.array(lats, dtype = numpy.float64)                    # [°]
+        self.countryIDs = numpy.array(countryIDs, dtype = numpy.int32)
+        self.countryNamesArr = numpy.array(self.countryNames, dtype = object)
+
+    # Define function ...
+    @classmethod
+    def from_columns(
+        cls,
+        lons,
+        lats,
+        countryIDs,
+        countryNames,
+        iatas,
+        icaos,
+        /,
+    ):
+        """Create an index of airports from columns
+
+        Parameters
+        ----------
+        lons : numpy.ndarray
+            the longitudes of the rows (in degrees)
+        lats : numpy.ndarray
+            the latitudes of the rows (in degrees)
+        countryIDs : numpy.ndarray
+            the indices into the list of country names of the rows
+        countryNames : list of str
+            the list of country names
+        iatas : sequence of str
+            the IATA codes of the rows (an empty string means no IATA code)
+        icaos : sequence of str
+            the ICAO codes of the rows (an empty string means no ICAO code)
+
+        Returns
+        -------
+        index : fmc.AirportIndex
+            the index of airports
+
+        Notes
+        -----
+        Row zero must be the default row. The columns are not copied, so they
+        may be backed by a memory map.
+        """
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # **********************************************************************
+
+        # Create the index without walking an airport list ...
+        index = cls.__new__(cls)
+        index.lons = lons                                                       # [°]
+        index.lats = lats                                                       # [°]
+        index.countryIDs = countryIDs
+        index.countryNames = list(countryNames)
+        index.countryNamesArr = numpy.array(index.countryNames, dtype = object)
+
+        # Build the hash tables (the first row with a given code wins) ...
+        index.iataToRow = {}
+        index.icaoToRow = {}
+        for row, (iata, icao) in enumerate(zip(iatas, icaos)):
+            if iata and iata not in index.iataToRow:
+                index.iataToRow[iata] = row
+            if icao and icao not in index.icaoToRow:
+                index.icaoToRow[icao] = row
+
+        # Return answer ...
+        return index
+
+    # Define function ...
+    def to_columns(
+        self,
+    ):
+        """Convert an index of airports to columns
+
+        Returns
+        -------
+        lons : numpy.ndarray
+            the longitudes of the rows (in degrees)
+        lats : numpy.ndarray
+            the latitudes of the rows (in degrees)
+        countryIDs : numpy.ndarray
+            the indices into the list of country names of the rows
+        countryNames : list of str
+            the list of country names
+        iatas : list of str
+            the IATA codes of the rows (an empty string means no IATA code)
+        icaos : list of str
+            the ICAO codes of the rows (an empty string means no ICAO code)
+        """
+
+        # Invert the hash tables ...
+        iatas = [""] * self.lons.size
+        icaos = [""] * self.lons.size
+        for iata, row in self.iataToRow.items():
+            iatas[row] = iata
+        for icao, row in self.icaoToRow.items():
+            icaos[row] = icao
+
+        # Return answer ...
+        return self.lons, self.lats, self.countryIDs, self.countryNames, iatas, icaos
+
+    # Define function ...
+    def __len__(
+        self,
+    ):
+        return self.lons.size - 1
+
+    # Define function ...
+    def checksum(
+        self,
+    ):
+        """Find the checksum of an index of airports
+
+        Returns
+        -------
+        checksum : str
+            the SHA-256 checksum of the rows and of the codes which point at
+            them (which changes whenever the airport database changes in a way
+            which affects any lookup)
+        """
+
+        # Import standard modules ...
+        import hashlib
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # **********************************************************************
+
+        # Add the columns and the hash tables to the checksum ...
+        hashObj = hashlib.sha256()
+        hashObj.update(numpy.ascontiguousarray(self.lons, dtype = "<f8").tobytes())
+        hashObj.update(numpy.ascontiguousarray(self.lats, dtype = "<f8").tobytes())
+        hashObj.update(numpy.ascontiguousarray(self.countryIDs, dtype = "<i4").tobytes())
+        for key, value in [
+            ("countryNames", self.countryNames),
+            ("iataToRow", sorted(self.iataToRow.items())),
+            ("icaoToRow", sorted(self.icaoToRow.items())),
+        ]:
+            hashObj.update(f"{key}={value!r}".encode("utf-8"))
+
+        # Return answer ...
+        return hashObj.hexdigest()
+
+    # Define function ...
+    def rows_of_IATAs(
+        self,
+        iatas,
+        /,
+    ):
+        """Find the rows of many airports
+
+        Parameters
+        ----------
+        iatas : sequence of str
+            the IATA codes of the desired airports
+
+        Returns
+        -------
+        rows : numpy.ndarray
+            the rows of the airports (row zero is returned for airports which
+            cannot be found)
+        """
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # **********************************************************************
+
+        # Return answer ...
+        return numpy.fromiter(
+            (self.iataToRow.get(iata, 0) for iata in iatas),
+            dtype = numpy.int64,
+        )
+
+    # Define function ...
+    def rows_of_ICAOs(
+        self,
+        icaos,
+        /,
+    ):
+        """Find the rows of many airports
+
+        Parameters
+        ----------
+        icaos : sequence of str
+            the ICAO codes of the desired airports
+
+        Returns
+        -------
+        rows : numpy.ndarray
+            the rows of the airports (row zero is returned for airports which
+            cannot be found)
+        """
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # **********************************************************************
+
+        # Return answer ...
+        return numpy.fromiter(
+            (self.icaoToRow.get(icao, 0) for icao in icaos),
+            dtype = numpy.int64,
+        )
+
+    # Define function ...
+    def coordinates_of_IATA(
+        self,
+        iata,
+        /,
+    ):
+        """Find the longitude and latitude of an airport
+
+        Parameters
+        ----------
+        iata : str
+            the IATA code of the desired airport
+
+        Returns
+        -------
+        lon : float
+            the longitude of the airport (in degrees)
+        lat : float
+            the latitude of the airport (in degrees)
+        """
+
+        # Return answer ...
+        row = self.iataToRow.get(iata, 0)
+        return float(self.lons[row]), float(self.lats[row])
+
+    # Define function ...
+    def coordinates_of_ICAO(
+        self,
+        icao,
+        /,
+    ):
+        """Find the longitude and latitude of an airport
+
+        Parameters
+        ----------
+        icao : str
+            the ICAO code of the desired airport
+
+        Returns
+        -------
+        lon : float
+            the longitude of the airport (in degrees)
+        lat : float
+            the latitude of the airport (in degrees)
+        """
+
+        # Return answer ...
+        row = self.icaoToRow.get(icao, 0)
+        return float(self.lons[row]), float(self.lats[row])
+
+    # Define function ...
+    def country_of_IATA(
+        self,
+        iata,
+        /,
+    ):
+        """Find the country of an airport
+
+        Parameters
+        ----------
+        iata : str
+            the IATA code of the desired airport
+
+        Returns
+        -------
+        country : str
+            the country of the airport
+        """
+
+        # Return answer ...
+        return self.countryNames[self.countryIDs[self.iataToRow.get(iata, 0)]]
+
+    # Define function ...
+    def country_of_ICAO(
+        self,
+        icao,
+        /,
+    ):
+        """Find the country of an airport
+
+        Parameters
+        ----------
+        icao : str
+            the ICAO code of the desired airport
+
+        Returns
+        -------
+        country : str
+            the country of the airport
+        """
+
+        # Return answer ...
+        return self.countryNames[self.countryIDs[self.icaoToRow.get(icao, 0)]]
+
+    # Define function ...
+    def coordinates_of_IATAs(
+        self,
+        iatas,
+        /,
+    ):
+        """Find the longitudes and latitudes of many airports
+
+        Parameters
+        ----------
+        iatas : sequence of str
+            the IATA codes of the desired airports
+
+        Returns
+        -------
+        lons : numpy.ndarray
+            the longitudes of the airports (in degrees)
+        lats : numpy.ndarray
+            the latitudes of the airports (in degrees)
+        """
+
+        # Return answer ...
+        rows = self.rows_of_IATAs(iatas)
+        return self.lons[rows], self.lats[rows]
+
+    # Define function ...
+    def coordinates_of_ICAOs(
+        self,
+        icaos,
+        /,
+    ):
+        """Find the longitudes and latitudes of many airports
+
+        Parameters
+        ----------
+        icaos : sequence of str
+            the ICAO codes of the desired airports
+
+        Returns
+        -------
+        lons : numpy.ndarray
+            the longitudes of the airports (in degrees)
+        lats : numpy.ndarray
+            the latitudes of the airports (in degrees)
+        """
+
+        # Return answer ...
+        rows = self.rows_of_ICAOs(icaos)
+        return self.lons[rows], self.lats[rows]
+
+    # Define function ...
+    def countries_of_IATAs(
+        self,
+        iatas,
+        /,
+    ):
+        """Find the countries of many airports
+
+        Parameters
+        ----------
+        iatas : sequence of str
+            the IATA codes of the desired airports
+
+        Returns
+        -------
+        countries : numpy.ndarray
+            the countries of the airports
+        """
+
+        # Return answer ...
+        return self.countryNamesArr[self.countryIDs[self.rows_of_IATAs(iatas)]]
+
+    # Define function ...
+    def countries_of_ICAOs(
+        self,
+        icaos,
+        /,
+    ):
+        """Find the countries of many airports
+
+        Parameters
+        ----------
+        icaos : sequence of str
+            the ICAO codes of the desired airports
+
+        Returns
+        -------
+        countries : numpy.ndarray
+            the countries of the airports
+        """
+
+        # Return answer ...
+        return self.countryNamesArr[self.countryIDs[self.rows_of_ICAOs(icaos)]]
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+# Define class ...
+class FlightLog:
+    """A parsed flight log
+
+    This class stores the (validated) flights of a flight log as compact
+    columns: the IATA codes are interned (each flight stores two indices into a
+    table of unique codes), the dates are stored as year, month and day
+    integers and the purpose is stored as an enumeration (see
+    :attr:`purposeNames`).
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        the unique IATA codes
+    iatas1 : numpy.ndarray
+        the indices (into ``codes``) of the departure airports of the flights
+    iatas2 : numpy.ndarray
+        the indices (into ``codes``) of the arrival airports of the flights
+    years : numpy.ndarray
+        the years of the flights
+    months : numpy.ndarray
+        the months of the flights
+    days : numpy.ndarray
+        the days of the flights
+    purposes : numpy.ndarray
+        the purposes of the flights (as indices into :attr:`purposeNames`)
+    maxYear : int, optional
+        the maximum year of the survey
+    minYear : int, optional
+        the minimum year of the survey
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define the names of the purposes (any purpose which is not recognised is
+    # stored as the first one) ...
+    purposeNames = ("other", "business", "pleasure")
+
+    # Define function ...
+    def __init__(
+        self,
+        codes,
+        iatas1,
+        iatas2,
+        years,
+        months,
+        days,
+        purposes,
+        /,
+        *,
+        maxYear = None,
+        minYear = None,
+    ):
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # **********************************************************************
+
+        # Store the columns ...
+        self.codes = numpy.asarray(codes, dtype = "<U3")
+        self.iatas1 = numpy.asarray(iatas1, dtype = numpy.int32)
+        self.iatas2 = numpy.asarray(iatas2, dtype = numpy.int32)
+        self.years = numpy.asarray(years, dtype = numpy.int16)
+        self.months = numpy.asarray(months, dtype = numpy.int8)
+        self.days = numpy.asarray(days, dtype = numpy.int8)
+        self.purposes = numpy.asarray(purposes, dtype = numpy.int8)
+        self.maxYear = maxYear
+        self.minYear = minYear
+
+    # Define function ...
+    @classmethod
+    def concatenate(
+        cls,
+        chunks,
+        /,
+    ):
+        """Join the chunks of a flight log together
+
+        Parameters
+        ----------
+        chunks : list of fmc.FlightLog
+            the chunks (in order), as yielded by :func:`fmc.iter_flight_log`
+
+        Returns
+        -------
+        log : fmc.FlightLog
+            the whole flight log
+        """
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # **********************************************************************
+
+        # Check that there are some chunks ...
+        if len(chunks) == 0:
+            return cls([], [], [], [], [], [], [])
+
+        # Return answer ...
+        # NOTE: The table of codes only ever grows, therefore the table of the
+        #       last chunk is valid for all of them.
+        return cls(
+            chunks[-1].codes,
+            numpy.concatenate([chunk.iatas1 for chunk in chunks]),
+            numpy.concatenate([chunk.iatas2 for chunk in chunks]),
+            numpy.concatenate([chunk.years for chunk in chunks]),
+            numpy.concatenate([chunk.months for chunk in chunks]),
+            numpy.concatenate([chunk.days for chunk in chunks]),
+            numpy.concatenate([chunk.purposes for chunk in chunks]),
+            maxYear = chunks[-1].maxYear,
+            minYear = chunks[-1].minYear,
+        )
+
+    # Define function ...
+    def __len__(
+        self,
+    ):
+        return self.years.size
+
+    # Define function ...
+    def rows_of_flights(
+        self,
+        airports,
+        /,
+    ):
+        """Find the rows of the airports of the flights
+
+        Parameters
+        ----------
+        airports : fmc.AirportIndex
+            the index of the airports
+
+        Returns
+        -------
+        rows1 : numpy.ndarray
+            the rows of the departure airports of the flights
+        rows2 : numpy.ndarray
+            the rows of the arrival airports of the flights
+        """
+
+        # Look up each unique code once ...
+        rows = airports.rows_of_IATAs(self.codes.tolist())
+
+        # Return answer ...
+        return rows[self.iatas1], rows[self.iatas2]
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+# Define class ...
+class FlightState:
+    """The persisted aggregate state of a flight log
+
+    This class holds everything about a flight log that a PNG map needs (the
+    distances flown each year for each purpose, the unique routes and the
+    visited countries) along with how many bytes of the flight log have been
+    processed and a checksum of them. Flight logs only ever grow at the end,
+    therefore the state can be saved next to the flight log and then only the
+    rows which have been appended since it was saved need to be added to it
+    (see :func:`fmc.update_flight_state`).
+
+    Parameters
+    ----------
+    settings : tuple
+        the settings which the state depends on (the state is rebuilt from
+        scratch if they change)
+
+    Attributes
+    ----------
+    checksum : str
+        the SHA-256 checksum of the bytes of the flight log which have been
+        processed
+    countries : dict of int
+        the purpose (as an index into :attr:`fmc.FlightLog.purposeNames`) of
+        the first route to each country which has been flown to (in the order
+        that they were first flown to)
+    dists : dict of int
+        the distance flown (in millimetres), keyed by the year and by the
+        purpose (as an index into :attr:`fmc.FlightLog.purposeNames`)
+    flights : int
+        the number of flights
+    minYear : int, None
+        the minimum year of the survey (or None if it has not been found yet)
+    offset : int
+        the number of bytes of the flight log which have been processed
+    routes : dict of int
+        the purpose (as an index into :attr:`fmc.FlightLog.purposeNames`) of
+        the first flight along each unique route, keyed by the IATA codes of
+        the route (in alphabetical order and in the order that they were first
+        flown)
+    settings : tuple
+        the settings which the state depends on
+
+    Notes
+    -----
+    The distance of each flight is rounded to the nearest millimetre before it
+    is added, so that the sums are exact integers and the state of a flight log
+    which has been updated many times is identical to the state of the same
+    flight log which has been processed in one go.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define the version of the state (which must be incremented whenever what
+    # is saved in it changes) ...
+    version = 1
+
+    # Define function ...
+    def __init__(
+        self,
+        settings,
+        /,
+    ):
+        # Initialize state ...
+        self.checksum = None
+        self.countries = {}
+        self.dists = {}
+        self.flights = 0                                                        # [#]
+        self.minYear = None
+        self.offset = 0                                                         # [B]
+        self.routes = {}
+        self.settings = settings
+
+    # Define function ...
+    def add(
+        self,
+        log,
+        airports,
+        /,
+        *,
+          eps = 1.0e-12,
+        nIter = 100,
+    ):
+        """Add the flights of (a chunk of) a flight log to the state
+
+        Parameters
+        ----------
+        log : fmc.FlightLog
+            the flights (which must follow all of the flights which have
+            already been added)
+        airports : fmc.AirportIndex
+            the index of the airports
+        eps : float, optional
+            the tolerance of the Vincenty formula iterations
+        nIter : int, optional
+            the maximum number of iterations (particularly the Vincenty formula)
+        """
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # Import sub-functions ...
+        from .calc_route_distances import calc_route_distances
+
+        # **********************************************************************
+
+        # Set the minimum year of the survey (if required) ...
+        if self.minYear is None:
+            self.minYear = log.minYear
+
+        # Check that there are some flights ...
+        if len(log) == 0:
+            return
+        self.flights += len(log)                                                # [#]
+
+        # Find the distances of all of the flights at once (rounded to the
+        # nearest millimetre) ...
+        rows1, rows2 = log.rows_of_flights(airports)
+        dists = numpy.round(
+            1000.0 * calc_route_distances(
+                airports,
+                rows1,
+                rows2,
+                  eps = eps,
+                nIter = nIter,
+            )
+        )                                                                       # [mm]
+
+        # Add the distances flown each year for each purpose ...
+        # NOTE: The sums are of whole numbers of millimetres which are far
+        #       smaller than 2^53, therefore they are exact.
+        keys, inverse = numpy.unique(
+            log.years.astype(numpy.int64) * 256 + log.purposes.astype(numpy.int64),
+            return_inverse = True,
+        )
+        sums = numpy.bincount(inverse.ravel(), weights = dists)                 # [mm]
+        for key, total in zip(keys.tolist(), sums.tolist(), strict = True):
+            key = divmod(key, 256)
+            self.dists[key] = self.dists.get(key, 0) + round(total)             # [mm]
+
+        # Find the first flight of each unique route ...
+        codes = log.codes.tolist()
+        lo = numpy.minimum(log.iatas1, log.iatas2).astype(numpy.int64)
+        hi = numpy.maximum(log.iatas1, log.iatas2).astype(numpy.int64)
+        _, firsts = numpy.unique(
+            lo * len(codes) + hi,
+            return_index = True,
+        )
+        firsts.sort()
+
+        # Loop over the first flight of each unique route ...
+        for i in firsts.tolist():
+            # Skip this route if it has already been flown ...
+            iata1 = codes[log.iatas1[i]]
+            iata2 = codes[log.iatas2[i]]
+            key = (min(iata1, iata2), max(iata1, iata2))
+            if key in self.routes:
+                continue
+
+            # Save the purpose of the first flight along this route and along
+            # the first route to each country ...
+            purpose = int(log.purposes[i])
+            self.routes[key] = purpose
+            self.countries.setdefault(airports.country_of_IATA(iata1), purpose)
+            self.countries.setdefault(airports.country_of_IATA(iata2), purpose)
+
+    # Define function ...
+    @classmethod
+    def load(
+        cls,
+        sfile,
+        /,
+        *,
+        debug = __debug__,
+    ):
+        """Load a state from a file
+
+        Parameters
+        ----------
+        sfile : str
+            the file
+        debug : bool, optional
+            print debug messages
+
+        Returns
+        -------
+        state : fmc.FlightState, None
+            the state (or None if the file does not exist, if it cannot be read
+            or if it is from a different version)
+        """
+
+        # Import standard modules ...
+        import os
+        import pickle
+
+        # **********************************************************************
+
+        # Check that the file exists ...
+        if not os.path.exists(sfile):
+            return None
+
+        # Load the state (treating a file which cannot be read as though it
+        # does not exist, so that it is just rebuilt) ...
+        if debug:
+            print(f"DEBUG: Loading the state of the flight log from \"{sfile}\".")
+        try:
+            with open(sfile, mode = "rb") as fObj:
+                version, state = pickle.load(fObj)
+        except Exception as err:
+            if debug:
+                print(f"DEBUG: The state of the flight log could not be loaded ({err}).")
+            return None
+
+        # Check that the state is from this version ...
+        if version != cls.version or not isinstance(state, cls):
+            if debug:
+                print(f"DEBUG: The state of the flight log is from a different version ({version}).")
+            return None
+
+        # Return answer ...
+        return state
+
+    # Define function ...
+    def save(
+        self,
+        sfile,
+        /,
+        *,
+        debug = __debug__,
+    ):
+        """Save the state to a file
+
+        Parameters
+        ----------
+        sfile : str
+            the file
+        debug : bool, optional
+            print debug messages
+        """
+
+        # Import standard modules ...
+        import os
+        import pickle
+        import tempfile
+
+        # **********************************************************************
+
+        # Save the state (atomically, so that a concurrent reader never sees a
+        # partially written file) ...
+        if debug:
+            print(f"DEBUG: Saving the state of the flight log to \"{sfile}\".")
+        with tempfile.NamedTemporaryFile(
+              mode = "wb",
+            delete = False,
+               dir = os.path.dirname(os.path.abspath(sfile)),
+            prefix = ".",
+            suffix = ".tmp",
+        ) as fObj:
+            try:
+                pickle.dump(
+                    (FlightState.version, self),
+                    fObj,
+                )
+            except:
+                os.remove(fObj.name)
+                raise
+        try:
+            os.replace(fObj.name, sfile)
+        except:
+            os.remove(fObj.name)
+            raise
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+
+# Define class ...
+class FlightTally:
+    """The mergeable statistics of (part of) a flight log
+
+    This class counts the flights of (part of) a flight log by their unordered
+    route, by their year and by their purpose, along with the year of the
+    first valid flight and the number of rows read and skipped. Counting the
+    flights is all that has to be done row by row and counts add up exactly,
+    therefore the tallies of the shards of a flight log can be made in
+    parallel and then merged (in the order of the shards) to give exactly the
+    same tally as the whole flight log. The distances and the countries are
+    only found once, from the merged tally (see :meth:`summary`).
+
+    Attributes
+    ----------
+    counts : dict of int
+        the number of flights, keyed by the IATA codes of the route (in
+        alphabetical order), by the year and by the purpose (as an index into
+        :attr:`fmc.FlightLog.purposeNames`)
+    firstYear : int, None
+        the year of the first valid flight (or None if there are not any)
+    stats : fmc.RunStats
+        the number of rows read and skipped (the rows which are outside of the
+        survey are only counted by :meth:`summary`)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define function ...
+    def __init__(
+        self,
+        /,
+    ):
+        # Import sub-functions ...
+        from .RunStats import RunStats
+
+        # **********************************************************************
+
+        # Initialize tally ...
+        self.counts = {}
+        self.firstYear = None
+        self.stats = RunStats()
+
+    # Define function ...
+    def add(
+        self,
+        log,
+        /,
+    ):
+        """Add the flights of (a chunk of) a flight log to the tally
+
+        Parameters
+        ----------
+        log : fmc.FlightLog
+            the flights (which must follow all of the flights which have
+            already been added)
+        """
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # **********************************************************************
+
+        # Check that there are some flights ...
+        if len(log) == 0:
+            return
+
+        # Set the year of the first valid flight (if required) ...
+        if self.firstYear is None:
+            self.firstYear = int(log.years[0])
+
+        # Count the flights of each unordered route, year and purpose at
+        # once ...
+        nCodes = log.codes.size
+        lo = numpy.minimum(log.iatas1, log.iatas2).astype(numpy.int64)
+        hi = numpy.maximum(log.iatas1, log.iatas2).astype(numpy.int64)
+        keys, counts = numpy.unique(
+            ((lo * nCodes + hi) * 10000 + log.years.astype(numpy.int64)) * 256 + log.purposes.astype(numpy.int64),
+            return_counts = True,
+        )
+
+        # Add the counts to the tally ...
+        codes = log.codes.tolist()
+        for key, count in zip(keys.tolist(), counts.tolist(), strict = True):
+            route, purpose = divmod(key, 256)
+            route, year = divmod(route, 10000)
+            iata1, iata2 = sorted(
+                [
+                    codes[route // nCodes],
+                    codes[route % nCodes],
+                ]
+            )
+            key = (iata1, iata2, year, purpose)
+            self.counts[key] = self.counts.get(key, 0) + count                  # [#]
+
+    # Define function ...
+    def merge(
+        self,
+        other,
+        /,
+    ):
+        """Merge the tally of the next part of the flight log into this tally
+
+        Parameters
+        ----------
+        other : fmc.FlightTally
+            the tally of the part of the flight log which follows this one
+        """
+
+        # Merge the counts ...
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count                  # [#]
+
+        # Merge the year of the first valid flight ...
+        if self.firstYear is None:
+            self.firstYear = other.firstYear
+
+        # Merge the number of rows read and skipped ...
+        self.stats.rowsRead += other.stats.rowsRead                             # [#]
+        for reason, count in other.stats.rowsSkipped.items():
+            self.stats.rowsSkipped[reason] += count                             # [#]
+
+    # Define function ...
+    def summary(
+        self,
+        airports,
+        /,
+        *,
+                   eps = 1.0e-12,
+        extraCountries = None,
+               maxYear = None,
+               minYear = None,
+                 nIter = 100,
+            notVisited = None,
+               renames = None,
+    ):
+        """Summarise the tally
+
+        Parameters
+        ----------
+        airports : fmc.AirportIndex
+            the index of the airports
+        eps : float, optional
+            the tolerance of the Vincenty formula iterations
+        extraCountries : list of str, optional
+            a list of extra countries that you have visited but which you have
+            not flown to (e.g., you took a train)
+        maxYear : int, optional
+            the maximum year to use for the survey (defaults to this year)
+        minYear : int, optional
+            the minimum year to use for the survey (defaults to the year of the
+            first valid flight)
+        nIter : int, optional
+            the maximum number of iterations (particularly the Vincenty formula)
+        notVisited : list of str, optional
+            a list of countries which you have flown to but not visited (e.g.,
+            you just transferred planes)
+        renames : dict, optional
+            a mapping from OpenFlights country names to other country names
+            (e.g., Natural Earth country names)
+
+        Returns
+        -------
+        summary : dict
+            the summary (which can be serialised as JSON): the sorted list of
+            visited "countries", the number of "flights", the "maxYear" and the
+            "minYear" of the survey, the number of "rowsRead" and
+            "rowsSkipped", the "totalDist" (in kilometres), the number of
+            "uniqueRoutes" and the "yearlyDists" of each purpose (in
+            kilometres, from "minYear" to "maxYear")
+
+        Notes
+        -----
+        The counts are reduced in a canonical order, therefore the summary of
+        a merged tally is identical to the summary of the tally of the whole
+        flight log. The distances agree with those of :func:`fmc.run` to within
+        the rounding of the floating-point sums.
+        """
+
+        # Import standard modules ...
+        import datetime
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+        # Import sub-functions ...
+        from .FlightLog import FlightLog
+        from .calc_route_distances import calc_route_distances
+
+        # **********************************************************************
+
+        # Populate default values ...
+        if extraCountries is None:
+            extraCountries = []
+        if maxYear is None:
+            maxYear = datetime.datetime.now(tz = datetime.UTC).year
+        if minYear is None:
+            minYear = maxYear if self.firstYear is None else self.firstYear
+        if notVisited is None:
+            notVisited = []
+        if renames is None:
+            renames = {}
+
+        # Find the counts in a canonical order and skip the ones which are
+        # outside of the survey ...
+        rowsSkipped = dict(self.stats.rowsSkipped)
+        iatas1, iatas2, years, purposes, counts = [], [], [], [], []
+        for (iata1, iata2, year, purpose), count in sorted(self.counts.items()):
+            if year < minYear:
+                rowsSkipped["beforeMinYear"] += count                           # [#]
+                continue
+            if year > maxYear:
+                rowsSkipped["afterMaxYear"] += count                            # [#]
+                continue
+            iatas1.append(iata1)
+            iatas2.append(iata2)
+            years.append(year)
+            purposes.append(purpose)
+            counts.append(count)
+        years = numpy.array(years, dtype = numpy.int64)
+        purposes = numpy.array(purposes, dtype = numpy.int64)
+        counts = numpy.array(counts, dtype = numpy.int64)                       # [#]
+
+        # Find the distance of each count ...
+        dists = calc_route_distances(
+            airports,
+            airports.rows_of_IATAs(iatas1),
+            airports.rows_of_IATAs(iatas2),
+              eps = eps,
+            nIter = nIter,
+        )                                                                       # [m]
+
+        # Find the distances flown each year for each purpose ...
+        yearlyDists = {}
+        for i, purposeName in enumerate(FlightLog.purposeNames):
+            yearlyDists[purposeName] = numpy.bincount(
+                years[purposes == i] - minYear,
+                  weights = 0.001 * dists[purposes == i] * counts[purposes == i],
+                minlength = maxYear + 1 - minYear,
+            ).tolist()                                                          # [km]
+
+        # Find the countries that have been visited ...
+        countries = set(extraCountries)
+        countries.update(airports.countries_of_IATAs(sorted(set(iatas1) | set(iatas2))).tolist())
+        countries = {renames.get(country, country) for country in countries} - set(notVisited)
+
+        # Return answer ...
+        return {
+               "countries" : sorted(countries),
+                 "flights" : int(counts.sum()),
+                 "maxYear" : maxYear,
+                 "minYear" : minYear,
+                "rowsRead" : self.stats.rowsRead,
+             "rowsSkipped" : rowsSkipped,
+               "totalDist" : float((0.001 * dists * counts).sum()),             # [km]
+            "uniqueRoutes" : len(set(zip(iatas1, iatas2))),
+             "yearlyDists" : yearlyDists,
+        }
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+
+# Define class ...
+class GreatCircleCache:
+    """A persistent cache of great circles
+
+    This class stores the lines of the great circles between pairs of airports
+    as WKB in a single SQLite database, so that a re-render of a flight log
+    only has to calculate the great circles of the routes which it has not seen
+    before. The key of each great circle is a hash of the unordered pair of
+    airports (including their coordinates) and of all of the parameters which
+    affect the calculation of it. The least recently used great circles are
+    evicted when the total size of the cache exceeds the limit.
+
+    Parameters
+    ----------
+    dbFile : str
+        the SQLite database (":memory:" creates a cache which only lasts as
+        long as this object)
+    maxSize : int, optional
+        the maximum total size of the WKB in the cache (in bytes)
+
+    Attributes
+    ----------
+    evictions : int
+        the number of great circles evicted from the cache
+    hits : int
+        the number of great circles found in the cache
+    misses : int
+        the number of great circles not found in the cache
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define function ...
+    def __init__(
+        self,
+        dbFile,
+        /,
+        *,
+        maxSize = 256 * 1024 * 1024,
+    ):
+        # Import standard modules ...
+        import os
+        import sqlite3
+
+        # **********************************************************************
+
+        # Make sure that the directory exists ...
+        if dbFile != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(dbFile)), exist_ok = True)
+
+        # Open database ...
+        # NOTE: Write-ahead logging allows many processes to read the cache
+        #       whilst one of them is writing to it.
+        self.conn = sqlite3.connect(dbFile, timeout = 60.0)
+        if dbFile != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS circles (key TEXT PRIMARY KEY, wkb BLOB NOT NULL, size INTEGER NOT NULL, atime INTEGER NOT NULL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS circles_atime ON circles (atime)")
+        self.conn.commit()
+
+        # Initialize counters ...
+        self.evictions = 0                                                      # [#]
+        self.hits = 0                                                           # [#]
+        self.maxSize = maxSize                                                  # [B]
+        self.misses = 0                                                         # [#]
+
+    # Define function ...
+    def __enter__(
+        self,
+    ):
+        return self
+
+    # Define function ...
+    def __exit__(
+        self,
+        exc_type,
+        exc_value,
+        traceback,
+    ):
+        self.close()
+
+    # Define function ...
+    def close(
+        self,
+    ):
+        """Close the cache"""
+
+        # Close database ...
+        self.conn.close()
+
+    # Define function ...
+    @staticmethod
+    def key(
+        loc1,
+        loc2,
+        /,
+        *,
+              eps = 1.0e-12,
+          maxdist = 12.0 * 1852.0,
+            nIter = 100,
+        onlyValid = True,
+              tol = 1.0e-10,
+    ):
+        """Create the key of a great circle
+
+        Parameters
+        ----------
+        loc1 : tuple of str, float, float
+            the code, the longitude (in degrees) and the latitude (in degrees)
+            of the first airport
+        loc2 : tuple of str, float, float
+            the code, the longitude (in degrees) and the latitude (in degrees)
+            of the second airport
+        eps : float, optional
+            the tolerance of the Vincenty formula iterations
+        maxdist : float, optional
+            the maximum distance between points along the great circle (in
+            metres)
+        nIter : int, optional
+            the maximum number of iterations (particularly the Vincenty formula)
+        onlyValid : bool, optional
+            only return valid LineStrings
+        tol : float, optional
+            the Euclidean distance that defines two points as being the same (in
+            degrees)
+
+        Returns
+        -------
+        key : str
+            the key of the great circle
+        """
+
+        # Import standard modules ...
+        import hashlib
+
+        # **********************************************************************
+
+        # Create a canonical string of everything which affects the great
+        # circle (using the exact hexadecimal representation of the floats) ...
+        loc1, loc2 = sorted([loc1, loc2])
+        parts = [
+            loc1[0], float(loc1[1]).hex(), float(loc1[2]).hex(),
+            loc2[0], float(loc2[1]).hex(), float(loc2[2]).hex(),
+            float(eps).hex(),
+            float(maxdist).hex(),
+            f"{nIter:d}",
+            f"{onlyValid!r}",
+            float(tol).hex(),
+        ]
+
+        # Return answer ...
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    # Define function ...
+    def get(
+        self,
+        key,
+        /,
+    ):
+        """Get a great circle from the cache
+
+        Parameters
+        ----------
+        key : str
+            the key of the great circle
+
+        Returns
+        -------
+        lines : list of shapely.geometry.linestring.LineString, None
+            the lines of the great circle (or None if it is not in the cache)
+        """
+
+        # Return answer ...
+        return self.get_many([key]).get(key)
+
+    # Define function ...
+    def get_many(
+        self,
+        keys,
+        /,
+    ):
+        """Get many great circles from the cache
+
+        Parameters
+        ----------
+        keys : list of str
+            the keys of the great circles
+
+        Returns
+        -------
+        found : dict
+            the lines of each great circle which is in the cache, keyed by the
+            key of the great circle
+        """
+
+        # Import standard modules ...
+        import time
+
+        # Import special modules ...
+        try:
+            import shapely
+        except:
+            raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+        # **********************************************************************
+
+        # Find the great circles (in chunks, so that each query has fewer
+        # parameters than SQLite allows) ...
+        found = {}
+        keys = list(dict.fromkeys(keys))
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, wkb FROM circles WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            for key, wkb in rows:
+                found[key] = list(shapely.from_wkb(wkb).geoms)
+        self.hits += len(found)                                                 # [#]
+        self.misses += len(keys) - len(found)                                   # [#]
+
+        # Mark them as recently used ...
+        if found:
+            atime = time.time_ns()
+            self.conn.executemany(
+                "UPDATE circles SET atime = ? WHERE key = ?",
+                [(atime, key) for key in found],
+            )
+            self.conn.commit()
+
+        # Return answer ...
+        return found
+
+    # Define function ...
+    def put(
+        self,
+        key,
+        lines,
+        /,
+    ):
+        """Put a great circle in the cache
+
+        Parameters
+        ----------
+        key : str
+            the key of the great circle
+        lines : list of shapely.geometry.linestring.LineString
+            the lines of the great circle
+        """
+
+        # Import special modules ...
+        try:
+            import shapely
+            import shapely.geometry
+        except:
+            raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+        # **********************************************************************
+
+        # Save the great circle ...
+        self.put_many([(key, shapely.to_wkb(shapely.geometry.MultiLineString(lines)))])
+
+    # Define function ...
+    def put_many(
+        self,
+        items,
+        /,
+    ):
+        """Put many great circles in the cache
+
+        Parameters
+        ----------
+        items : list of tuple of str, bytes
+            the key and the WKB of the lines of each great circle (as returned
+            by :func:`fmc.calc_great_circles`)
+        """
+
+        # Import standard modules ...
+        import time
+
+        # **********************************************************************
+
+        # Save the great circles (in one transaction) ...
+        atime = time.time_ns()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO circles (key, wkb, size, atime) VALUES (?, ?, ?, ?)",
+            [(key, wkb, len(wkb), atime) for key, wkb in items],
+        )
+
+        # Evict the least recently used great circles until the cache is small
+        # enough ...
+        total, = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM circles").fetchone()   # [B]
+        while total > self.maxSize:
+            oldKey, oldSize = self.conn.execute("SELECT key, size FROM circles ORDER BY atime LIMIT 1").fetchone()
+            self.conn.execute("DELETE FROM circles WHERE key = ?", (oldKey,))
+            self.evictions += 1                                                 # [#]
+            total -= oldSize                                                    # [B]
+        self.conn.commit()
+
+    # Define function ...
+    def great_circle(
+        self,
+        loc1,
+        loc2,
+        /,
+        *,
+            debug = __debug__,
+              eps = 1.0e-12,
+          maxdist = 12.0 * 1852.0,
+            nIter = 100,
+        onlyValid = True,
+              tol = 1.0e-10,
+    ):
+        """Find the great circle between two airports
+
+        This method returns the great circle from the cache, if it is in there,
+        otherwise it calculates it and puts it in the cache.
+
+        Parameters
+        ----------
+        loc1 : tuple of str, float, float
+            the code, the longitude (in degrees) and the latitude (in degrees)
+            of the first airport
+        loc2 : tuple of str, float, float
+            the code, the longitude (in degrees) and the latitude (in degrees)
+            of the second airport
+        debug : bool, optional
+            print debug messages
+        eps : float, optional
+            the tolerance of the Vincenty formula iterations
+        maxdist : float, optional
+            the maximum distance between points along the great circle (in
+            metres)
+        nIter : int, optional
+            the maximum number of iterations (particularly the Vincenty formula)
+        onlyValid : bool, optional
+            only return valid LineStrings
+        tol : float, optional
+            the Euclidean distance that defines two points as being the same (in
+            degrees)
+
+        Returns
+        -------
+        lines : list of shapely.geometry.linestring.LineString
+            the lines of the great circle
+
+        Notes
+        -----
+        The great circle is always calculated from the airport with the lowest
+        code to the airport with the highest code, so that it does not depend
+        on the direction of the flight.
+        """
+
+        # Return answer ...
+        return self.great_circles(
+            [(loc1, loc2)],
+                debug = debug,
+                  eps = eps,
+              maxdist = maxdist,
+                nIter = nIter,
+            onlyValid = onlyValid,
+                  tol = tol,
+        )[0]
+
+    # Define function ...
+    def great_circles(
+        self,
+        pairs,
+        /,
+        *,
+            debug = __debug__,
+              eps = 1.0e-12,
+             jobs = 1,
+          maxdist = 12.0 * 1852.0,
+            nIter = 100,
+        onlyValid = True,
+             pool = None,
+              tol = 1.0e-10,
+    ):
+        """Find the great circles between many pairs of airports
+
+        This method returns the great circles which are in the cache and then
+        calculates all of the ones which are not (in a pool of worker
+        processes, if one is given) and puts them in the cache.
+
+        Parameters
+        ----------
+        pairs : list of tuple of tuple of str, float, float
+            the code, the longitude (in degrees) and the latitude (in degrees)
+            of the first airport and of the second airport of each pair
+        debug : bool, optional
+            print debug messages
+        eps : float, optional
+            the tolerance of the Vincenty formula iterations
+        jobs : int, optional
+            the number of worker processes in the pool
+        maxdist : float, optional
+            the maximum distance between points along the great circle (in
+            metres)
+        nIter : int, optional
+            the maximum number of iterations (particularly the Vincenty formula)
+        onlyValid : bool, optional
+            only return valid LineStrings
+        pool : concurrent.futures.Executor, optional
+            the pool of worker processes to calculate the great circles which
+            are not in the cache in
+        tol : float, optional
+            the Euclidean distance that defines two points as being the same (in
+            degrees)
+
+        Returns
+        -------
+        circles : list of list of shapely.geometry.linestring.LineString
+            the lines of each great circle (in the same order)
+
+        Notes
+        -----
+        The great circles which are calculated are always converted to and from
+        WKB, whether or not a pool of worker processes is given, therefore the
+        answer does not depend on the number of worker processes (or on
+        whether the great circles were already in the cache).
+        """
+
+        # Import standard modules ...
+        import functools
+        import math
+
+        # Import special modules ...
+        try:
+            import shapely
+        except:
+            raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+        # Import sub-functions ...
+        from .calc_great_circles import calc_great_circles
+
+        # **********************************************************************
+
+        # Find the great circles which are in the cache ...
+        keys = [
+            self.key(
+                loc1,
+                loc2,
+                      eps = eps,
+                  maxdist = maxdist,
+                    nIter = nIter,
+                onlyValid = onlyValid,
+                      tol = tol,
+            )
+            for loc1, loc2 in pairs
+        ]
+        found = self.get_many(keys)
+
+        # Find the unique great circles which are not in the cache ...
+        missing = {}
+        for key, pair in zip(keys, pairs, strict = True):
+            if key not in found:
+                missing.setdefault(key, pair)
+
+        # Check if there are any great circles to calculate ...
+        if missing:
+            # Create a function to calculate a chunk of the great circles ...
+            func = functools.partial(
+                calc_great_circles,
+                    debug = debug,
+                      eps = eps,
+                  maxdist = maxdist,
+                    nIter = nIter,
+                onlyValid = onlyValid,
+                      tol = tol,
+            )
+
+            # Calculate the great circles (either in this process or in chunks
+            # in the pool of worker processes) ...
+            # NOTE: There are a few chunks per worker process, so that the
+            #       workers stay busy even though some great circles take
+            #       longer to calculate than others.
+            todo = list(missing.values())
+            if pool is None or len(todo) < 2:
+                wkbs = func(todo)
+            else:
+                size = math.ceil(len(todo) / (4 * jobs))
+                wkbs = []
+                for chunk in pool.map(func, [todo[i:i + size] for i in range(0, len(todo), size)]):
+                    wkbs += chunk
+
+            if debug:
+                print(f"DEBUG: Calculated {len(wkbs):,d} great circles.")
+
+            # Save them in the cache and add them to the ones which were
+            # found ...
+            self.put_many(list(zip(missing, wkbs, strict = True)))
+            for key, wkb in zip(missing, wkbs, strict = True):
+                found[key] = list(shapely.from_wkb(wkb).geoms)
+
+        # Return answer ...
+        return [found[key] for key in keys]
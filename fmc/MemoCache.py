@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import threading
+
+# Define class ...
+class MemoCache:
+    """A least recently used cache in memory
+
+    This class stores the base layers of the maps and the simplified country
+    shapes (see :func:`fmc.render_base_layer` and
+    :func:`fmc.simplify_countries`) which have already been loaded, so that a
+    long-lived process does not load them again. The least recently used items
+    are evicted when the total (estimated) size of the cache exceeds the limit.
+    It is safe to use from many threads at once.
+
+    Parameters
+    ----------
+    maxSize : int, optional
+        the maximum total size of the items in the cache (in bytes)
+
+    Attributes
+    ----------
+    evictions : int
+        the number of items evicted from the cache
+    size : int
+        the total size of the items in the cache (in bytes)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define function ...
+    def __init__(
+        self,
+        /,
+        *,
+        maxSize = 256 * 1024 * 1024,
+    ):
+        # Import standard modules ...
+        import collections
+
+        # **********************************************************************
+
+        # Initialize the cache and the counters ...
+        self.evictions = 0                                                      # [#]
+        self.items = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.maxSize = maxSize                                                  # [B]
+        self.size = 0                                                           # [B]
+
+    # Define function ...
+    def __contains__(
+        self,
+        key,
+    ):
+        with self.lock:
+            return key in self.items
+
+    # Define function ...
+    def __len__(
+        self,
+    ):
+        with self.lock:
+            return len(self.items)
+
+    # Define function ...
+    def get(
+        self,
+        key,
+        default = None,
+        /,
+    ):
+        """Get an item from the cache
+
+        Parameters
+        ----------
+        key : str
+            the key of the item
+        default : optional
+            what to return if the item is not in the cache
+
+        Returns
+        -------
+        value
+            the item (or the default if it is not in the cache)
+        """
+
+        # Return the item (and mark it as the most recently used one) ...
+        with self.lock:
+            if key not in self.items:
+                return default
+            self.items.move_to_end(key)
+            return self.items[key][0]
+
+    # Define function ...
+    def __getitem__(
+        self,
+        key,
+    ):
+        with self.lock:
+            self.items.move_to_end(key)
+            return self.items[key][0]
+
+    # Define function ...
+    def __setitem__(
+        self,
+        key,
+        value,
+    ):
+        # Find the size of the item ...
+        size = MemoCache.size_of(value)                                         # [B]
+
+        # Put the item in the cache and evict the least recently used items
+        # until the cache is small enough (apart from the new item, which is
+        # always kept) ...
+        with self.lock:
+            if key in self.items:
+                self.size -= self.items.pop(key)[1]                             # [B]
+            self.items[key] = (value, size)
+            self.size += size                                                   # [B]
+            while self.size > self.maxSize and len(self.items) > 1:
+                _, (_, oldSize) = self.items.popitem(last = False)
+                self.size -= oldSize                                            # [B]
+                self.evictions += 1                                             # [#]
+
+    # Define function ...
+    @staticmethod
+    def size_of(
+        value,
+        /,
+    ):
+        """Estimate the size of an item
+
+        Parameters
+        ----------
+        value
+            the item (a NumPy array, a Shapely geometry, a string, a number or
+            a tuple or list of them)
+
+        Returns
+        -------
+        size : int
+            the estimated size of the item (in bytes)
+        """
+
+        # Import special modules ...
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+        try:
+            import shapely
+        except:
+            raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+        # **********************************************************************
+
+        # Estimate the size of the item ...
+        # NOTE: Each coordinate of a geometry is two double-precision floats.
+        match value:
+            case numpy.ndarray():
+                return value.nbytes
+            case shapely.Geometry():
+                return 16 * int(shapely.get_num_coordinates(value))
+            case str() | bytes():
+                return len(value)
+            case tuple() | list():
+                return sum(MemoCache.size_of(item) for item in value)
+            case _:
+                return 8
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+# Define class ...
+class Optimiser:
+    """A pool of workers which optimise PNG maps in the background
+
+    This class runs :func:`pyguymer3.image.optimise_image` (which runs
+    "optipng" and, optionally, "exiftool") on finished PNG maps in a bounded
+    pool of worker threads and returns futures, so that a batch of renders can
+    overlap making the next PNG map with optimising the previous ones. The
+    workers only wait on the external programs, therefore threads are enough.
+    Submitting blocks whilst the maximum number of PNG maps are already waiting
+    to be (or are being) optimised, so that the backlog cannot grow without
+    bound.
+
+    Parameters
+    ----------
+    debug : bool, optional
+        print debug messages
+    jobs : int, optional
+        the number of worker threads
+    maxPending : int, optional
+        the maximum number of PNG maps which are waiting to be (or are being)
+        optimised (defaults to twice the number of worker threads)
+    strip : bool, optional
+        strip metadata from the PNG maps too
+    timeout : float, optional
+        the timeout for any subprocess calls (in seconds)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define function ...
+    def __init__(
+        self,
+        /,
+        *,
+             debug = __debug__,
+              jobs = 1,
+        maxPending = None,
+             strip = True,
+           timeout = 60.0,
+    ):
+        # Import standard modules ...
+        import concurrent.futures
+        import threading
+
+        # **********************************************************************
+
+        # Populate default values ...
+        if maxPending is None:
+            maxPending = 2 * jobs
+
+        # Store the settings ...
+        self.debug = debug
+        self.strip = strip
+        self.timeout = timeout                                                  # [s]
+
+        # Create the pool of worker threads and the semaphore which bounds the
+        # number of PNG maps which are waiting to be (or are being)
+        # optimised ...
+        self.pool = concurrent.futures.ThreadPoolExecutor(
+                   max_workers = jobs,
+            thread_name_prefix = "fmc-optimise",
+        )
+        self.slots = threading.BoundedSemaphore(maxPending)
+
+    # Define function ...
+    def __enter__(
+        self,
+    ):
+        return self
+
+    # Define function ...
+    def __exit__(
+        self,
+        exc_type,
+        exc_value,
+        traceback,
+    ):
+        self.close()
+
+    # Define function ...
+    def close(
+        self,
+        /,
+        *,
+        wait = True,
+    ):
+        """Close the pool of worker threads
+
+        Parameters
+        ----------
+        wait : bool, optional
+            wait for all of the PNG maps which have been submitted to be
+            optimised
+        """
+
+        # Close the pool of worker threads ...
+        self.pool.shutdown(wait = wait)
+
+    # Define function ...
+    def submit(
+        self,
+        fname,
+        /,
+        *,
+        stats = None,
+    ):
+        """Optimise a PNG map in the background
+
+        Parameters
+        ----------
+        fname : str
+            the PNG map
+        stats : fmc.RunStats, optional
+            the statistics to add the time taken to optimise the PNG map to (as
+            the "optimise" stage)
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            the future of the optimisation (its result is the PNG map)
+        """
+
+        # Import standard modules ...
+        import contextlib
+
+        # Import my modules ...
+        try:
+            import pyguymer3
+            import pyguymer3.image
+        except:
+            raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+        # **********************************************************************
+
+        # Define a function to optimise the PNG map ...
+        def optimise():
+            try:
+                if self.debug:
+                    print(f"DEBUG: Optimising \"{fname}\".")
+                with contextlib.nullcontext() if stats is None else stats.stage("optimise"):
+                    pyguymer3.image.optimise_image(
+                        fname,
+                          debug = self.debug,
+                          strip = self.strip,
+                        timeout = self.timeout,
+                    )
+                return fname
+            finally:
+                self.slots.release()
+
+        # Wait for a slot and submit the PNG map ...
+        self.slots.acquire()
+        try:
+            return self.pool.submit(optimise)
+        except:
+            self.slots.release()
+            raise
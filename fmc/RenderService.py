@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import threading
+
+# Define class ...
+class RenderService:
+    """A warm service which makes PNG maps from flight logs
+
+    This class keeps a pool of worker processes, each of which loads a
+    :class:`fmc.Renderer` once (the airport database, the country shapes and
+    the base layers of the maps stay loaded between requests), and makes the
+    PNG map of a flight log (given as the text of a CSV file) with some of the
+    options of :meth:`fmc.Renderer.render`. The PNG maps are kept in a least
+    recently used cache in memory which is keyed by a hash of the rows of the
+    flight log (normalised in the same way as they are parsed) and of the
+    options (with their default values filled in), so that an identical
+    request is answered without making the PNG map again and concurrent
+    identical requests share the same PNG map whilst it is being made. It is
+    safe to call :meth:`render` from many threads at once.
+
+    Parameters
+    ----------
+    debug : bool, optional
+        print debug messages
+    jobs : int, optional
+        the number of worker processes to make the PNG maps in
+    maxSize : int, optional
+        the maximum total size of the PNG maps in the cache (in bytes)
+    **kwargs
+        the keyword arguments to pass to :class:`fmc.Renderer` in each worker
+        process
+
+    Attributes
+    ----------
+    coalesced : int
+        the number of requests which shared a PNG map which was already being
+        made
+    evictions : int
+        the number of PNG maps evicted from the cache
+    hits : int
+        the number of requests which were answered from the cache
+    misses : int
+        the number of requests which needed a PNG map to be made
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define the options of :meth:`fmc.Renderer.render` which cannot be set by
+    # a request (because they refer to files, to functions or to objects in the
+    # worker processes) ...
+    forbidden = (
+        "callback",
+        "flightMap",
+        "incremental",
+        "optimiser",
+        "stateFile",
+        "stats",
+    )
+
+    # Initialize the renderer of this worker process ...
+    renderer = None
+
+    # Define function ...
+    def __init__(
+        self,
+        /,
+        *,
+          debug = __debug__,
+           jobs = 1,
+        maxSize = 256 * 1024 * 1024,
+        **kwargs,
+    ):
+        # Import standard modules ...
+        import collections
+        import inspect
+
+        # Import sub-functions ...
+        from .Renderer import Renderer
+
+        # **********************************************************************
+
+        # Find the options which a request can set and their default values ...
+        self.defaults = {
+            name : parameter.default
+            for name, parameter in inspect.signature(Renderer.render).parameters.items()
+            if parameter.kind == inspect.Parameter.KEYWORD_ONLY and name not in RenderService.forbidden
+        }
+        self.defaults["optimise"] = False
+
+        # Create the pool of worker processes ...
+        self.debug = debug
+        self.jobs = jobs                                                        # [#]
+        self.kwargs = kwargs
+        self.pool = self.create_pool()
+
+        # Initialize the cache, the renders which are in flight and the
+        # counters ...
+        self.cache = collections.OrderedDict()
+        self.coalesced = 0                                                      # [#]
+        self.evictions = 0                                                      # [#]
+        self.hits = 0                                                           # [#]
+        self.inflight = {}
+        self.latencies = {}
+        self.lock = threading.Lock()
+        self.maxSize = maxSize                                                  # [B]
+        self.misses = 0                                                         # [#]
+        self.requests = 0                                                       # [#]
+        self.size = 0                                                           # [B]
+        self.stages = {}
+        self.waiting = 0                                                        # [#]
+
+    # Define function ...
+    def __enter__(
+        self,
+    ):
+        return self
+
+    # Define function ...
+    def __exit__(
+        self,
+        exc_type,
+        exc_value,
+        traceback,
+    ):
+        self.close()
+
+    # Define function ...
+    def close(
+        self,
+    ):
+        """Close the service"""
+
+        # Close the pool of worker processes (which closes the renderer of each
+        # worker process which was started as it exits) ...
+        with self.lock:
+            pool = self.pool
+        pool.shutdown()
+
+    # Define function ...
+    def create_pool(
+        self,
+    ):
+        """Create the pool of worker processes
+
+        Returns
+        -------
+        pool : concurrent.futures.ProcessPoolExecutor
+            the pool of worker processes (each of which creates its own
+            renderer)
+        """
+
+        # Import standard modules ...
+        import concurrent.futures
+
+        # **********************************************************************
+
+        # Create the pool of worker processes ...
+        # NOTE: The renderer of each worker process makes the PNG maps one at
+        #       a time, the pool is what makes them in parallel.
+        return concurrent.futures.ProcessPoolExecutor(
+                 initargs = (self.debug, self.kwargs),
+              initializer = RenderService.init_worker,
+              max_workers = self.jobs,
+        )
+
+    # Define function ...
+    @staticmethod
+    def init_worker(
+        debug,
+        kwargs,
+        /,
+    ):
+        """Create the renderer of a worker process
+
+        Parameters
+        ----------
+        debug : bool
+            print debug messages
+        kwargs : dict
+            the keyword arguments to pass to :class:`fmc.Renderer`
+        """
+
+        # Import standard modules ...
+        import multiprocessing.util
+
+        # Import sub-functions ...
+        from .Renderer import Renderer
+
+        # **********************************************************************
+
+        # Create the renderer ...
+        RenderService.renderer = Renderer(
+            debug = debug,
+             jobs = 1,
+            **kwargs,
+        )
+
+        # Close the renderer when the worker process exits ...
+        # NOTE: Worker processes of a pool exit without running any functions
+        #       which are registered with "atexit", but they do run the
+        #       finalizers of "multiprocessing" (when the pool is shut down),
+        #       therefore only the worker processes which were actually
+        #       started close a renderer and no more are started to do so.
+        multiprocessing.util.Finalize(
+            None,
+            RenderService.renderer.close,
+            exitpriority = 10,
+        )
+
+    # Define function ...
+    def restart_pool(
+        self,
+        pool,
+        /,
+    ):
+        """Replace a broken pool of worker processes
+
+        The lock must already be held.
+
+        Parameters
+        ----------
+        pool : concurrent.futures.ProcessPoolExecutor
+            the pool which is broken (if it has already been replaced, e.g., by
+            another request which found it broken too, then nothing is done)
+        """
+
+        # Replace the pool (if it has not already been replaced) ...
+        # NOTE: A pool is broken for good once any of its worker processes has
+        #       died (e.g., because it ran out of memory), therefore a new one
+        #       is created so that later requests do not fail too.
+        if pool is not self.pool:
+            return
+        if self.debug:
+            print("DEBUG: The pool of worker processes is broken, creating a new one.")
+        self.pool = self.create_pool()
+        pool.shutdown(wait = False)
+
+    # Define function ...
+    @staticmethod
+    def render_in_worker(
+        flightLog,
+        options,
+        /,
+    ):
+        """Make a PNG map in a worker process
+
+        Parameters
+        ----------
+        flightLog : str
+            the text of the CSV of the flights
+        options : dict
+            the keyword arguments to pass to :meth:`fmc.Renderer.render`
+
+        Returns
+        -------
+        png : bytes
+            the PNG map
+        stats : dict
+            the statistics of making the PNG map (see
+            :meth:`fmc.RunStats.to_dict`)
+        """
+
+        # Import standard modules ...
+        import contextlib
+        import io
+        import tempfile
+
+        # **********************************************************************
+
+        # Make the PNG map in a temporary directory (without printing the
+        # visited countries, unless debugging) ...
+        renderer = RenderService.renderer
+        with tempfile.TemporaryDirectory() as tmpDir:
+            with open(f"{tmpDir}/flights.csv", mode = "wt", encoding = "utf-8", newline = "") as fObj:
+                fObj.write(flightLog)
+            with contextlib.nullcontext() if renderer.debug else contextlib.redirect_stdout(io.StringIO()):
+                stats = renderer.render(
+                    f"{tmpDir}/flights.csv",
+                    flightMap = f"{tmpDir}/flights.png",
+                    **options,
+                )
+            with open(f"{tmpDir}/flights.png", mode = "rb") as fObj:
+                png = fObj.read()
+
+        # Return answer ...
+        return png, stats.to_dict()
+
+    # Define function ...
+    def add_latency(
+        self,
+        source,
+        latency,
+        /,
+    ):
+        """Add the latency of a request to the statistics
+
+        The lock must already be held.
+
+        Parameters
+        ----------
+        source : str
+            where the PNG map came from ("cache", "coalesced" or "render")
+        latency : float
+            the time taken to answer the request (in seconds)
+        """
+
+        # Add the latency ...
+        total = self.latencies.setdefault(source, {"count" : 0, "max" : 0.0, "wall" : 0.0})
+        total["count"] += 1                                                     # [#]
+        total["max"] = max(total["max"], latency)                               # [s]
+        total["wall"] += latency                                                # [s]
+
+    # Define function ...
+    def normalise(
+        self,
+        flightLog,
+        options,
+        /,
+    ):
+        """Normalise a request
+
+        Parameters
+        ----------
+        flightLog : str
+            the text of the CSV of the flights
+        options : dict
+            the options of :meth:`fmc.Renderer.render`
+
+        Returns
+        -------
+        key : str
+            the key of the request in the cache
+        flightLog : str
+            the text of the CSV of the normalised rows of the flights
+        options : dict
+            the options with their default values filled in
+
+        Raises
+        ------
+        ValueError
+            if an option is unknown or cannot be set by a request
+        """
+
+        # Import standard modules ...
+        import csv
+        import hashlib
+        import io
+        import json
+
+        # Import my modules ...
+        try:
+            import pyguymer3
+        except:
+            raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+        # **********************************************************************
+
+        # Check the options ...
+        for name in options:
+            if name not in self.defaults:
+                raise ValueError(f"\"{name}\" is not an option which can be set") from None
+
+        # Fill in the default values of the options (including the default
+        # maximum year, which changes once a year) ...
+        options = self.defaults | options
+        if options["maxYear"] is None:
+            options["maxYear"] = pyguymer3.now().year
+
+        # Normalise the rows of the flight log ...
+        # NOTE: Only the first four columns of each row are used and the
+        #       purpose is not case sensitive (see "fmc.iter_flight_log"),
+        #       therefore rows which are parsed in the same way give the same
+        #       key (whatever their quoting, line endings or extra columns).
+        rows = io.StringIO(newline = "")
+        writer = csv.writer(rows, lineterminator = "\n")
+        for row in csv.reader(io.StringIO(flightLog, newline = "")):
+            if len(row) >= 4:
+                row = row[:3] + [row[3].lower()]
+            writer.writerow(row)
+        flightLog = rows.getvalue()
+
+        # Find the key ...
+        hashObj = hashlib.sha256()
+        hashObj.update(json.dumps(options, sort_keys = True).encode("utf-8"))
+        hashObj.update(flightLog.encode("utf-8"))
+
+        # Return answer ...
+        return hashObj.hexdigest(), flightLog, options
+
+    # Define function ...
+    def render(
+        self,
+        flightLog,
+        /,
+        **options,
+    ):
+        """Make (or find) the PNG map of a flight log
+
+        Parameters
+        ----------
+        flightLog : str
+            the text of the CSV of the flights
+        **options
+            the options of :meth:`fmc.Renderer.render`
+
+        Returns
+        -------
+        png : bytes
+            the PNG map
+        source : str
+            where the PNG map came from ("cache", "coalesced" or "render")
+        """
+
+        # Import standard modules ...
+        import concurrent.futures
+        import time
+
+        # **********************************************************************
+
+        # Normalise the request ...
+        t0 = time.perf_counter()
+        key, flightLog, options = self.normalise(flightLog, options)
+
+        # Check if the PNG map is in the cache or is already being made ...
+        with self.lock:
+            self.requests += 1                                                  # [#]
+            if key in self.cache:
+                self.hits += 1                                                  # [#]
+                self.cache.move_to_end(key)
+                self.add_latency("cache", time.perf_counter() - t0)
+                return self.cache[key], "cache"
+            if key in self.inflight:
+                self.coalesced += 1                                             # [#]
+                source = "coalesced"
+            else:
+                self.misses += 1                                                # [#]
+                pool = self.pool
+                try:
+                    self.inflight[key] = pool.submit(
+                        RenderService.render_in_worker,
+                        flightLog,
+                        options,
+                    )
+                except concurrent.futures.BrokenExecutor:
+                    self.restart_pool(pool)
+                    pool = self.pool
+                    self.inflight[key] = pool.submit(
+                        RenderService.render_in_worker,
+                        flightLog,
+                        options,
+                    )
+                source = "render"
+            future = self.inflight[key]
+            self.waiting += 1                                                   # [#]
+
+        # Wait for the PNG map to be made (replacing the pool if a worker
+        # process died whilst making it, so that only the requests which were
+        # in flight fail) ...
+        try:
+            png, stats = future.result()
+        except:
+            with self.lock:
+                self.waiting -= 1                                               # [#]
+                if source == "render":
+                    del self.inflight[key]
+                    if isinstance(future.exception(), concurrent.futures.BrokenExecutor):
+                        self.restart_pool(pool)
+            raise
+
+        # Save the PNG map in the cache (evicting the least recently used PNG
+        # maps if the cache is too large) and the statistics of making it
+        # (only once per PNG map) before it stops being in flight ...
+        with self.lock:
+            self.waiting -= 1                                                   # [#]
+            if source == "render":
+                for name, times in stats["stages"].items():
+                    total = self.stages.setdefault(name, {"count" : 0, "max" : 0.0, "wall" : 0.0})
+                    total["count"] += 1                                         # [#]
+                    total["max"] = max(total["max"], times["wall"])             # [s]
+                    total["wall"] += times["wall"]                              # [s]
+                if len(png) <= self.maxSize:
+                    self.cache[key] = png
+                    self.size += len(png)                                       # [B]
+                    while self.size > self.maxSize:
+                        _, old = self.cache.popitem(last = False)
+                        self.size -= len(old)                                   # [B]
+                        self.evictions += 1                                     # [#]
+                del self.inflight[key]
+            self.add_latency(source, time.perf_counter() - t0)
+
+        # Return answer ...
+        return png, source
+
+    # Define function ...
+    def to_dict(
+        self,
+    ):
+        """Convert the statistics of the service to a dictionary
+
+        Returns
+        -------
+        ans : dict
+            the statistics (which can be serialised as JSON): the number of
+            "requests", the number of PNG maps which are being made
+            ("queueDepth", including the ones which are waiting for a worker
+            process) and the number of requests which are waiting for them
+            ("waiting"), the state of the "cache" (including its "hitRate",
+            where a coalesced request counts as a hit), the number of requests
+            answered from each source along with the mean and the maximum time
+            taken to answer them ("latencies", in seconds) and the number of
+            times that each stage of making a PNG map has been run along with
+            the mean and the maximum wall time of it ("stages", in seconds)
+        """
+
+        # Find the statistics ...
+        with self.lock:
+            cache = {
+                "coalesced" : self.coalesced,
+                  "entries" : len(self.cache),
+                "evictions" : self.evictions,
+                     "hits" : self.hits,
+                  "hitRate" : (self.hits + self.coalesced) / max(1, self.requests),
+                  "maxSize" : self.maxSize,
+                   "misses" : self.misses,
+                     "size" : self.size,
+            }
+            latencies = {
+                source : {
+                    "count" : total["count"],
+                      "max" : total["max"],
+                     "mean" : total["wall"] / total["count"],
+                }
+                for source, total in self.latencies.items()
+            }
+            stages = {
+                name : {
+                    "count" : total["count"],
+                      "max" : total["max"],
+                     "mean" : total["wall"] / total["count"],
+                }
+                for name, total in self.stages.items()
+            }
+
+            # Return answer ...
+            return {
+                     "cache" : cache,
+                 "latencies" : latencies,
+                "queueDepth" : len(self.inflight),
+                  "requests" : self.requests,
+                    "stages" : stages,
+                   "waiting" : self.waiting,
+            }
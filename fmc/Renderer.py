@@ -0,0 +1,1535 @@
+#!/usr/bin/env python3
+
+# Define class ...
+class Renderer:
+    """A renderer of PNG maps
+
+    This class loads everything which does not depend on a flight log once (the
+    airport database, the fields-of-view of the sub-maps, the country shapes,
+    the cache of great circles and the base layers of the maps) and then
+    renders as many flight logs as required, so that a long-lived process only
+    pays for the fixed setup once.
+
+    Parameters
+    ----------
+    baseSize : int, optional
+        the maximum total size of the base layers of the maps in the on-disk
+        cache (in bytes)
+    cache : bool, optional
+        use the on-disk caches (e.g., of the great circles and of the base
+        layers of the maps)
+    cacheDir : str, optional
+        the directory of the on-disk caches (defaults to "~/.cache/fmc")
+    clipToFov : bool, optional
+        clip the great circles and the countries to the field-of-view of the
+        sub-maps (as well as culling the ones which are outside of it)
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    jobs : int, optional
+        the number of worker processes to calculate the great circles and to
+        render the panels of the PNG maps in (if it is more than one then the
+        great circles which are not in the cache are calculated in parallel,
+        and each panel is rendered to its own layer in parallel and the layers
+        are composited together)
+    leftDist : float, optional
+        the field-of-view around the left-hand sub-map central point (in metres)
+    leftLat : float, optional
+        the latitude of the central point of the left-hand sub-map (in degrees)
+    leftLon : float, optional
+        the longitude of the central point of the left-hand sub-map (in degrees)
+    lod : bool, optional
+        simplify the countries and the great circles on each map to half of the
+        size of a pixel of that map (see :func:`fmc.simplify_countries`) and
+        calculate the great circles on each map with points which are only a
+        few pixels of that map apart (see :meth:`find_maxdists`), so that there
+        are far fewer vertices to project and to rasterise but the maps look
+        the same
+    memoSize : int, optional
+        the maximum total size of the base layers of the maps and of the
+        simplified country shapes in the in-memory cache (in bytes)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    rightDist : float, optional
+        the field-of-view around the right-hand sub-map central point (in metres)
+    rightLat : float, optional
+        the latitude of the central point of the right-hand sub-map (in degrees)
+    rightLon : float, optional
+        the longitude of the central point of the right-hand sub-map (in degrees)
+    tol : float, optional
+        the Euclidean distance that defines two points as being the same (in
+        degrees)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Initialize the keyword arguments of :func:`fmc.render_figure` which do
+    # not depend on a flight log in this worker process ...
+    workerKwargs = None
+
+    # Define function ...
+    def __init__(
+        self,
+        /,
+        *,
+         baseSize = 1024 * 1024 * 1024,
+            cache = True,
+         cacheDir = None,
+        clipToFov = False,
+            debug = __debug__,
+              eps = 1.0e-12,
+             jobs = 1,
+         leftDist = 2392.7e3,
+          leftLat = +39.517,
+          leftLon = -97.763,
+              lod = True,
+         memoSize = 256 * 1024 * 1024,
+            nIter = 100,
+        onlyValid = True,
+           repair = True,
+        rightDist = 2346.6e3,
+         rightLat = +49.901,
+         rightLon =  +3.156,
+              tol = 1.0e-10,
+    ):
+        # Import standard modules ...
+        import pathlib
+
+        # Import special modules ...
+        try:
+            import cartopy
+            import cartopy.io.shapereader
+        except:
+            raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+        try:
+            import matplotlib
+        except:
+            raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+        try:
+            import shapely
+            import shapely.geometry
+        except:
+            raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+        # Import my modules ...
+        try:
+            import pyguymer3
+            import pyguymer3.geo
+        except:
+            raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+        # Import sub-functions ...
+        from .GreatCircleCache import GreatCircleCache
+        from .MemoCache import MemoCache
+        from .load_airports import load_airports
+        from .load_countries import load_countries
+
+        # **********************************************************************
+
+        # Populate default values ...
+        if cacheDir is None:
+            cacheDir = pathlib.PosixPath("~/.cache/fmc").expanduser()
+
+        # Store the settings ...
+        self.cache = cache
+        self.cacheDir = cacheDir
+        self.clipToFov = clipToFov
+        self.debug = debug
+        self.eps = eps
+        self.jobs = jobs
+        self.leftDist = leftDist                                                # [m]
+        self.leftLat = leftLat                                                  # [°]
+        self.leftLon = leftLon                                                  # [°]
+        self.lod = lod
+        self.nIter = nIter
+        self.onlyValid = onlyValid
+        self.repair = repair
+        self.rightDist = rightDist                                              # [m]
+        self.rightLat = rightLat                                                # [°]
+        self.rightLon = rightLon                                                # [°]
+        self.tol = tol
+
+        # Set the half-width of the bars on the histogram ...
+        self.hw = 0.2
+
+        # Create short-hands ...
+        c0, c1 = matplotlib.rcParams["axes.prop_cycle"].by_key()["color"][:2]
+        self.c0 = matplotlib.colors.to_rgb(c0)
+        self.c1 = matplotlib.colors.to_rgb(c1)
+        self.leftFov = pyguymer3.geo.buffer(
+            shapely.geometry.point.Point(leftLon, leftLat),
+            leftDist,
+            debug = debug,
+              eps = eps,
+             fill = -1.0,
+             nAng = 361,
+            nIter = nIter,
+             simp = -1.0,
+              tol = tol,
+        )
+        self.rightFov = pyguymer3.geo.buffer(
+            shapely.geometry.point.Point(rightLon, rightLat),
+            rightDist,
+            debug = debug,
+              eps = eps,
+             fill = -1.0,
+             nAng = 361,
+            nIter = nIter,
+             simp = -1.0,
+              tol = tol,
+        )
+
+        # Load airport list ...
+        self.airports = load_airports(debug = debug)
+
+        # Open the cache of great circles (if the user does not want to use the
+        # on-disk cache then still use one in memory, so that each great circle
+        # is only calculated once per renderer) ...
+        self.gcCache = GreatCircleCache(
+            f"{cacheDir}/greatCircles.sqlite3" if cache else ":memory:"
+        )
+
+        # Find file containing all the country shapes ...
+        self.sfile = cartopy.io.shapereader.natural_earth(
+              category = "cultural",
+                  name = "admin_0_countries",
+            resolution = "10m",
+        )
+
+        # Load the (validated and repaired) Polygons of all the countries ...
+        self.countries = load_countries(
+            self.sfile,
+                cache = cache,
+             cacheDir = cacheDir,
+                debug = debug,
+            onlyValid = onlyValid,
+               repair = repair,
+        )
+
+        # Collect the keyword arguments of :func:`fmc.render_figure` which do
+        # not depend on a flight log (apart from the country shapes, which are
+        # too big to send to the worker processes with every flight log) ...
+        self.settings = {
+            "baseLayers" : cache,
+              "baseSize" : baseSize,
+                    "c0" : self.c0,
+                    "c1" : self.c1,
+                 "cache" : cache,
+              "cacheDir" : cacheDir,
+             "clipToFov" : clipToFov,
+                   "eps" : eps,
+                    "hw" : self.hw,
+              "leftDist" : leftDist,
+               "leftFov" : self.leftFov,
+               "leftLat" : leftLat,
+               "leftLon" : leftLon,
+                   "lod" : lod,
+                 "nIter" : nIter,
+             "onlyValid" : onlyValid,
+                "repair" : repair,
+             "rightDist" : rightDist,
+              "rightFov" : self.rightFov,
+              "rightLat" : rightLat,
+              "rightLon" : rightLon,
+                 "sfile" : self.sfile,
+                   "tol" : tol,
+        }
+
+        # Initialize the in-memory cache of base layers, the pool of worker
+        # processes and the maximum distances between the points along the
+        # great circles on each map (which are only created when they are
+        # first needed) ...
+        self.maxdists = None
+        self.memo = MemoCache(maxSize = memoSize)
+        self.memoSize = memoSize                                                # [B]
+        self.pool = None
+
+    # Define function ...
+    def __enter__(
+        self,
+    ):
+        return self
+
+    # Define function ...
+    def __exit__(
+        self,
+        exc_type,
+        exc_value,
+        traceback,
+    ):
+        self.close()
+
+    # Define function ...
+    def close(
+        self,
+    ):
+        """Close the renderer"""
+
+        # Close the pool of worker processes ...
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+        # Close the cache of great circles ...
+        if self.debug:
+            print(f"DEBUG: The cache of great circles had {self.gcCache.hits:,d} hits, {self.gcCache.misses:,d} misses and {self.gcCache.evictions:,d} evictions.")
+        self.gcCache.close()
+
+    # Define function ...
+    def find_maxdists(
+        self,
+    ):
+        """Find the maximum distance between the points along the great circles
+        on each map
+
+        If the maps are simplified (see ``lod``) then the points along the
+        great circles on each map are at most a few pixels of that map apart,
+        rather than always being 12 nautical miles apart, so that the great
+        circles on the top map have far fewer points. The maximum distance is
+        rounded down to a power of two multiple of 12 nautical miles, so that
+        it does not change with small changes to the layout of the figure (and
+        so that only a few sets of great circles are in the cache).
+
+        Returns
+        -------
+        maxdists : dict of str to float
+            the maximum distance between the points along the great circles on
+            each map (in metres)
+        """
+
+        # Import standard modules ...
+        import math
+
+        # Import sub-functions ...
+        from ._consts import GREAT_CIRCLE_MAXDIST, GREAT_CIRCLE_SPACING
+        from .calc_pixel_size import calc_pixel_size
+        from .render_figure import render_figure
+
+        # **********************************************************************
+
+        # Check if the maximum distances have not been found already ...
+        if self.maxdists is None:
+            # Use the default maximum distance on every map ...
+            self.maxdists = {
+                  "top" : GREAT_CIRCLE_MAXDIST,
+                 "left" : GREAT_CIRCLE_MAXDIST,
+                "right" : GREAT_CIRCLE_MAXDIST,
+            }                                                                   # [m]
+
+            # Check if the maps are simplified ...
+            if self.lod:
+                # Create and lay out the figure (with an empty histogram and
+                # without drawing anything on the maps) ...
+                # NOTE: The size of a pixel of each map barely depends on the
+                #       histogram and the label which the figure is laid out
+                #       with.
+                fg = render_figure(
+                    (),
+                      debug = self.debug,
+                    maxYear = 2029,
+                    minYear = 2000,
+                    **self.settings,
+                )
+                axT, axL, axR, _ = fg.axes
+
+                # Loop over maps ...
+                for panel, ax in [
+                    ("top", axT),
+                    ("left", axL),
+                    ("right", axR),
+                ]:
+                    # Find the maximum distance on this map ...
+                    ratio = GREAT_CIRCLE_SPACING * calc_pixel_size(ax) / GREAT_CIRCLE_MAXDIST
+                    self.maxdists[panel] = GREAT_CIRCLE_MAXDIST * 2.0 ** max(0, math.floor(math.log2(ratio)))   # [m]
+
+                    if self.debug:
+                        print(f"DEBUG: The points along the great circles on the {panel} map are at most {0.001 * self.maxdists[panel]:,.1f} km apart.")
+
+        # Return answer ...
+        return self.maxdists
+
+    # Define function ...
+    @staticmethod
+    def init_worker(
+        debug,
+        memoSize,
+        settings,
+        /,
+    ):
+        """Load everything which does not depend on a flight log in a worker
+        process
+
+        Parameters
+        ----------
+        debug : bool
+            print debug messages
+        memoSize : int
+            the maximum total size of the in-memory cache of the worker process
+            (in bytes)
+        settings : dict
+            the keyword arguments of :func:`fmc.render_figure` which do not
+            depend on a flight log (apart from the country shapes)
+        """
+
+        # Import sub-functions ...
+        from .MemoCache import MemoCache
+        from .load_countries import load_countries
+
+        # **********************************************************************
+
+        # Load the (validated and repaired) Polygons of all the countries once
+        # and keep them with the rest of the settings (and an in-memory cache
+        # of base layers and of simplified country shapes) ...
+        Renderer.workerKwargs = settings | {
+            "countries" : load_countries(
+                settings["sfile"],
+                    cache = settings["cache"],
+                 cacheDir = settings["cacheDir"],
+                    debug = debug,
+                onlyValid = settings["onlyValid"],
+                   repair = settings["repair"],
+            ),
+                 "memo" : MemoCache(maxSize = memoSize),
+        }
+
+    # Define function ...
+    @staticmethod
+    def render_layer_in_worker(
+        panel,
+        kwargs,
+        /,
+    ):
+        """Render one panel of a PNG map to its own raster in a worker process
+
+        Parameters
+        ----------
+        panel : str
+            the panel to draw (one of "top", "left", "right" and "bottom")
+        kwargs : dict
+            the keyword arguments of :func:`fmc.render_figure` which depend on
+            the flight log
+
+        Returns
+        -------
+        layer : numpy.ndarray
+            the RGBA raster of the panel (with non-premultiplied alpha)
+        artists : int
+            the number of artists created on the map (if the panel is a map)
+        """
+
+        # Import sub-functions ...
+        from .render_layer import render_layer
+
+        # **********************************************************************
+
+        # Render the panel with the settings of this worker process ...
+        return render_layer(
+            panel,
+            **Renderer.workerKwargs,
+            **kwargs,
+        )
+
+    # Define function ...
+    def open_pool(
+        self,
+    ):
+        """Create the pool of worker processes (if it has not been created
+        already)
+
+        Returns
+        -------
+        pool : concurrent.futures.ProcessPoolExecutor
+            the pool of worker processes
+        """
+
+        # Import standard modules ...
+        import concurrent.futures
+
+        # **********************************************************************
+
+        # Create the pool of worker processes (each of which loads everything
+        # which does not depend on a flight log once) ...
+        if self.pool is None:
+            self.pool = concurrent.futures.ProcessPoolExecutor(
+                   initargs = (self.debug, self.memoSize, self.settings),
+                initializer = Renderer.init_worker,
+                max_workers = self.jobs,
+            )
+
+        # Return answer ...
+        return self.pool
+
+    # Define function ...
+    def render(
+        self,
+        flightLog,
+        /,
+        *,
+              callback = None,
+        colorByPurpose = False,
+         compressLevel = None,
+               density = False,
+        extraCountries = None,
+             flightMap = None,
+           incremental = False,
+               maxYear = None,
+               minYear = None,
+            notVisited = None,
+              optimise = True,
+             optimiser = None,
+               renames = None,
+             stateFile = None,
+                 stats = None,
+                 strip = True,
+               timeout = 60.0,
+    ):
+        """Make a PNG map from a CSV file
+
+        Parameters
+        ----------
+        flightLog : str
+            the CSV of your flights
+        callback : function, optional
+            a function which is called with the statistics of making the PNG
+            map once it has been made (e.g., to export them to a metrics
+            system)
+        colorByPurpose : bool, optional
+            colour the flights and the countries by the purpose of the flight
+        compressLevel : int, optional
+            the zlib compression level (from 0 to 9) to save the PNG map with
+            (if it is given then the PNG map is compressed in-process instead of
+            being optimised, without needing any external programs, and the
+            metadata is stripped from it if ``strip`` is ``True``)
+        density : bool, optional
+            draw the density of the great circles on each map as a single image
+            with a logarithmic colour scale (see :func:`fmc.draw_density`),
+            rather than drawing each great circle as a line (which is much
+            faster, and much easier to read, for flight logs with tens of
+            thousands of unique routes)
+        extraCountries : list of str, optional
+            a list of extra countries that you have visited but which you have
+            not flown to (e.g., you took a train)
+        flightMap : str, optional
+            the PNG map
+        incremental : bool, optional
+            only read the rows which have been appended to the flight log since
+            the last time that it was read and add them to the persisted state
+            of it (see :func:`fmc.update_flight_state`), rather than reading all
+            of the flight log again
+        maxYear : int, optional
+            the maximum year to use for the survey
+        minYear : int, optional
+            the minimum year to use for the survey
+        notVisited : list of str, optional
+            a list of countries which you have flown to but not visited (e.g.,
+            you just transferred planes)
+        optimise : bool, optional
+            optimise the PNG map (with "optipng" and, if ``strip`` is
+            ``True``, "exiftool"); ignored if ``compressLevel`` is given
+        optimiser : fmc.Optimiser, optional
+            the pool of workers to optimise the PNG map in the background (if it
+            is given then this method returns as soon as the PNG map has been
+            submitted to it, the settings of the pool are used instead of
+            ``strip`` and ``timeout`` and ``callback`` is called once the PNG
+            map has been optimised)
+        renames : dict, optional
+            a mapping from OpenFlights country names to Natural Earth country
+            names
+        stateFile : str, optional
+            the file of the persisted state of the flight log (only used if
+            ``incremental`` is ``True``; defaults to the flight log with a
+            ".state.pickle" extension instead of a ".csv" extension)
+        stats : fmc.RunStats, optional
+            the statistics to add the statistics of making the PNG map to (if
+            it is not given then new statistics are created)
+        strip : bool, optional
+            strip metadata from PNG map too
+        timeout : float, optional
+            the timeout for any requests/subprocess calls (in seconds)
+
+        Returns
+        -------
+        stats : fmc.RunStats
+            the statistics of making the PNG map
+        """
+
+        # Import special modules ...
+        try:
+            import matplotlib
+            import matplotlib.image
+        except:
+            raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+        try:
+            import shapely
+            import shapely.geometry
+        except:
+            raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+        # Import my modules ...
+        try:
+            import pyguymer3
+            import pyguymer3.image
+        except:
+            raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+        # Import sub-functions ...
+        from ._consts import FIGURE_DPI
+        from .FlightLog import FlightLog
+        from .RunStats import RunStats
+        from .calc_route_distances import calc_route_distances
+        from .read_flight_log import read_flight_log
+        from .render_figure import render_figure
+        from .update_flight_state import update_flight_state
+
+        # Create short-hands ...
+        airports = self.airports
+        c0 = self.c0
+        c1 = self.c1
+        debug = self.debug
+        hw = self.hw
+
+        # Populate default values ...
+        if extraCountries is None:
+            extraCountries = []
+        if flightMap is None:
+            flightMap = f'{flightLog.removesuffix(".csv")}.png'
+        if maxYear is None:
+            maxYear = pyguymer3.now().year
+        if notVisited is None:
+            notVisited = []
+        if renames is None:
+            renames = {}
+        if stats is None:
+            stats = RunStats()
+
+        # Convert the list of extra countries to a dictionary of extra countries
+        # where the key is the country and the value is the colour to draw it
+        # with ...
+        newExtraCountries = {}
+        for extraCountry in extraCountries:
+            newExtraCountries[extraCountry] = (1.0, 0.0, 0.0, 0.25)
+        extraCountries = newExtraCountries
+        del newExtraCountries
+
+        # **********************************************************************
+
+        # Check if the flight log is read incrementally ...
+        if incremental:
+            # Update the persisted state of the flight log with just the rows
+            # which have been appended to it ...
+            with stats.stage("ingest"):
+                state = update_flight_state(
+                    flightLog,
+                    airports,
+                        debug = debug,
+                          eps = self.eps,
+                      maxYear = maxYear,
+                      minYear = minYear,
+                        nIter = self.nIter,
+                    stateFile = stateFile,
+                        stats = stats,
+                )
+            minYear = maxYear if state.minYear is None else state.minYear
+
+            # Find the total distance ...
+            total_dist = 1.0e-6 * sum(state.dists.values())                     # [km]
+
+            # Find the histograms ...
+            businessX = [year - hw for year in range(minYear, maxYear + 1)]
+            businessY = [
+                1.0e-9 * state.dists.get((year, 1), 0)
+                for year in range(minYear, maxYear + 1)
+            ]                                                                   # [1000 km]
+            pleasureX = [year + hw for year in range(minYear, maxYear + 1)]
+            pleasureY = [
+                1.0e-9 * state.dists.get((year, 2), 0)
+                for year in range(minYear, maxYear + 1)
+            ]                                                                   # [1000 km]
+
+            # Find the codes of the airports and the purpose of the first
+            # flight of each unique route and the purpose of the first route to
+            # each country ...
+            firsts = [(iata1, iata2, purpose) for (iata1, iata2), purpose in state.routes.items()]
+            flown = state.countries
+        else:
+            # Read the flight log ...
+            with stats.stage("ingest"):
+                log = read_flight_log(
+                    flightLog,
+                      debug = debug,
+                    maxYear = maxYear,
+                    minYear = minYear,
+                      stats = stats,
+                )
+            minYear = log.minYear
+            codes = log.codes.tolist()
+
+            # Find the airports of all of the flights at once ...
+            with stats.stage("lookup"):
+                rows1, rows2 = log.rows_of_flights(airports)
+
+            # Find the distances of all of the flights at once ...
+            with stats.stage("distance"):
+                dists = calc_route_distances(
+                    airports,
+                    rows1,
+                    rows2,
+                      eps = self.eps,
+                    nIter = self.nIter,
+                )                                                               # [m]
+
+            # Print the coordinates of all of the flights (if required) ...
+            if debug:
+                for iata1, iata2, row1, row2 in zip(log.iatas1.tolist(), log.iatas2.tolist(), rows1.tolist(), rows2.tolist(), strict = True):
+                    print(f"INFO: You have flown between {codes[iata1]}, which is at ({airports.lats[row1]:+10.6f}°,{airports.lons[row1]:+11.6f}°), and {codes[iata2]}, which is at ({airports.lats[row2]:+10.6f}°,{airports.lons[row2]:+11.6f}°).")
+
+            # Find the total distance ...
+            total_dist = float((0.001 * dists).sum())                           # [km]
+
+            # Find the histograms ...
+            businessX = [year - hw for year in range(minYear, maxYear + 1)]
+            businessY = numpy.bincount(
+                log.years[log.purposes == 1] - minYear,
+                  weights = 1.0e-6 * dists[log.purposes == 1],
+                minlength = len(businessX),
+            ).tolist()                                                          # [1000 km]
+            pleasureX = [year + hw for year in range(minYear, maxYear + 1)]
+            pleasureY = numpy.bincount(
+                log.years[log.purposes == 2] - minYear,
+                  weights = 1.0e-6 * dists[log.purposes == 2],
+                minlength = len(pleasureX),
+            ).tolist()                                                          # [1000 km]
+
+            # Find the first flight of each unique route ...
+            # NOTE: Each route is only drawn once, in the colour of the first
+            #       flight along it.
+            lo = numpy.minimum(log.iatas1, log.iatas2).astype(numpy.int64)
+            hi = numpy.maximum(log.iatas1, log.iatas2).astype(numpy.int64)
+            _, firsts = numpy.unique(
+                lo * len(codes) + hi,
+                return_index = True,
+            )
+            firsts.sort()
+            firsts = [(codes[log.iatas1[i]], codes[log.iatas2[i]], int(log.purposes[i])) for i in firsts.tolist()]
+
+            # Find the purpose of the first route to each country ...
+            flown = {}
+            for iata1, iata2, purpose in firsts:
+                flown.setdefault(airports.country_of_IATA(iata1), purpose)
+                flown.setdefault(airports.country_of_IATA(iata2), purpose)
+
+        # Find the great circle of each unique route ...
+        with stats.stage("greatCircles"):
+            stats.uniqueRoutes += len(firsts)
+
+            # Find the codes and coordinates of the airports of each unique
+            # route ...
+            pairs = []
+            for iata1, iata2, _ in firsts:
+                lon1, lat1 = airports.coordinates_of_IATA(iata1)                # [°], [°]
+                lon2, lat2 = airports.coordinates_of_IATA(iata2)                # [°], [°]
+                pairs.append(((iata1, lon1, lat1), (iata2, lon2, lat2)))
+
+            # Create the pool of worker processes (if it is needed and it has
+            # not been created already) ...
+            if self.jobs > 1:
+                self.open_pool()
+
+            # Find the colour of the first flight of each unique route ...
+            edgecolors = []
+            for _, _, purpose in firsts:
+                # Find purpose for this flight ...
+                purpose = FlightLog.purposeNames[purpose]
+
+                # Find the colour of this flight ...
+                edgecolor = (1.0, 0.0, 0.0, 1.0)
+                if colorByPurpose:
+                    match purpose:
+                        case "business":
+                            edgecolor = c0 + (1.0,)
+                        case "pleasure":
+                            edgecolor = c1 + (1.0,)
+                        case _:
+                            pass
+                edgecolors.append(edgecolor)
+
+            # Loop over the different maximum distances between the points
+            # along the great circles on the maps ...
+            # NOTE: The maps which have the same maximum distance share the same
+            #       list of great circles.
+            maxdists = self.find_maxdists()
+            routesOf = {}
+            for maxdist in sorted(set(maxdists.values())):
+                # Find all of the great circles at once (calculating the ones
+                # which are not in the cache in the pool of worker processes, if
+                # there is one) ...
+                circles = self.gcCache.great_circles(
+                    pairs,
+                        debug = debug,
+                          eps = self.eps,
+                         jobs = self.jobs,
+                      maxdist = maxdist,
+                        nIter = self.nIter,
+                    onlyValid = self.onlyValid,
+                         pool = self.pool,
+                          tol = self.tol,
+                )
+
+                # Save the great circles (so that they can be drawn later) ...
+                routesOf[maxdist] = [
+                    (shapely.geometry.MultiLineString(lines), edgecolor)
+                    for lines, edgecolor in zip(circles, edgecolors, strict = True)
+                ]
+            panelRoutes = {panel : routesOf[maxdist] for panel, maxdist in maxdists.items()}
+
+            # Loop over the countries which have been flown to ...
+            for country, purpose in flown.items():
+                # Add the country to the list if it is missing ...
+                if country not in extraCountries:
+                    extraCountries[country] = (1.0, 0.0, 0.0, 0.25)
+                    if colorByPurpose:
+                        match FlightLog.purposeNames[purpose]:
+                            case "business":
+                                extraCountries[country] = c0 + (0.25,)
+                            case "pleasure":
+                                extraCountries[country] = c1 + (0.25,)
+                            case _:
+                                pass
+
+        # Create annotation ...
+        label = f"You have flown {total_dist:,.1f} km."
+        label += f" You have flown around the Earth {total_dist / (0.001 * pyguymer3.CIRCUMFERENCE_OF_EARTH):,.1f} times."
+        label += f" You have flown to the Moon {total_dist / (0.001 * pyguymer3.EARTH_MOON_DISTANCE):,.1f} times."
+
+        # Find the style of each country ...
+        with stats.stage("countries"):
+            # Clean up the list ...
+            # NOTE: The airport database and the country shape database use
+            #       different names for some countries. The user may provide a
+            #       dictionary to rename countries.
+            for country1, country2 in renames.items():
+                if country1 in extraCountries:
+                    extraCountries[country2] = extraCountries[country1]
+                    del extraCountries[country1]
+
+            # Initialize visited list and list of country styles ...
+            visited = []
+            styles = []
+
+            # Loop over countries ...
+            for neName, _ in self.countries:
+                # Check if this country is in the list ...
+                if neName in extraCountries and neName not in notVisited:
+                    # Append country name to visited list ...
+                    visited.append(neName)
+
+                    # Fill the country in and remove it from the list ...
+                    # NOTE: Removing them from the list enables us to print out
+                    #       the ones that where not found later on.
+                    styles.append((extraCountries[neName], extraCountries[neName]))
+                    del extraCountries[neName]
+                else:
+                    # Outline the country ...
+                    styles.append(((0.0, 0.0, 0.0, 0.25), "none"))
+            stats.countriesFilled += len(visited)
+
+        # Collect the keyword arguments which describe the PNG map (apart from
+        # the ones which do not depend on the flight log) ...
+        kwargs = {
+              "businessX" : businessX,
+              "businessY" : businessY,
+                  "debug" : debug,
+                "density" : density,
+                  "label" : label,
+                "maxYear" : maxYear,
+                "minYear" : minYear,
+            "panelRoutes" : panelRoutes,
+              "pleasureX" : pleasureX,
+              "pleasureY" : pleasureY,
+                 "styles" : styles,
+        }
+
+        # Find the keyword arguments which describe how to save the PNG map ...
+        # NOTE: Matplotlib only writes the "Software" metadata to PNG files.
+        saveKwargs = {"dpi" : FIGURE_DPI}
+        if compressLevel is not None:
+            saveKwargs["pil_kwargs"] = {"compress_level" : compressLevel}
+            if strip:
+                saveKwargs["metadata"] = {"Software" : None}
+
+        # Make the PNG map ...
+        with stats.stage("savefig"):
+            # Check how many jobs to use ...
+            if self.jobs > 1:
+                # Create the pool of worker processes (if it has not been
+                # created already) ...
+                panels = ["top", "left", "right", "bottom"]
+                pool = self.open_pool()
+
+                # Render each panel to its own (transparent) layer in the pool
+                # of worker processes ...
+                # NOTE: Every layer has exactly the same layout and size as the
+                #       full PNG map, therefore the layers can just be stacked
+                #       in the same order that Matplotlib would draw the axes
+                #       in.
+                # NOTE: Only the keyword arguments which depend on the flight
+                #       log are sent to the worker processes, as they already
+                #       have the rest (see :meth:`init_worker`).
+                futures = [
+                    pool.submit(Renderer.render_layer_in_worker, panel, kwargs)
+                    for panel in panels
+                ]
+                layers = []
+                for future in futures:
+                    layer, artists = future.result()
+                    layers.append(layer)
+                    stats.artists += artists
+
+                # Composite the layers over a white background ...
+                # NOTE: The layers have non-premultiplied alpha.
+                img = numpy.ones(layers[0].shape[:2] + (3,), dtype = numpy.float64)
+                for layer in layers:
+                    alpha = layer[:, :, 3:].astype(numpy.float64) / 255.0
+                    img = alpha * (layer[:, :, :3].astype(numpy.float64) / 255.0) + (1.0 - alpha) * img
+                img = numpy.round(255.0 * img).astype(numpy.uint8)
+
+                # Save figure ...
+                matplotlib.image.imsave(
+                    flightMap,
+                    img,
+                    **saveKwargs,
+                )
+            else:
+                # Render all of the panels at once (reusing the base layers
+                # which have already been loaded) and save figure ...
+                fg = render_figure(
+                    ("top", "left", "right", "bottom"),
+                    countries = self.countries,
+                         memo = self.memo,
+                        stats = stats,
+                    **self.settings,
+                    **kwargs,
+                )
+                fg.savefig(flightMap, **saveKwargs)
+
+        # Optimize PNG (if required) ...
+        # NOTE: A PNG map which has been compressed in-process is not optimised
+        #       too.
+        if compressLevel is not None:
+            optimise = False
+        optimisation = None
+        if optimise and optimiser is not None:
+            optimisation = optimiser.submit(flightMap, stats = stats)
+        elif optimise:
+            with stats.stage("optimise"):
+                pyguymer3.image.optimise_image(
+                    flightMap,
+                      debug = debug,
+                      strip = strip,
+                    timeout = timeout,
+                )
+
+        # Print out the countries that were not drawn ...
+        for country in sorted(list(extraCountries.keys())):
+            print(f"\"{country}\" was not drawn.")
+
+        # Print out the countries that have been visited ...
+        for country in sorted(visited):
+            print(f"\"{country}\" has been visited.")
+
+        # Pass the statistics to the callback (if required) ...
+        # NOTE: If the PNG map is being optimised in the background then the
+        #       statistics are not complete until it has finished.
+        if callback is not None:
+            if optimisation is None:
+                callback(stats)
+            else:
+                optimisation.add_done_callback(lambda _: callback(stats))
+
+        # Return answer ...
+        return stats
+
+    # Define function ...
+    def render_frames(
+        self,
+        flightLog,
+        /,
+        *,
+             animation = None,
+        colorByPurpose = False,
+         compressLevel = None,
+        extraCountries = None,
+                   fps = 2.0,
+              frameDir = None,
+               maxYear = None,
+               minYear = None,
+            notVisited = None,
+              optimise = True,
+                period = "year",
+               renames = None,
+                 stats = None,
+                 strip = True,
+               timeout = 60.0,
+    ):
+        """Make a time-lapse of PNG maps from a CSV file
+
+        This method reads the flight log once and then makes one PNG map per
+        year (or per month) of the survey, each one showing all of the flights
+        up to the end of that period. The figure is created and laid out once
+        (using the final histogram and label) and the parts of the maps which
+        do not change are drawn once. Each frame then only draws the great
+        circles of the routes which were first flown in that period and the
+        countries which were first visited in that period on top of the
+        retained pixels of the previous frame, before redrawing the histogram
+        and the label (which are never retained). Making a long time-lapse
+        therefore costs little more than making one PNG map plus saving each
+        frame.
+
+        Parameters
+        ----------
+        flightLog : str
+            the CSV of your flights
+        animation : str, optional
+            the animation to make from the frames (if it ends with ".mp4" then
+            it is encoded with "ffmpeg", otherwise Pillow chooses the format
+            from the extension, e.g., an animated PNG, GIF or WebP)
+        colorByPurpose : bool, optional
+            colour the flights and the countries by the purpose of the flight
+        compressLevel : int, optional
+            the zlib compression level (from 0 to 9) to save the frames with
+            (if it is given then the frames are compressed in-process instead
+            of being optimised and the metadata is stripped from them if
+            ``strip`` is ``True``)
+        extraCountries : list of str, optional
+            a list of extra countries that you have visited but which you have
+            not flown to (e.g., you took a train); they are shown in every
+            frame
+        fps : float, optional
+            the number of frames per second of the animation
+        frameDir : str, optional
+            the directory to save the frames in (defaults to the flight log
+            with a ".frames" extension instead of a ".csv" extension); each
+            frame is called "YYYY.png" (or "YYYY-MM.png")
+        maxYear : int, optional
+            the maximum year to use for the survey
+        minYear : int, optional
+            the minimum year to use for the survey
+        notVisited : list of str, optional
+            a list of countries which you have flown to but not visited (e.g.,
+            you just transferred planes)
+        optimise : bool, optional
+            optimise each frame (with "optipng" and, if ``strip`` is ``True``,
+            "exiftool"); ignored if ``compressLevel`` is given
+        period : str, optional
+            the period of each frame (either "year" or "month")
+        renames : dict, optional
+            a mapping from OpenFlights country names to Natural Earth country
+            names
+        stats : fmc.RunStats, optional
+            the statistics to add the statistics of making the frames to (if it
+            is not given then new statistics are created)
+        strip : bool, optional
+            strip metadata from the frames too
+        timeout : float, optional
+            the timeout for any subprocess calls (in seconds)
+
+        Returns
+        -------
+        stats : fmc.RunStats
+            the statistics of making the frames
+
+        Notes
+        -----
+        Flights are assigned to periods by their date (rather than by their
+        order in the flight log). Each route is drawn in the colour of the
+        first flight along it in the flight log and each country is filled in
+        the colour of the first route to it, so the final frame shows the same
+        routes and countries as :meth:`render`, but each frame draws its new
+        routes and countries on top of those of the earlier frames (so where
+        they overlap they may be stacked in a different order). The density of
+        the great circles cannot be drawn in a time-lapse and the frames are
+        drawn one after another on one figure, therefore the worker processes
+        of the renderer (if ``jobs`` is more than one) are only used to find
+        the great circles.
+        """
+
+        # Import standard modules ...
+        import os
+        import shutil
+
+        # Import special modules ...
+        try:
+            import matplotlib
+            import matplotlib.image
+        except:
+            raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+        try:
+            import numpy
+        except:
+            raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+        try:
+            import PIL
+            import PIL.Image
+        except:
+            raise Exception("\"PIL\" is not installed; run \"pip install --user Pillow\"") from None
+        try:
+            import shapely
+            import shapely.geometry
+        except:
+            raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+        # Import my modules ...
+        try:
+            import pyguymer3
+            import pyguymer3.image
+            import pyguymer3.media
+        except:
+            raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+        # Import sub-functions ...
+        from ._consts import FIGURE_DPI
+        from .FlightLog import FlightLog
+        from .RunStats import RunStats
+        from .calc_pixel_size import calc_pixel_size
+        from .calc_route_distances import calc_route_distances
+        from .draw_map import draw_map
+        from .read_flight_log import read_flight_log
+        from .render_figure import render_figure
+        from .simplify_countries import simplify_countries
+
+        # Create short-hands ...
+        airports = self.airports
+        c0 = self.c0
+        c1 = self.c1
+        debug = self.debug
+        hw = self.hw
+
+        # Populate default values ...
+        if extraCountries is None:
+            extraCountries = []
+        if frameDir is None:
+            frameDir = f'{flightLog.removesuffix(".csv")}.frames'
+        if maxYear is None:
+            maxYear = pyguymer3.now().year
+        if notVisited is None:
+            notVisited = []
+        if renames is None:
+            renames = {}
+        if stats is None:
+            stats = RunStats()
+
+        # Check arguments ...
+        if period not in ("year", "month"):
+            raise ValueError(f"\"{period}\" is not a period") from None
+
+        # Define a function to find the colour of a purpose ...
+        def colour_of(purpose, alpha):
+            if colorByPurpose:
+                match FlightLog.purposeNames[purpose]:
+                    case "business":
+                        return c0 + (alpha,)
+                    case "pleasure":
+                        return c1 + (alpha,)
+                    case _:
+                        pass
+            return (1.0, 0.0, 0.0, alpha)
+
+        # **********************************************************************
+
+        # Read the flight log ...
+        with stats.stage("ingest"):
+            log = read_flight_log(
+                flightLog,
+                  debug = debug,
+                maxYear = maxYear,
+                minYear = minYear,
+                  stats = stats,
+            )
+        minYear = log.minYear
+        codes = log.codes.tolist()
+
+        # Find the airports of all of the flights at once ...
+        with stats.stage("lookup"):
+            rows1, rows2 = log.rows_of_flights(airports)
+
+        # Find the distances of all of the flights at once ...
+        with stats.stage("distance"):
+            dists = calc_route_distances(
+                airports,
+                rows1,
+                rows2,
+                  eps = self.eps,
+                nIter = self.nIter,
+            )                                                                   # [m]
+
+        # Find the period (i.e., the frame) of each flight, the year of each
+        # frame and the name of each frame ...
+        nYears = maxYear + 1 - minYear                                          # [#]
+        if period == "month":
+            periods = (log.years.astype(numpy.int64) - minYear) * 12 + log.months.astype(numpy.int64) - 1
+            frameYears = [minYear + i // 12 for i in range(12 * nYears)]
+            frameNames = [f"{minYear + i // 12:04d}-{1 + i % 12:02d}" for i in range(12 * nYears)]
+        else:
+            periods = log.years.astype(numpy.int64) - minYear
+            frameYears = list(range(minYear, maxYear + 1))
+            frameNames = [f"{year:04d}" for year in frameYears]
+
+        # Find the distance flown in each frame for each purpose ...
+        businessF = numpy.bincount(
+            periods[log.purposes == 1],
+              weights = 1.0e-6 * dists[log.purposes == 1],
+            minlength = len(frameNames),
+        ).tolist()                                                              # [1000 km]
+        pleasureF = numpy.bincount(
+            periods[log.purposes == 2],
+              weights = 1.0e-6 * dists[log.purposes == 2],
+            minlength = len(frameNames),
+        ).tolist()                                                              # [1000 km]
+        totalF = numpy.bincount(
+            periods,
+              weights = 0.001 * dists,
+            minlength = len(frameNames),
+        ).tolist()                                                              # [km]
+
+        # Find the final histograms (which lay the figure out) ...
+        businessX = [year - hw for year in range(minYear, maxYear + 1)]
+        businessY = numpy.bincount(
+            log.years[log.purposes == 1] - minYear,
+              weights = 1.0e-6 * dists[log.purposes == 1],
+            minlength = nYears,
+        ).tolist()                                                              # [1000 km]
+        pleasureX = [year + hw for year in range(minYear, maxYear + 1)]
+        pleasureY = numpy.bincount(
+            log.years[log.purposes == 2] - minYear,
+              weights = 1.0e-6 * dists[log.purposes == 2],
+            minlength = nYears,
+        ).tolist()                                                              # [1000 km]
+
+        # Define a function to create the annotation ...
+        def label_of(total_dist):
+            label = f"You have flown {total_dist:,.1f} km."
+            label += f" You have flown around the Earth {total_dist / (0.001 * pyguymer3.CIRCUMFERENCE_OF_EARTH):,.1f} times."
+            label += f" You have flown to the Moon {total_dist / (0.001 * pyguymer3.EARTH_MOON_DISTANCE):,.1f} times."
+            return label
+
+        # Find the great circle of each unique route ...
+        with stats.stage("greatCircles"):
+            # Find the first flight of each unique route and the first frame
+            # that each unique route is flown in ...
+            # NOTE: Each route is only drawn once, in the colour of the first
+            #       flight along it.
+            lo = numpy.minimum(log.iatas1, log.iatas2).astype(numpy.int64)
+            hi = numpy.maximum(log.iatas1, log.iatas2).astype(numpy.int64)
+            _, firsts, inverse = numpy.unique(
+                lo * len(codes) + hi,
+                return_index = True,
+                return_inverse = True,
+            )
+            starts = numpy.full(firsts.size, len(frameNames), dtype = numpy.int64)
+            numpy.minimum.at(starts, inverse.ravel(), periods)
+            order = numpy.argsort(firsts)
+            firsts = [(codes[log.iatas1[i]], codes[log.iatas2[i]], int(log.purposes[i])) for i in firsts[order].tolist()]
+            starts = starts[order].tolist()
+            stats.uniqueRoutes += len(firsts)
+
+            # Find the codes and coordinates of the airports of each unique
+            # route ...
+            pairs = []
+            for iata1, iata2, _ in firsts:
+                lon1, lat1 = airports.coordinates_of_IATA(iata1)                # [°], [°]
+                lon2, lat2 = airports.coordinates_of_IATA(iata2)                # [°], [°]
+                pairs.append(((iata1, lon1, lat1), (iata2, lon2, lat2)))
+
+            # Create the pool of worker processes (if it is needed and it has
+            # not been created already) ...
+            if self.jobs > 1:
+                self.open_pool()
+
+            # Loop over the different maximum distances between the points
+            # along the great circles on the maps ...
+            # NOTE: The maps which have the same maximum distance share the same
+            #       lists of great circles.
+            maxdists = self.find_maxdists()
+            newRoutesOf = {}
+            for maxdist in sorted(set(maxdists.values())):
+                # Find all of the great circles at once (calculating the ones
+                # which are not in the cache in the pool of worker processes, if
+                # there is one) ...
+                circles = self.gcCache.great_circles(
+                    pairs,
+                        debug = debug,
+                          eps = self.eps,
+                         jobs = self.jobs,
+                      maxdist = maxdist,
+                        nIter = self.nIter,
+                    onlyValid = self.onlyValid,
+                         pool = self.pool,
+                          tol = self.tol,
+                )
+
+                # Group the great circles by the frame that they are first
+                # flown in ...
+                newRoutesOf[maxdist] = [[] for _ in frameNames]
+                for (_, _, purpose), start, lines in zip(firsts, starts, circles, strict = True):
+                    newRoutesOf[maxdist][start].append(
+                        (
+                            shapely.geometry.MultiLineString(lines),
+                            colour_of(purpose, 1.0),
+                        )
+                    )
+            newRoutes = {panel : newRoutesOf[maxdist] for panel, maxdist in maxdists.items()}
+
+        # Find the style of each country and the frame that it is first visited
+        # in ...
+        with stats.stage("countries"):
+            # Find the colour of each country and the first frame that it is
+            # visited in ...
+            # NOTE: The extra countries are visited in every frame.
+            visits = {}
+            for extraCountry in extraCountries:
+                visits[extraCountry] = ((1.0, 0.0, 0.0, 0.25), 0)
+            for (iata1, iata2, purpose), start in zip(firsts, starts, strict = True):
+                for country in (airports.country_of_IATA(iata1), airports.country_of_IATA(iata2)):
+                    colour, first = visits.get(country, (colour_of(purpose, 0.25), start))
+                    visits[country] = (colour, min(first, start))
+
+            # Clean up the list ...
+            # NOTE: The airport database and the country shape database use
+            #       different names for some countries. The user may provide a
+            #       dictionary to rename countries.
+            for country1, country2 in renames.items():
+                if country1 in visits:
+                    visits[country2] = visits[country1]
+                    del visits[country1]
+
+            # Initialize visited list, list of country styles and the
+            # countries which are first visited in each frame ...
+            visited = []
+            styles = []
+            newCountries = [[] for _ in frameNames]
+
+            # Loop over countries ...
+            for i, (neName, _) in enumerate(self.countries):
+                # Outline the country ...
+                styles.append(((0.0, 0.0, 0.0, 0.25), "none"))
+
+                # Check if this country is in the list ...
+                if neName in visits and neName not in notVisited:
+                    # Append country name to visited list ...
+                    visited.append(neName)
+
+                    # Fill the country in from the first frame that it is
+                    # visited in and remove it from the list ...
+                    # NOTE: Removing them from the list enables us to print out
+                    #       the ones that where not found later on.
+                    colour, start = visits[neName]
+                    newCountries[start].append((i, (colour, colour)))
+                    del visits[neName]
+            stats.countriesFilled += len(visited)
+
+        # Collect the keyword arguments which describe the layout of the
+        # frames ...
+        kwargs = {
+            "businessX" : businessX,
+            "businessY" : businessY,
+                "debug" : debug,
+                "label" : label_of(sum(totalF)),
+              "maxYear" : maxYear,
+              "minYear" : minYear,
+            "pleasureX" : pleasureX,
+            "pleasureY" : pleasureY,
+               "styles" : styles,
+        }
+
+        # Find the keyword arguments which describe how to save the frames ...
+        # NOTE: Matplotlib only writes the "Software" metadata to PNG files.
+        saveKwargs = {"dpi" : FIGURE_DPI}
+        if compressLevel is not None:
+            saveKwargs["pil_kwargs"] = {"compress_level" : compressLevel}
+            if strip:
+                saveKwargs["metadata"] = {"Software" : None}
+
+        # Make the frames ...
+        os.makedirs(frameDir, exist_ok = True)
+        frames = []
+        with stats.stage("savefig"):
+            # Create the figure without any great circles or visited countries
+            # and lay it out ...
+            fg = render_figure(
+                ("top", "left", "right", "bottom"),
+                countries = self.countries,
+                     memo = self.memo,
+                    stats = stats,
+                **self.settings,
+                **kwargs,
+            )
+            axT, axL, axR, axB = fg.axes
+            text = axT.texts[-1]
+            businessBars, pleasureBars = axB.containers
+
+            # Fix the limits of the histogram (so that the histogram does not
+            # change scale between frames) ...
+            axB.set_ylim(axB.get_ylim())
+
+            # Draw everything which does not change between frames once and
+            # retain the pixels ...
+            # NOTE: The histogram and the label are drawn on every frame, so
+            #       they are never retained (drawing them on top of themselves
+            #       would darken their anti-aliased edges).
+            axB.set_visible(False)
+            text.set_visible(False)
+            fg.canvas.draw()
+            axB.set_visible(True)
+            text.set_visible(True)
+            retained = fg.canvas.copy_from_bbox(fg.bbox)
+
+            # Find the great circles, the countries and the tolerance of the
+            # simplification of each map panel ...
+            maps = []
+            for panel, ax, fov, name in [
+                ("top", axT, None, "the top map"),
+                ("left", axL, self.leftFov, "the left-hand sub-map"),
+                ("right", axR, self.rightFov, "the right-hand sub-map"),
+            ]:
+                panelCountries = self.countries
+                simp = None
+                if self.lod:
+                    simp = 0.5 * calc_pixel_size(ax) / (pyguymer3.CIRCUMFERENCE_OF_EARTH / 360.0)
+                    panelCountries = simplify_countries(
+                        self.countries,
+                        simp,
+                            cache = self.cache,
+                         cacheDir = self.cacheDir,
+                            debug = debug,
+                             memo = self.memo,
+                        onlyValid = self.onlyValid,
+                           repair = self.repair,
+                            sfile = self.sfile,
+                    )
+                maps.append((ax, fov, name, newRoutes[panel], panelCountries, simp))
+
+            # Initialize the histograms and the total distance ...
+            businessH = [0.0] * nYears                                          # [1000 km]
+            pleasureH = [0.0] * nYears                                          # [1000 km]
+            total_dist = 0.0                                                    # [km]
+
+            # Loop over frames ...
+            for iFrame, (frameYear, frameName) in enumerate(zip(frameYears, frameNames, strict = True)):
+                # Restore the retained pixels of the previous frame ...
+                fg.canvas.restore_region(retained)
+
+                # Check if there is anything new to draw on the maps ...
+                if newRoutes["top"][iFrame] or newCountries[iFrame]:
+                    # Loop over map panels ...
+                    for ax, fov, name, panelNewRoutes, panelCountries, simp in maps:
+                        # Add the great circles and the countries which are
+                        # new in this frame ...
+                        before = set(ax.get_children())
+                        stats.artists += draw_map(
+                            ax,
+                            panelNewRoutes[iFrame],
+                            [panelCountries[i] for i, _ in newCountries[iFrame]],
+                            [style for _, style in newCountries[iFrame]],
+                            clipToFov = self.clipToFov,
+                                debug = debug,
+                                  fov = fov,
+                                 name = f"{name} in {frameName}",
+                                 simp = simp,
+                        )
+
+                        # Draw just the new artists on top of the retained
+                        # pixels ...
+                        for artist in ax.get_children():
+                            if artist not in before:
+                                ax.draw_artist(artist)
+
+                    # Retain the pixels ...
+                    retained = fg.canvas.copy_from_bbox(fg.bbox)
+
+                # Update the histograms and the total distance ...
+                businessH[frameYear - minYear] += businessF[iFrame]             # [1000 km]
+                pleasureH[frameYear - minYear] += pleasureF[iFrame]             # [1000 km]
+                total_dist += totalF[iFrame]                                    # [km]
+                for bar, height in zip(businessBars, businessH, strict = True):
+                    bar.set_height(height)
+                for bar, height in zip(pleasureBars, pleasureH, strict = True):
+                    bar.set_height(height)
+                text.set_text(label_of(total_dist))
+
+                # Draw the histogram and the label ...
+                fg.draw_artist(axB)
+                axT.draw_artist(text)
+
+                # Save frame ...
+                frame = f"{frameDir}/{frameName}.png"
+                if debug:
+                    print(f"DEBUG: Saving \"{frame}\".")
+                matplotlib.image.imsave(
+                    frame,
+                    numpy.asarray(fg.canvas.buffer_rgba()),
+                    **saveKwargs,
+                )
+                frames.append(frame)
+
+        # Optimize the frames (if required) ...
+        # NOTE: Frames which have been compressed in-process are not optimised
+        #       too.
+        if optimise and compressLevel is None:
+            with stats.stage("optimise"):
+                for frame in frames:
+                    pyguymer3.image.optimise_image(
+                        frame,
+                          debug = debug,
+                          strip = strip,
+                        timeout = timeout,
+                    )
+
+        # Make the animation (if required) ...
+        if animation is not None:
+            with stats.stage("animation"):
+                if animation.lower().endswith(".mp4"):
+                    shutil.move(
+                        pyguymer3.media.images2mp4(
+                            frames,
+                              debug = debug,
+                                fps = fps,
+                            timeout = timeout,
+                        ),
+                        animation,
+                    )
+                else:
+                    images = [PIL.Image.open(frame) for frame in frames]
+                    images[0].save(
+                        animation,
+                        append_images = images[1:],
+                             duration = round(1000.0 / fps),
+                                 loop = 0,
+                             save_all = True,
+                    )
+
+        # Print out the countries that were not drawn ...
+        for country in sorted(list(visits.keys())):
+            print(f"\"{country}\" was not drawn.")
+
+        # Print out the countries that have been visited ...
+        for country in sorted(visited):
+            print(f"\"{country}\" has been visited.")
+
+        # Return answer ...
+        return stats
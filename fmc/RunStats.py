@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# Define class ...
+class RunStats:
+    """The statistics of making a PNG map
+
+    This class records the wall time and the CPU time of each stage of making a
+    PNG map (the same stage can be timed more than once, in which case the
+    times are summed) along with some counters, so that a slow render can be
+    attributed to the stage which caused it.
+
+    Attributes
+    ----------
+    artists : int
+        the number of artists created on the maps
+    countriesFilled : int
+        the number of countries which were filled in
+    rowsRead : int
+        the number of rows read from the flight log
+    rowsSkipped : dict of int
+        the number of rows skipped, keyed by the reason (see
+        :attr:`skipReasons`)
+    stages : dict of dict of float
+        the wall time and the CPU time of each stage (in seconds), keyed by the
+        name of the stage (in the order that the stages were first timed)
+    uniqueRoutes : int
+        the number of unique routes
+
+    Notes
+    -----
+    The CPU time is the CPU time of the thread which timed the stage only (so
+    that a stage which is timed whilst other threads are busy, e.g., in an
+    :class:`fmc.Optimiser` or in a concurrent render, is not charged for their
+    work); it does not include the CPU time of any other threads, of any worker
+    processes (e.g., the ones which find the great circles, see
+    :class:`fmc.GreatCircleCache`, or the ones which render the map panels) or
+    of any external programs.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Define the reasons why a row of a flight log is skipped ...
+    skipReasons = (
+        "yearNotFourCharacters",
+        "yearNotDigits",
+        "invalidIATA",
+        "beforeMinYear",
+        "afterMaxYear",
+    )
+
+    # Define function ...
+    def __init__(
+        self,
+        /,
+    ):
+        # Initialize counters ...
+        self.artists = 0                                                        # [#]
+        self.countriesFilled = 0                                                # [#]
+        self.rowsRead = 0                                                       # [#]
+        self.rowsSkipped = dict.fromkeys(self.skipReasons, 0)                   # [#]
+        self.stages = {}
+        self.uniqueRoutes = 0                                                   # [#]
+
+    # Define function ...
+    def stage(
+        self,
+        name,
+        /,
+    ):
+        """Time a stage
+
+        Parameters
+        ----------
+        name : str
+            the name of the stage
+
+        Returns
+        -------
+        timer : contextlib.AbstractContextManager
+            a context manager which adds the wall time and the CPU time (of
+            this thread) of its body to the stage
+        """
+
+        # Import standard modules ...
+        import contextlib
+        import time
+
+        # **********************************************************************
+
+        # Define a function to time the body of the context manager ...
+        @contextlib.contextmanager
+        def timer():
+            t0 = time.perf_counter()
+            c0 = time.thread_time()
+            try:
+                yield
+            finally:
+                times = self.stages.setdefault(name, {"cpu" : 0.0, "wall" : 0.0})
+                times["cpu"] += time.thread_time() - c0                         # [s]
+                times["wall"] += time.perf_counter() - t0                       # [s]
+
+        # Return answer ...
+        return timer()
+
+    # Define function ...
+    def to_dict(
+        self,
+    ):
+        """Convert the statistics to a dictionary
+
+        Returns
+        -------
+        ans : dict
+            the statistics (which can be serialised as JSON)
+        """
+
+        # Return answer ...
+        return {
+                    "artists" : self.artists,
+            "countriesFilled" : self.countriesFilled,
+                   "rowsRead" : self.rowsRead,
+                "rowsSkipped" : dict(self.rowsSkipped),
+                     "stages" : {name : dict(times) for name, times in self.stages.items()},
+               "uniqueRoutes" : self.uniqueRoutes,
+        }
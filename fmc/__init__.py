@@ -8,9 +8,91 @@ the world with all of your flights overlaid and all of the countries that you
 have visited shaded in too.
 """
 
+# Import standard modules ...
+import sys
+import types
+
 # Import sub-functions ...
+from .AirportIndex import AirportIndex
+from .FlightLog import FlightLog
+from .FlightState import FlightState
+from .FlightTally import FlightTally
+from .MemoCache import MemoCache
+from .Optimiser import Optimiser
+from .RenderService import RenderService
+from .RunStats import RunStats
+from .calc_dists_between_many_locs import calc_dists_between_many_locs
+from .calc_flight_distances import calc_flight_distances
+from .calc_pixel_size import calc_pixel_size
+from .calc_route_distances import calc_route_distances
+from .compile_airports import compile_airports
 from .coordinates_of_IATA import coordinates_of_IATA
 from .coordinates_of_ICAO import coordinates_of_ICAO
 from .country_of_IATA import country_of_IATA
 from .country_of_ICAO import country_of_ICAO
-from .run import run
+from .iter_flight_log import iter_flight_log
+from .load_airports import load_airports
+from .read_flight_log import read_flight_log
+from .serve import serve
+from .summarise_flight_logs import summarise_flight_logs
+from .tally_flight_log import tally_flight_log
+from .update_flight_state import update_flight_state
+
+# Define the sub-functions which are only imported when they are first used ...
+# NOTE: These are the sub-functions which need the plotting dependencies (e.g.,
+#       cartopy, matplotlib and pyguymer3), which take a long time to import.
+#       Loading them lazily keeps "import fmc" (and the airport lookups) fast
+#       for short-lived processes.
+_lazy = {
+              "Renderer" : ".Renderer",
+    "calc_great_circles" : ".calc_great_circles",
+         "create_figure" : ".create_figure",
+       "cull_geometries" : ".cull_geometries",
+          "draw_density" : ".draw_density",
+        "draw_histogram" : ".draw_histogram",
+              "draw_map" : ".draw_map",
+        "load_countries" : ".load_countries",
+     "render_base_layer" : ".render_base_layer",
+         "render_figure" : ".render_figure",
+          "render_layer" : ".render_layer",
+                   "run" : ".run",
+              "run_many" : ".run_many",
+    "simplify_countries" : ".simplify_countries",
+}
+
+# Define function ...
+def __getattr__(name):
+    # Import standard modules ...
+    import importlib
+
+    # Check that it is a lazy sub-function ...
+    if name not in _lazy:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    # Import the sub-function and cache it ...
+    # NOTE: Importing the sub-module sets the attribute on this module to the
+    #       sub-function (see "_LazyModule" below).
+    obj = getattr(importlib.import_module(_lazy[name], __name__), name)
+    globals()[name] = obj
+
+    # Return the sub-function ...
+    return obj
+
+# Define function ...
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
+
+# Define class ...
+# NOTE: Importing a sub-module (e.g., from within another sub-function) sets the
+#       attribute on this module to the sub-module, which would hide the lazy
+#       sub-function of the same name from "__getattr__()", therefore, the
+#       class of this module replaces a lazy sub-module with its sub-function
+#       as soon as it is set.
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        if name in _lazy and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+# Use the class for this module ...
+sys.modules[__name__].__class__ = _LazyModule
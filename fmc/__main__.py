@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def main():
+    """The command line interface of FMC
+
+    This function parses the command line arguments and runs the sub-command
+    which they name. The only sub-command is "serve", which serves PNG maps of
+    flight logs over HTTP (see :func:`fmc.serve`).
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import argparse
+
+    # Import sub-functions ...
+    from .serve import serve
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Flight Map Creator",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+                   prog = "fmc",
+    )
+    commands = parser.add_subparsers(
+            dest = "command",
+        required = True,
+    )
+    parserServe = commands.add_parser(
+        "serve",
+           allow_abbrev = False,
+            description = "Serve PNG maps of flight logs over HTTP from a pool of worker processes which keep everything which does not depend on a flight log loaded, with a cache of the PNG maps in memory.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+                   help = "serve PNG maps of flight logs over HTTP",
+    )
+    parserServe.add_argument(
+        "--cache-dir",
+        default = None,
+           dest = "cacheDir",
+           help = "the directory of the on-disk caches (if it is not given then \"~/.cache/fmc\" is used)",
+    )
+    parserServe.add_argument(
+        "--cache-size",
+        default = 256.0,
+           dest = "cacheSize",
+           help = "the maximum total size of the PNG maps in the cache in memory (in MiB)",
+           type = float,
+    )
+    parserServe.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parserServe.add_argument(
+        "--host",
+        default = "127.0.0.1",
+           help = "the address to listen on",
+    )
+    parserServe.add_argument(
+        "--jobs",
+        default = 1,
+           help = "the number of worker processes to make the PNG maps in",
+           type = int,
+    )
+    parserServe.add_argument(
+        "--port",
+        default = 8000,
+           help = "the port to listen on",
+           type = int,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Run the sub-command ...
+    match args.command:
+        case "serve":
+            serve(
+                cacheDir = args.cacheDir,
+                   debug = args.debug,
+                    host = args.host,
+                    jobs = args.jobs,
+                 maxSize = round(args.cacheSize * 1024.0 * 1024.0),
+                    port = args.port,
+            )
+        case _:
+            pass
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.13/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    main()
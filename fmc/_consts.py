@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+# Define the magic bytes, the version number and the header layout of the
+# compiled airport database ...
+# NOTE: The header is followed by 8-byte aligned sections containing (in order):
+#         * the longitudes (little-endian float64);
+#         * the latitudes (little-endian float64);
+#         * the country IDs (little-endian int32);
+#         * the IATA codes (fixed-width, null-padded, UTF-8);
+#         * the ICAO codes (fixed-width, null-padded, UTF-8);
+#         * the offsets of the country names (little-endian int64); and
+#         * the country names (concatenated, UTF-8).
+AIRPORTS_MAGIC = b"FMCAIRDB"
+AIRPORTS_VERSION = 1
+AIRPORTS_HEADER = "<8sIIQQQQQQ"                                                 # magic, version, IATA width, ICAO width, number of rows, number of countries, length of country names, size of source, modification time of source
+
+# Define the configuration that the PNG maps are drawn with (these are passed
+# explicitly to every figure, axis, text and image, so that the global
+# Matplotlib configuration is never used or changed) ...
+AXES_MARGIN = 0.01
+FIGURE_DPI = 300
+FONT_SIZE = 8
+
+# Define the maximum distance between the points along the great circles and
+# the maximum distance between them on a map panel (if the distance is found
+# from the size of a pixel of the map panel) ...
+# NOTE: A chord which is a few pixels long is within about half of a pixel of
+#       the great circle that it approximates (which is the tolerance that the
+#       great circles are simplified to anyway).
+GREAT_CIRCLE_MAXDIST = 12.0 * 1852.0                                            # [m]
+GREAT_CIRCLE_SPACING = 8.0                                                      # [px]
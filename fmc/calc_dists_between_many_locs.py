@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_dists_between_many_locs(
+    lon1_deg,
+    lat1_deg,
+    lon2_deg,
+    lat2_deg,
+    /,
+    *,
+      eps = 1.0e-12,
+    nIter = 100,
+):
+    """Calculate the distances between many pairs of coordinates.
+
+    This function reads in arrays of pairs of coordinates (in degrees) on the
+    surface of the Earth and calculates the Geodesic distances (in metres)
+    between them. It is a vectorised version of
+    :func:`pyguymer3.geo.calc_dist_between_two_locs`, with the same convergence
+    semantics: each pair is iterated until its own lambda has converged and an
+    exception is raised if any pair has not converged after ``nIter``
+    iterations.
+
+    Parameters
+    ----------
+    lon1_deg : numpy.ndarray
+        the longitudes of the first coordinates (in degrees)
+    lat1_deg : numpy.ndarray
+        the latitudes of the first coordinates (in degrees)
+    lon2_deg : numpy.ndarray
+        the longitudes of the second coordinates (in degrees)
+    lat2_deg : numpy.ndarray
+        the latitudes of the second coordinates (in degrees)
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+
+    Returns
+    -------
+    s_m : numpy.ndarray
+        the distances between the pairs of coordinates (in metres)
+
+    Notes
+    -----
+    This function uses `Vincenty's formulae
+    <https://en.wikipedia.org/wiki/Vincenty%27s_formulae>`_ ; there is a
+    `JavaScript implementation
+    <https://www.movable-type.co.uk/scripts/latlong-vincenty.html>`_ online too.
+
+    ``lambda`` is a reserved word in Python so I use ``lam`` as my variable name
+    instead.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # **************************************************************************
+
+    # Convert to arrays ...
+    lon1_deg = numpy.asarray(lon1_deg, dtype = numpy.float64)                   # [°]
+    lat1_deg = numpy.asarray(lat1_deg, dtype = numpy.float64)                   # [°]
+    lon2_deg = numpy.asarray(lon2_deg, dtype = numpy.float64)                   # [°]
+    lat2_deg = numpy.asarray(lat2_deg, dtype = numpy.float64)                   # [°]
+
+    # Initialize answer ...
+    s = numpy.zeros(lon1_deg.shape, dtype = numpy.float64)                      # [m]
+
+    # Skip if the start- and end-points are the same ...
+    todo = numpy.flatnonzero((lon1_deg != lon2_deg) | (lat1_deg != lat2_deg))
+    if todo.size == 0:
+        return s
+
+    # Convert to radians ...
+    lon1 = numpy.radians(lon1_deg.ravel()[todo])                                # [rad]
+    lat1 = numpy.radians(lat1_deg.ravel()[todo])                                # [rad]
+    lon2 = numpy.radians(lon2_deg.ravel()[todo])                                # [rad]
+    lat2 = numpy.radians(lat2_deg.ravel()[todo])                                # [rad]
+
+    # Set constants ...
+    a = 6378137.0                                                               # [m]
+    f = 1.0 / 298.257223563
+    b = (1.0 - f) * a                                                           # [m]
+    l = lon2 - lon1                                                             # [rad]
+    u1 = numpy.arctan((1.0 - f) * numpy.tan(lat1))                              # [rad]
+    u2 = numpy.arctan((1.0 - f) * numpy.tan(lat2))                              # [rad]
+    sin_u1 = numpy.sin(u1)
+    cos_u1 = numpy.cos(u1)
+    sin_u2 = numpy.sin(u2)
+    cos_u2 = numpy.cos(u2)
+
+    # Set initial value of lambda and initialize the final values of the
+    # iterated quantities ...
+    lam = l.copy()
+    sin_sigma = numpy.zeros(todo.size, dtype = numpy.float64)
+    cos_sigma = numpy.zeros(todo.size, dtype = numpy.float64)
+    sigma = numpy.zeros(todo.size, dtype = numpy.float64)
+    cosSq_alpha = numpy.zeros(todo.size, dtype = numpy.float64)
+    cos_two_sigma_m = numpy.zeros(todo.size, dtype = numpy.float64)
+    coincident = numpy.zeros(todo.size, dtype = bool)
+
+    # Initialize the pairs which are still being iterated ...
+    active = numpy.arange(todo.size)
+
+    # Loop over iterations ...
+    with numpy.errstate(divide = "ignore", invalid = "ignore"):
+        for iIter in range(1, nIter + 1):
+            # Calculate new lambda for the pairs which are still being
+            # iterated ...
+            lamA = lam[active]
+            sin_sigmaA = numpy.hypot(
+                cos_u2[active] * numpy.sin(lamA),
+                cos_u1[active] * sin_u2[active] - sin_u1[active] * cos_u2[active] * numpy.cos(lamA)
+            )
+            cos_sigmaA = sin_u1[active] * sin_u2[active] + cos_u1[active] * cos_u2[active] * numpy.cos(lamA)
+            sigmaA = numpy.arctan2(
+                sin_sigmaA,
+                cos_sigmaA
+            )
+            sin_alphaA = cos_u1[active] * cos_u2[active] * numpy.sin(lamA) / sin_sigmaA
+            cosSq_alphaA = 1.0 - sin_alphaA ** 2
+            cos_two_sigma_mA = cos_sigmaA - 2.0 * sin_u1[active] * sin_u2[active] / cosSq_alphaA
+            cos_two_sigma_mA[~numpy.isfinite(cos_two_sigma_mA)] = 0.0           # NOTE: equatorial line
+            c = f * cosSq_alphaA * (4.0 + f * (4.0 - 3.0 * cosSq_alphaA)) / 16.0
+            lamNew = l[active] + (1.0 - c) * f * sin_alphaA * (sigmaA + c * sin_sigmaA * (cos_two_sigma_mA + c * cos_sigmaA * (2.0 * cos_two_sigma_mA ** 2 - 1.0)))
+
+            # Save the iterated quantities ...
+            lam[active] = lamNew
+            sin_sigma[active] = sin_sigmaA
+            cos_sigma[active] = cos_sigmaA
+            sigma[active] = sigmaA
+            cosSq_alpha[active] = cosSq_alphaA
+            cos_two_sigma_m[active] = cos_two_sigma_mA
+
+            # Find the pairs which have finished, either because they are
+            # co-incident points or because they have converged (only checking
+            # the solution after at least 3 function calls) ...
+            done = sin_sigmaA == 0.0
+            coincident[active[done]] = True
+            if iIter >= 3:
+                done |= lamNew == lamA
+                done |= numpy.abs(lamNew - lamA) / numpy.abs(lamNew) <= eps
+
+            # Stop iterating the pairs which have finished ...
+            active = active[~done]
+            if active.size == 0:
+                break
+
+    # Check that all of the pairs converged ...
+    if active.size > 0:
+        i = todo[active[0]]
+        raise Exception(f"failed to converge; loc1 = ({lon1_deg.ravel()[i]:+.9f}°,{lat1_deg.ravel()[i]:+.9f}°); loc2 = ({lon2_deg.ravel()[i]:+.9f}°,{lat2_deg.ravel()[i]:+.9f}°); eps = {eps:.15e}; nIter = {nIter:,d}") from None
+
+    # Calculate ellipsoidal distances ...
+    uSq = cosSq_alpha * (a ** 2 - b ** 2) / b ** 2
+    bigA = 1.0 + uSq * (4096.0 + uSq * (-768.0 + uSq * (320.0 - 175.0 * uSq))) / 16384.0
+    bigB = uSq * (256.0 + uSq * (-128.0 + uSq * (74.0 - 47.0 * uSq))) / 1024.0
+    delta_sigma = bigB * sin_sigma * (cos_two_sigma_m + 0.25 * bigB * (cos_sigma * (2.0 * cos_two_sigma_m ** 2 - 1.0) - bigB * cos_two_sigma_m * (4.0 * sin_sigma ** 2 - 3.0) * (4.0 * cos_two_sigma_m ** 2 - 3.0) / 6.0))
+    ans = b * bigA * (sigma - delta_sigma)                                      # [m]
+    ans[coincident] = 0.0                                                       # [m]
+
+    # Return answer ...
+    s.ravel()[todo] = ans                                                       # [m]
+    return s
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_flight_distances(
+    airports,
+    iatas1,
+    iatas2,
+    /,
+    *,
+      eps = 1.0e-12,
+    nIter = 100,
+):
+    """Calculate the distances of many flights
+
+    This function finds the rows of the airports of a list of flights and then
+    calculates the distances of the flights (see
+    :func:`fmc.calc_route_distances`).
+
+    Parameters
+    ----------
+    airports : list, fmc.AirportIndex
+        the list of all of the airports (or an index of them)
+    iatas1 : sequence of str
+        the IATA codes of the departure airports of the flights
+    iatas2 : sequence of str
+        the IATA codes of the arrival airports of the flights
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+
+    Returns
+    -------
+    dists : numpy.ndarray
+        the distances of the flights (in metres)
+
+    Notes
+    -----
+    Each unique route is calculated in one direction only (from the airport
+    which appears first in the index), therefore, the distances agree with
+    those from :func:`pyguymer3.geo.calc_dist_between_two_locs` to within
+    rounding (which is better than 1 mm per flight).
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import sub-functions ...
+    from .AirportIndex import AirportIndex
+    from .calc_route_distances import calc_route_distances
+
+    # **************************************************************************
+
+    # Index the airports (if they have not been already) ...
+    if not isinstance(airports, AirportIndex):
+        airports = AirportIndex(airports)
+
+    # Return answer ...
+    return calc_route_distances(
+        airports,
+        airports.rows_of_IATAs(iatas1),
+        airports.rows_of_IATAs(iatas2),
+          eps = eps,
+        nIter = nIter,
+    )                                                                           # [m]
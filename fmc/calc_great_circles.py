@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_great_circles(
+    pairs,
+    /,
+    *,
+        debug = __debug__,
+          eps = 1.0e-12,
+      maxdist = 12.0 * 1852.0,
+        nIter = 100,
+    onlyValid = True,
+          tol = 1.0e-10,
+):
+    """Calculate the great circles between many pairs of airports
+
+    This function calculates the great circle between each pair of airports
+    and returns the lines of each one as the WKB of a MultiLineString, so that
+    it can be called in a worker process and the answers can be cheaply sent
+    back to (and cached by) the main process.
+
+    Parameters
+    ----------
+    pairs : list of tuple of tuple of str, float, float
+        the code, the longitude (in degrees) and the latitude (in degrees) of
+        the first airport and of the second airport of each pair
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    maxdist : float, optional
+        the maximum distance between points along the great circle (in metres)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid LineStrings
+    tol : float, optional
+        the Euclidean distance that defines two points as being the same (in
+        degrees)
+
+    Returns
+    -------
+    wkbs : list of bytes
+        the WKB of the lines of each great circle (in the same order)
+
+    Notes
+    -----
+    Each great circle is always calculated from the airport with the lowest
+    code to the airport with the highest code, so that it does not depend on
+    the direction of the flight (or on which process calculated it).
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Initialize list ...
+    wkbs = []
+
+    # Loop over pairs ...
+    for loc1, loc2 in pairs:
+        # Find the great circle ...
+        loc1, loc2 = sorted([loc1, loc2])
+        circle = pyguymer3.geo.great_circle(
+            loc1[1],
+            loc1[2],
+            loc2[1],
+            loc2[2],
+              debug = debug,
+                eps = eps,
+            maxdist = maxdist,
+              nIter = nIter,
+             npoint = None,
+        )
+        lines = pyguymer3.geo.extract_lines(
+            circle,
+            onlyValid = onlyValid,
+        )
+
+        # Save the lines as WKB ...
+        wkbs.append(shapely.to_wkb(shapely.geometry.MultiLineString(lines)))
+
+    # Return answer ...
+    return wkbs
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_pixel_size(
+    ax,
+    /,
+):
+    """Calculate the size of a pixel of a map axis
+
+    This function calculates the ground distance covered by one pixel of a map
+    axis at the resolution of its figure, from the limits of the axis in the
+    (metric) projected coordinates and from the size of the axis in pixels.
+    The figure must already be laid out.
+
+    Parameters
+    ----------
+    ax : cartopy.mpl.geoaxes.GeoAxes
+        the axis
+
+    Returns
+    -------
+    size : float
+        the size of a pixel (in metres)
+
+    Notes
+    -----
+    The size is measured in the projected coordinates, therefore it is the
+    size of a pixel at the point (or along the line) where the projection is
+    true to scale.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Find the extent of the axis in the projected coordinates ...
+    x0, x1 = ax.get_xlim()                                                      # [m]
+    y0, y1 = ax.get_ylim()                                                      # [m]
+
+    # Return answer ...
+    return max(
+        abs(x1 - x0) / ax.bbox.width,
+        abs(y1 - y0) / ax.bbox.height,
+    )                                                                           # [m/px]
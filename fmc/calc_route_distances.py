@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_route_distances(
+    airports,
+    rows1,
+    rows2,
+    /,
+    *,
+      eps = 1.0e-12,
+    nIter = 100,
+):
+    """Calculate the distances of many flights between rows of an airport index
+
+    This function converts each flight to an unordered route, calculates the
+    distance of each unique route once (using a vectorised Vincenty formula)
+    and then scatters the distances back to the flights.
+
+    Parameters
+    ----------
+    airports : fmc.AirportIndex
+        the index of the airports
+    rows1 : numpy.ndarray
+        the rows of the departure airports of the flights
+    rows2 : numpy.ndarray
+        the rows of the arrival airports of the flights
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+
+    Returns
+    -------
+    dists : numpy.ndarray
+        the distances of the flights (in metres)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calc_dists_between_many_locs import calc_dists_between_many_locs
+
+    # **************************************************************************
+
+    # Convert each flight to an unordered route ...
+    rows1 = numpy.asarray(rows1, dtype = numpy.int64)
+    rows2 = numpy.asarray(rows2, dtype = numpy.int64)
+    if rows1.size == 0:
+        return numpy.zeros(0, dtype = numpy.float64)                            # [m]
+    lo = numpy.minimum(rows1, rows2)
+    hi = numpy.maximum(rows1, rows2)
+
+    # Find the unique routes ...
+    routes, inverse = numpy.unique(
+        lo * airports.lons.size + hi,
+        return_inverse = True,
+    )
+    lo = routes // airports.lons.size
+    hi = routes % airports.lons.size
+
+    # Calculate the distance of each unique route ...
+    dists = calc_dists_between_many_locs(
+        airports.lons[lo],
+        airports.lats[lo],
+        airports.lons[hi],
+        airports.lats[hi],
+          eps = eps,
+        nIter = nIter,
+    )                                                                           # [m]
+
+    # Return answer ...
+    return dists[inverse.ravel()]                                               # [m]
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def compile_airports(
+    dbFile,
+    binFile,
+    /,
+    *,
+    debug = __debug__,
+):
+    """Compile the airport database
+
+    This function reads in the JSON airport database, indexes it and writes out
+    a compact binary form of it which can be memory-mapped by
+    :func:`fmc.load_airports`.
+
+    Parameters
+    ----------
+    dbFile : str
+        the JSON airport database
+    binFile : str
+        the compiled airport database
+    debug : bool, optional
+        print debug messages
+
+    Notes
+    -----
+    The compiled airport database records the size and the modification time of
+    the JSON airport database that it was compiled from, so that
+    :func:`fmc.load_airports` can tell when it is stale. The file is written
+    atomically, so a reader never sees a partially written file.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+    import struct
+    import tempfile
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from ._consts import AIRPORTS_HEADER, AIRPORTS_MAGIC, AIRPORTS_VERSION
+    from .AirportIndex import AirportIndex
+
+    # **************************************************************************
+
+    # Find out about the source ...
+    stat = os.stat(dbFile)
+
+    # Load airport list and index it ...
+    with open(dbFile, mode = "rt", encoding = "utf-8") as fObj:
+        airports = AirportIndex(json.load(fObj))
+    lons, lats, countryIDs, countryNames, iatas, icaos = airports.to_columns()
+
+    # Convert the codes to fixed-width columns and the country names to a table
+    # of offsets into a single blob ...
+    iatas = [iata.encode("utf-8") for iata in iatas]
+    icaos = [icao.encode("utf-8") for icao in icaos]
+    iataWidth = max(1, max(len(iata) for iata in iatas))
+    icaoWidth = max(1, max(len(icao) for icao in icaos))
+    iatas = numpy.array(iatas, dtype = f"S{iataWidth:d}")
+    icaos = numpy.array(icaos, dtype = f"S{icaoWidth:d}")
+    countryNames = [countryName.encode("utf-8") for countryName in countryNames]
+    countryOffsets = numpy.zeros(len(countryNames) + 1, dtype = "<i8")
+    countryOffsets[1:] = numpy.cumsum([len(countryName) for countryName in countryNames])
+    countryBlob = b"".join(countryNames)
+
+    if debug:
+        print(f"INFO: Compiling {lons.size:,d} rows and {len(countryNames):,d} countries from \"{dbFile}\" to \"{binFile}\".")
+
+    # Create the file next to the destination and then move it into place ...
+    with tempfile.NamedTemporaryFile(
+          mode = "wb",
+        delete = False,
+           dir = os.path.dirname(os.path.abspath(binFile)),
+        prefix = ".",
+        suffix = ".tmp",
+    ) as fObj:
+        try:
+            # Write header ...
+            fObj.write(
+                struct.pack(
+                    AIRPORTS_HEADER,
+                    AIRPORTS_MAGIC,
+                    AIRPORTS_VERSION,
+                    iataWidth,
+                    icaoWidth,
+                    lons.size,
+                    len(countryNames),
+                    len(countryBlob),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                )
+            )
+
+            # Write sections (padding each one to a multiple of 8 bytes) ...
+            for section in [
+                numpy.ascontiguousarray(lons, dtype = "<f8").tobytes(),
+                numpy.ascontiguousarray(lats, dtype = "<f8").tobytes(),
+                numpy.ascontiguousarray(countryIDs, dtype = "<i4").tobytes(),
+                iatas.tobytes(),
+                icaos.tobytes(),
+                countryOffsets.tobytes(),
+                countryBlob,
+            ]:
+                fObj.write(section)
+                fObj.write(b"\x00" * (-len(section) % 8))
+        except:
+            os.remove(fObj.name)
+            raise
+
+    # Make the file readable by everyone (temporary files are only readable by
+    # their owner, but the compiled airport database may be shared by everyone
+    # who can read the JSON airport database) and then move it into place ...
+    # NOTE: The permissions are fixed, rather than derived from the umask,
+    #       because reading the umask changes it (for every thread in the
+    #       process) until it is set back.
+    try:
+        os.chmod(fObj.name, 0o644)
+        os.replace(fObj.name, binFile)
+    except:
+        os.remove(fObj.name)
+        raise
@@ -10,8 +10,8 @@ def country_of_ICAO(
 
     Parameters
     ----------
-    airports : list
-        the list of all of the airports
+    airports : list, fmc.AirportIndex
+        the list of all of the airports (or an index of them)
     icao : str
         the ICAO code of the desired airport
 
@@ -29,11 +29,18 @@ def country_of_ICAO(
     .. [1] FMC, https://github.com/Guymer/fmc
     """
 
+    # Import sub-functions ...
+    from .AirportIndex import AirportIndex
+
     # **************************************************************************
 
+    # Use the index (if it has been provided) ...
+    if isinstance(airports, AirportIndex):
+        return airports.country_of_ICAO(icao)
+
     # Catch special cases ...
-    if icao == "EDDT":                  # This airport closed on 4/May/2021.
-        return "Germany"
+    if icao in AirportIndex.overrides["ICAO"]:
+        return AirportIndex.overrides["ICAO"][icao][2]
 
     # Loop over all airports ...
     for airport in airports:
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def create_figure(
+    *,
+        debug = __debug__,
+          eps = 1.0e-12,
+     leftDist = 2392.7e3,
+      leftFov = None,
+      leftLat = +39.517,
+      leftLon = -97.763,
+        nIter = 100,
+    onlyValid = True,
+       panels = ("top", "left", "right"),
+       repair = True,
+    rightDist = 2346.6e3,
+     rightFov = None,
+     rightLat = +49.901,
+     rightLon =  +3.156,
+          tol = 1.0e-10,
+):
+    """Create the figure and the axes of a PNG map
+
+    This function creates the figure, the three map axes and the histogram
+    axis. The map axes which are listed in ``panels`` get their coastlines,
+    gridlines and backgrounds; the others are created empty (which is enough
+    to lay out the figure). The resolution of the figure is set explicitly, so
+    that the global Matplotlib configuration is not used.
+
+    Parameters
+    ----------
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    leftDist : float, optional
+        the field-of-view around the left-hand sub-map central point (in metres)
+    leftFov : shapely.geometry.polygon.Polygon, optional
+        the field-of-view of the left-hand sub-map (in degrees)
+    leftLat : float, optional
+        the latitude of the central point of the left-hand sub-map (in degrees)
+    leftLon : float, optional
+        the longitude of the central point of the left-hand sub-map (in degrees)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    panels : tuple of str, optional
+        the map axes to decorate (any of "top", "left" and "right")
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    rightDist : float, optional
+        the field-of-view around the right-hand sub-map central point (in metres)
+    rightFov : shapely.geometry.polygon.Polygon, optional
+        the field-of-view of the right-hand sub-map (in degrees)
+    rightLat : float, optional
+        the latitude of the central point of the right-hand sub-map (in degrees)
+    rightLon : float, optional
+        the longitude of the central point of the right-hand sub-map (in degrees)
+    tol : float, optional
+        the Euclidean distance that defines two points as being the same (in
+        degrees)
+
+    Returns
+    -------
+    fg : matplotlib.figure.Figure
+        the figure
+    axT : cartopy.mpl.geoaxes.GeoAxes
+        the top map axis
+    axL : cartopy.mpl.geoaxes.GeoAxes
+        the left-hand sub-map axis
+    axR : cartopy.mpl.geoaxes.GeoAxes
+        the right-hand sub-map axis
+    axB : matplotlib.axes.Axes
+        the histogram axis
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import special modules ...
+    try:
+        import cartopy
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+        import matplotlib.backends.backend_agg
+        import matplotlib.figure
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from ._consts import FIGURE_DPI
+
+    # **************************************************************************
+
+    # Create figure ...
+    # NOTE: I would like to use (4.8, 7.2) so as to be consistent with all my
+    #       other figures (see linked 4K discussion above), however, the result
+    #       is very poor due to the too wide, single line, summary label/string.
+    #       The result gets even worse when ".tight_layout()" is called.
+    # NOTE: The figure is not registered with the pyplot figure manager, so
+    #       that it can be created, drawn and saved in any thread.
+    fg = matplotlib.figure.Figure(
+        figsize = (2 * 4.8, 2 * 7.2),
+            dpi = FIGURE_DPI,
+    )
+    matplotlib.backends.backend_agg.FigureCanvasAgg(fg)
+
+    # Create axes ...
+    axT = pyguymer3.geo.add_axis(
+        fg,
+        add_coastlines = "top" in panels,
+         add_gridlines = "top" in panels,
+                 debug = debug,
+                   eps = eps,
+                   fov = pyguymer3.EARTH,
+                 index = (1, 2),
+                 ncols = 2,
+                 nIter = nIter,
+                 nrows = 3,
+             onlyValid = onlyValid,
+                repair = repair,
+                   tol = tol,
+    )
+    axL = pyguymer3.geo.add_axis(
+        fg,
+          add_coastlines = "left" in panels,
+           add_gridlines = "left" in panels,
+                   debug = debug,
+                    dist = leftDist,
+                     eps = eps,
+                     fov = leftFov,
+                   index = 3,
+                     lat = leftLat,
+                     lon = leftLon,
+                   ncols = 2,
+                   nIter = nIter,
+                   nrows = 3,
+               onlyValid = onlyValid,
+                  repair = repair,
+        satellite_height = False,
+                     tol = tol,
+    )
+    axR = pyguymer3.geo.add_axis(
+        fg,
+          add_coastlines = "right" in panels,
+           add_gridlines = "right" in panels,
+                   debug = debug,
+                    dist = rightDist,
+                     eps = eps,
+                     fov = rightFov,
+                   index = 4,
+                     lat = rightLat,
+                     lon = rightLon,
+                   ncols = 2,
+                   nIter = nIter,
+                   nrows = 3,
+               onlyValid = onlyValid,
+                  repair = repair,
+        satellite_height = False,
+                     tol = tol,
+    )
+    axB = fg.add_subplot(
+        3,
+        2,
+        (5, 6),
+    )
+
+    # Configure axis (top) ...
+    # NOTE: I am explicitly setting the regrid shape based off the resolution
+    #       and the size of (the axis within) the figure, as well as a safety
+    #       factor (remembering Nyquist).
+    if "top" in panels:
+        pyguymer3.geo.add_map_background(
+            axT,
+                    debug = debug,
+            interpolation = "gaussian",
+             regrid_shape = (
+                round(2.0 * fg.get_figwidth() * fg.get_dpi()),
+                round(2.0 * (fg.get_figheight() / 3.0) * fg.get_dpi()),
+            ),
+                 resample = False,
+                  subName = "large8192px",
+        )
+
+    # Configure axis (left) ...
+    # NOTE: I am explicitly setting the regrid shape based off the resolution
+    #       and the size of (the axis within) the figure, as well as a safety
+    #       factor (remembering Nyquist).
+    if "left" in panels:
+        pyguymer3.geo.add_map_background(
+            axL,
+                    debug = debug,
+            interpolation = "gaussian",
+             regrid_shape = (
+                round(2.0 * (fg.get_figwidth() / 2.0) * fg.get_dpi()),
+                round(2.0 * (fg.get_figheight() / 3.0) * fg.get_dpi()),
+            ),
+                 resample = False,
+                  subName = "large8192px",
+        )
+
+    # Configure axis (right) ...
+    # NOTE: I am explicitly setting the regrid shape based off the resolution
+    #       and the size of (the axis within) the figure, as well as a safety
+    #       factor (remembering Nyquist).
+    if "right" in panels:
+        pyguymer3.geo.add_map_background(
+            axR,
+                    debug = debug,
+            interpolation = "gaussian",
+             regrid_shape = (
+                round(2.0 * (fg.get_figwidth() / 2.0) * fg.get_dpi()),
+                round(2.0 * (fg.get_figheight() / 3.0) * fg.get_dpi()),
+            ),
+                 resample = False,
+                  subName = "large8192px",
+        )
+
+    # Return answer ...
+    return fg, axT, axL, axR, axB
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def cull_geometries(
+    geoms,
+    fov,
+    /,
+    *,
+     clip = False,
+    debug = __debug__,
+     name = "the axis",
+):
+    """Cull the geometries which are outside of a field-of-view
+
+    This function builds a spatial index of the geometries and only returns the
+    ones which intersect the field-of-view, so that an axis which only shows a
+    small part of the world does not have to project and clip everything.
+
+    Parameters
+    ----------
+    geoms : list of shapely.geometry.base.BaseGeometry
+        the geometries (in degrees)
+    fov : shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon
+        the field-of-view (in degrees)
+    clip : bool, optional
+        clip the geometries to the field-of-view too
+    debug : bool, optional
+        print debug messages
+    name : str, optional
+        a description of the axis (only used in debug messages)
+
+    Returns
+    -------
+    keep : numpy.ndarray
+        the (sorted) indices of the geometries which intersect the field-of-view
+    kept : list of shapely.geometry.base.BaseGeometry
+        the geometries which intersect the field-of-view (clipped to it, if
+        requested)
+
+    Notes
+    -----
+    When clipping, any parts of the intersection which have a lower dimension
+    than the geometry (e.g., the Point where a LineString just touches the edge
+    of the field-of-view) are discarded.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # **************************************************************************
+
+    # Find the geometries which intersect the field-of-view ...
+    tree = shapely.STRtree(geoms)
+    keep = numpy.sort(tree.query(fov, predicate = "intersects"))
+    kept = [geoms[i] for i in keep]
+
+    if debug:
+        print(f"DEBUG: Kept {keep.size:,d} and culled {len(geoms) - keep.size:,d} of {len(geoms):,d} geometries for {name}.")
+
+    # Clip the geometries (if required) ...
+    if clip:
+        for i, clipped in enumerate(shapely.intersection(kept, fov)):
+            dim = shapely.get_dimensions(kept[i])
+            parts = [part for part in shapely.get_parts(clipped) if shapely.get_dimensions(part) == dim]
+            match dim:
+                case 1:
+                    kept[i] = shapely.geometry.MultiLineString(parts)
+                case 2:
+                    kept[i] = shapely.geometry.MultiPolygon(parts)
+                case _:
+                    kept[i] = shapely.geometry.MultiPoint(parts)
+
+    # Return answer ...
+    return keep, kept
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def draw_density(
+    ax,
+    lines,
+    /,
+    *,
+     batch = 1000000,
+      cmap = "plasma",
+     debug = __debug__,
+      name = "the axis",
+    sample = 0.5,
+):
+    """Draw the density of great circles on a map axis
+
+    This function simplifies the great circles (to a fraction of the size of a
+    pixel of the axis), projects all of their vertices into the coordinates of
+    the axis at once, splits the segments between them until each one is only
+    a few pixels long, samples the segments in pixels and counts how many great
+    circles cross each pixel of the axis (each great circle is counted once per
+    pixel that it crosses). The counts are then drawn as a single image with a
+    logarithmic colour scale, so that the cost of drawing the map grows with
+    the number of pixels rather than with the number of great circles (and so
+    that busy routes stand out rather than merging into one solid smear).
+
+    Parameters
+    ----------
+    ax : cartopy.mpl.geoaxes.GeoAxes
+        the axis
+    lines : list of shapely.geometry.multilinestring.MultiLineString
+        the great circles
+    batch : int, optional
+        the maximum number of samples to project at once (which limits the
+        memory used)
+    cmap : str, optional
+        the colour map of the counts
+    debug : bool, optional
+        print debug messages
+    name : str, optional
+        a description of the axis (only used in debug messages)
+    sample : float, optional
+        the tolerance of the simplification and the spacing between the samples
+        along the great circles (as a fraction of the size of a pixel of the
+        axis)
+
+    Returns
+    -------
+    artists : int
+        the number of artists created
+
+    Notes
+    -----
+    The figure must already be laid out.
+
+    A segment which is a straight line in longitude and latitude is not a
+    straight line on the axis (e.g., a meridian on a Robinson projection),
+    therefore the segments are split in longitude and latitude (and the new
+    vertices are projected) until they are short enough to be sampled along a
+    straight line in pixels. A segment which is still long on the axis once it
+    is shorter than a pixel on the ground jumps across the edge of the
+    projection and is not drawn. A segment which has an end that cannot be
+    projected (e.g., on the far side of an orthographic projection) is split
+    too, until it is only a few pixels long on the ground, so that the part of
+    it which can be projected is drawn.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import special modules ...
+    try:
+        import cartopy
+        import cartopy.crs
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+        import matplotlib.colors
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from ._consts import GREAT_CIRCLE_SPACING
+    from .calc_pixel_size import calc_pixel_size
+
+    # **************************************************************************
+
+    # Check that there are great circles to draw ...
+    if len(lines) == 0:
+        return 0
+
+    # Find the extent and the size (in pixels) of the axis ...
+    x0, x1 = ax.get_xlim()                                                      # [m]
+    y0, y1 = ax.get_ylim()                                                      # [m]
+    nx = max(1, round(ax.bbox.width))                                           # [px]
+    ny = max(1, round(ax.bbox.height))                                          # [px]
+
+    # Find the size of a pixel of the axis ...
+    degree = calc_pixel_size(ax) / (pyguymer3.CIRCUMFERENCE_OF_EARTH / 360.0)  # [°/px]
+
+    # Split the great circles into LineStrings and simplify them to a fraction
+    # of the size of a pixel of the axis ...
+    parts, route = shapely.get_parts(
+        numpy.array(lines, dtype = object),
+        return_index = True,
+    )
+    parts = shapely.simplify(
+        parts,
+        sample * degree,
+        preserve_topology = False,
+    )
+
+    # Project all of the vertices into the coordinates of the axis at once and
+    # convert them to pixels ...
+    coords, part = shapely.get_coordinates(
+        parts,
+        return_index = True,
+    )                                                                           # [°]
+    points = ax.projection.transform_points(
+        cartopy.crs.Geodetic(),
+        coords[:, 0],
+        coords[:, 1],
+    )                                                                           # [m]
+    px = (points[:, 0] - x0) * nx / (x1 - x0)                                   # [px]
+    py = (points[:, 1] - y0) * ny / (y1 - y0)                                   # [px]
+
+    # Find the segments between consecutive vertices of the same LineString ...
+    seg = numpy.flatnonzero(part[:-1] == part[1:])
+    lon0 = coords[seg, 0]                                                       # [°]
+    lat0 = coords[seg, 1]                                                       # [°]
+    lon1 = coords[seg + 1, 0]                                                   # [°]
+    lat1 = coords[seg + 1, 1]                                                   # [°]
+    px0 = px[seg]                                                               # [px]
+    py0 = py[seg]                                                               # [px]
+    px1 = px[seg + 1]                                                           # [px]
+    py1 = py[seg + 1]                                                           # [px]
+    segRoute = route[part[seg]]
+
+    # Split the segments which are too long in half (in longitude and
+    # latitude) until they are all short enough ...
+    # NOTE: Each piece remembers the segment that it was split from and where
+    #       along it that it starts, so that the pieces of the segments of
+    #       each great circle can be put back in order once they are all short
+    #       enough (and so that only the pieces which are still too long need
+    #       to be split again).
+    keep = []
+    index = numpy.arange(seg.size)
+    where = numpy.zeros(seg.size)                                               # [#]
+    width = 1.0                                                                 # [#]
+    while True:
+        # Find the length of each segment on the axis (which is not finite if
+        # either end of it cannot be projected) and on the ground ...
+        length = numpy.maximum(numpy.abs(px1 - px0), numpy.abs(py1 - py0))     # [px]
+        angle = numpy.maximum(numpy.abs(lon1 - lon0), numpy.abs(lat1 - lat0))  # [°]
+        good = numpy.isfinite(length)
+
+        # Keep the segments which are short enough and split the segments
+        # which are too long (and the segments which cannot be projected but
+        # which are long enough that part of them might be) ...
+        # NOTE: A segment which is still too long on the axis once it is
+        #       shorter than a pixel on the ground jumps across the edge of the
+        #       projection and is skipped.
+        short = good & (length <= GREAT_CIRCLE_SPACING)
+        long = good & (length > GREAT_CIRCLE_SPACING) & (angle > degree)
+        long |= ~good & (angle > GREAT_CIRCLE_SPACING * degree)
+        keep.append((index[short], where[short], px0[short], py0[short], px1[short], py1[short], length[short]))
+        if not long.any():
+            break
+        index = numpy.repeat(index[long], 2)
+        where = numpy.repeat(where[long], 2)                                    # [#]
+        where[1::2] += 0.5 * width                                              # [#]
+        width *= 0.5                                                            # [#]
+
+        # Find the midpoint of each segment which is too long and project
+        # them ...
+        lonM = 0.5 * (lon0[long] + lon1[long])                                  # [°]
+        latM = 0.5 * (lat0[long] + lat1[long])                                  # [°]
+        points = ax.projection.transform_points(
+            cartopy.crs.Geodetic(),
+            lonM,
+            latM,
+        )                                                                       # [m]
+        pxM = (points[:, 0] - x0) * nx / (x1 - x0)                              # [px]
+        pyM = (points[:, 1] - y0) * ny / (y1 - y0)                              # [px]
+
+        # Replace each segment which is too long with its two halves ...
+        lon0 = numpy.column_stack((lon0[long], lonM)).ravel()                   # [°]
+        lat0 = numpy.column_stack((lat0[long], latM)).ravel()                   # [°]
+        px0 = numpy.column_stack((px0[long], pxM)).ravel()                      # [px]
+        py0 = numpy.column_stack((py0[long], pyM)).ravel()                      # [px]
+        lon1 = numpy.column_stack((lonM, lon1[long])).ravel()                   # [°]
+        lat1 = numpy.column_stack((latM, lat1[long])).ravel()                   # [°]
+        px1 = numpy.column_stack((pxM, px1[long])).ravel()                      # [px]
+        py1 = numpy.column_stack((pyM, py1[long])).ravel()                      # [px]
+
+    # Put the pieces back in order ...
+    index, where, px0, py0, px1, py1, length = (numpy.concatenate(arrays) for arrays in zip(*keep))
+    order = numpy.lexsort((where, index))
+    px0 = px0[order]                                                            # [px]
+    py0 = py0[order]                                                            # [px]
+    dx = px1[order] - px0                                                       # [px]
+    dy = py1[order] - py0                                                       # [px]
+    length = length[order]                                                      # [px]
+    segRoute = segRoute[index[order]]
+
+    # Find how many samples to take along each segment (so that no pixel which
+    # it crosses is skipped) ...
+    nSteps = numpy.ceil(length / sample).astype(numpy.int64) + 1                # [#]
+    cumSteps = numpy.cumsum(nSteps)                                             # [#]
+
+    # Initialize grid ...
+    grid = numpy.zeros(nx * ny, dtype = numpy.int64)                           # [#]
+
+    # Loop over batches of segments ...
+    # NOTE: Each batch contains roughly the same number of samples and only
+    #       whole great circles.
+    start = 0
+    while start < segRoute.size:
+        done = int(cumSteps[start - 1]) if start > 0 else 0                     # [#]
+        stop = max(start + 1, int(numpy.searchsorted(cumSteps, done + batch, side = "right")))
+        stop = int(numpy.searchsorted(segRoute, segRoute[stop - 1], side = "right"))
+
+        # Sample the segments of this batch ...
+        n = nSteps[start:stop]                                                  # [#]
+        i = numpy.repeat(numpy.arange(start, stop), n)
+        t = (numpy.arange(n.sum()) - numpy.repeat(numpy.cumsum(n) - n, n)) / numpy.repeat(numpy.maximum(n - 1, 1), n)
+        ix = numpy.floor(px0[i] + t * dx[i]).astype(numpy.int64)               # [px]
+        iy = numpy.floor(py0[i] + t * dy[i]).astype(numpy.int64)               # [px]
+
+        # Find the pixel of each sample (skipping the ones which are outside
+        # of the axis) ...
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        pixels = iy[inside] * nx + ix[inside]
+
+        # Count each great circle once per pixel that it crosses ...
+        # NOTE: The samples along each great circle are in order, therefore
+        #       all of the samples of a great circle in a pixel are next to
+        #       each other and only the first one needs to be kept.
+        keys = segRoute[i[inside]] * (nx * ny) + pixels
+        first = numpy.ones(keys.size, dtype = bool)
+        first[1:] = keys[1:] != keys[:-1]
+        grid += numpy.bincount(pixels[first], minlength = nx * ny)              # [#]
+        start = stop
+
+    if debug:
+        print(f"DEBUG: Counted {int(cumSteps[-1]) if cumSteps.size > 0 else 0:,d} samples of {len(lines):,d} great circles in {int((grid > 0).sum()):,d} pixels on {name}.")
+
+    # Check that there are any great circles on the axis ...
+    if grid.max() == 0:
+        return 0
+
+    # Draw the counts (without changing the limits of the axis) ...
+    ax.imshow(
+        numpy.ma.masked_equal(grid.reshape(ny, nx), 0),
+                 cmap = cmap,
+               extent = (x0, x1, y0, y1),
+        interpolation = "none",
+                 norm = matplotlib.colors.LogNorm(vmin = 1, vmax = max(2, int(grid.max()))),
+               origin = "lower",
+             resample = False,
+            transform = ax.projection,
+               zorder = 2.0,
+    )
+    ax.set_xlim(x0, x1)
+    ax.set_ylim(y0, y1)
+
+    # Return answer ...
+    return 1
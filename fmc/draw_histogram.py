@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def draw_histogram(
+    ax,
+    businessX,
+    businessY,
+    pleasureX,
+    pleasureY,
+    /,
+    *,
+         c0 = (0.0, 0.0, 1.0),
+         c1 = (1.0, 0.5, 0.0),
+         hw = 0.2,
+    maxYear = None,
+    minYear = None,
+):
+    """Draw the histogram of the distance flown per year
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        the axis
+    businessX : list of float
+        the locations of the business bars
+    businessY : list of float
+        the heights of the business bars (in 1000 km)
+    pleasureX : list of float
+        the locations of the pleasure bars
+    pleasureY : list of float
+        the heights of the pleasure bars (in 1000 km)
+    c0 : tuple of float, optional
+        the colour of the business bars
+    c1 : tuple of float, optional
+        the colour of the pleasure bars
+    hw : float, optional
+        the half-width of the bars
+    maxYear : int, optional
+        the maximum year of the survey
+    minYear : int, optional
+        the minimum year of the survey
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import sub-functions ...
+    from ._consts import AXES_MARGIN, FONT_SIZE
+
+    # **************************************************************************
+
+    # Plot histograms ...
+    # NOTE: The margins and the font sizes are set explicitly, so that the
+    #       global Matplotlib configuration is not used.
+    ax.margins(
+        x = AXES_MARGIN,
+        y = AXES_MARGIN,
+    )
+    ax.bar(
+        businessX,
+        businessY,
+        color = c0 + (1.0,),
+        label = "Business",
+        width = 2.0 * hw,
+    )
+    ax.bar(
+        pleasureX,
+        pleasureY,
+        color = c1 + (1.0,),
+        label = "Pleasure",
+        width = 2.0 * hw,
+    )
+    ax.legend(
+        fontsize = FONT_SIZE,
+             loc = "upper right",
+    )
+    ax.set_xticks(
+        range(minYear, maxYear + 1),
+          labels = [f"{year:d}" for year in range(minYear, maxYear + 1)],
+              ha = "right",
+        rotation = 45,
+    )
+    ax.tick_params(labelsize = FONT_SIZE)
+    ax.xaxis.get_offset_text().set_fontsize(FONT_SIZE)
+    ax.yaxis.get_offset_text().set_fontsize(FONT_SIZE)
+    ax.set_ylabel(
+        "Distance [1000 km/year]",
+        fontsize = FONT_SIZE,
+    )
+    ax.yaxis.grid(True)
+
+    # Loop over years ...
+    for i in range(minYear, maxYear + 1, 2):
+        # Configure axis ...
+        # NOTE: As of 13/Aug/2023, the default "zorder" of the bars is 1.0 and
+        #       the default "zorder" of the vspans is 1.0.
+        ax.axvspan(
+            i - 0.5,
+            i + 0.5,
+                alpha = 0.25,
+            facecolor = "grey",
+               zorder = 0.0,
+        )
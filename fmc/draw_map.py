@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def draw_map(
+    ax,
+    routes,
+    countries,
+    styles,
+    /,
+    *,
+    clipToFov = False,
+        debug = __debug__,
+      density = False,
+          fov = None,
+         name = "the axis",
+         simp = None,
+):
+    """Draw the great circles and the countries on a map axis
+
+    Parameters
+    ----------
+    ax : cartopy.mpl.geoaxes.GeoAxes
+        the axis
+    routes : list of tuple of shapely.geometry.multilinestring.MultiLineString, tuple of float
+        the great circle and the colour of each route
+    countries : list of tuple of str, list of shapely.geometry.polygon.Polygon
+        the name and the Polygons of each country
+    styles : list of tuple of tuple of float, tuple of float
+        the edge colour and the face colour of each country
+    clipToFov : bool, optional
+        clip the great circles and the countries to the field-of-view too
+    debug : bool, optional
+        print debug messages
+    density : bool, optional
+        draw the density of the great circles as a single image (see
+        :func:`fmc.draw_density`), rather than drawing each great circle as a
+        line in its own colour
+    fov : shapely.geometry.polygon.Polygon, optional
+        the field-of-view of the axis (if it is not given then nothing is
+        culled)
+    name : str, optional
+        a description of the axis (only used in debug messages)
+    simp : float, optional
+        the tolerance to simplify the great circles to (in degrees; if it is
+        not given then the great circles are not simplified)
+
+    Returns
+    -------
+    artists : int
+        the number of artists created
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import special modules ...
+    try:
+        import cartopy
+        import cartopy.crs
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import sub-functions ...
+    from .cull_geometries import cull_geometries
+    from .draw_density import draw_density
+
+    # **************************************************************************
+
+    # Cull the great circles which are not within the field-of-view ...
+    if fov is None:
+        keep = range(len(routes))
+        kept = [route for route, _ in routes]
+    else:
+        keep, kept = cull_geometries(
+            [route for route, _ in routes],
+            fov,
+             clip = clipToFov,
+            debug = debug,
+             name = f"the great circles on {name}",
+        )
+
+    # Initialize counter ...
+    artists = 0                                                                 # [#]
+
+    # Check if the density of the great circles is drawn ...
+    if density:
+        # Draw the density of the great circles ...
+        artists += draw_density(
+            ax,
+            kept,
+            debug = debug,
+             name = name,
+        )
+    else:
+        # Simplify the great circles (if required) ...
+        # NOTE: The Douglas-Peucker algorithm keeps every vertex which is
+        #       needed to stay within the tolerance, therefore long
+        #       straight-ish parts of the great circles lose most of their
+        #       vertices whilst tightly curved parts (e.g., near the poles)
+        #       keep them.
+        if simp is not None and len(kept) > 0:
+            nOld = int(shapely.get_num_coordinates(kept).sum())
+            kept = list(
+                shapely.simplify(
+                    kept,
+                    simp,
+                    preserve_topology = False,
+                )
+            )
+
+            if debug:
+                print(f"DEBUG: Simplified the great circles on {name} to {simp:.3e}° from {nOld:,d} to {int(shapely.get_num_coordinates(kept).sum()):,d} vertices.")
+
+        # Group the lines of the great circles by their colour ...
+        # NOTE: Drawing one MultiLineString per colour creates one artist per
+        #       colour per axis, rather than one artist per great circle per
+        #       axis, so that the number of artists does not grow with the
+        #       number of unique routes.
+        groups = {}
+        for i, route in zip(keep, kept, strict = True):
+            groups.setdefault(routes[i][1], []).extend(shapely.get_parts(route))
+
+        # Draw the great circles ...
+        for edgecolor, lines in groups.items():
+            ax.add_geometries(
+                [shapely.geometry.MultiLineString(lines)],
+                cartopy.crs.PlateCarree(),
+                edgecolor = edgecolor,
+                facecolor = "none",
+                linewidth = 1.0,
+            )
+            artists += 1
+
+    # Cull the countries which are not within the field-of-view ...
+    if fov is None:
+        keep = range(len(countries))
+        kept = [shapely.geometry.MultiPolygon(polys) for _, polys in countries]
+    else:
+        keep, kept = cull_geometries(
+            [shapely.geometry.MultiPolygon(polys) for _, polys in countries],
+            fov,
+             clip = clipToFov,
+            debug = debug,
+             name = f"the countries on {name}",
+        )
+
+    # Group the Polygons of the countries by their style ...
+    # NOTE: Drawing one MultiPolygon per style creates a handful of artists per
+    #       axis, rather than one artist per country per axis.
+    groups = {}
+    for i, country in zip(keep, kept, strict = True):
+        groups.setdefault(styles[i], []).extend(country.geoms)
+
+    # Draw the countries ...
+    for (edgecolor, facecolor), polys in groups.items():
+        ax.add_geometries(
+            [shapely.geometry.MultiPolygon(polys)],
+            cartopy.crs.PlateCarree(),
+            edgecolor = edgecolor,
+            facecolor = facecolor,
+            linewidth = 0.5,
+        )
+        artists += 1
+
+    # Return answer ...
+    return artists
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def iter_flight_log(
+    flightLog,
+    /,
+    *,
+    byteRange = None,
+    chunkSize = 1048576,
+        debug = __debug__,
+      maxYear = None,
+      minYear = None,
+        stats = None,
+):
+    """Read a CSV file of flights in chunks
+
+    This function streams the CSV file of flights and yields the (validated)
+    flights in chunks of compact columns, so that the memory used to read a
+    very large flight log is bounded by the size of a chunk (plus the table of
+    unique IATA codes). Rows are skipped in the same way as :func:`fmc.run`
+    always has done: the year must be four digits long, both IATA codes must be
+    three characters long and the year must be between ``minYear`` and
+    ``maxYear``.
+
+    Parameters
+    ----------
+    flightLog : str
+        the CSV of your flights
+    byteRange : tuple of int, optional
+        only read the rows which start within this range of bytes of the CSV
+        (the start is inclusive and the stop is exclusive), so that a very
+        large flight log can be split into shards which are read in parallel
+        without any rows being read twice or being missed (it is assumed that
+        no field contains a newline)
+    chunkSize : int, optional
+        the maximum number of flights in each chunk
+    debug : bool, optional
+        print debug messages
+    maxYear : int, optional
+        the maximum year to use for the survey (defaults to this year)
+    minYear : int, optional
+        the minimum year to use for the survey (defaults to the year of the
+        first valid flight)
+    stats : fmc.RunStats, optional
+        the statistics to add the number of rows read and skipped to
+
+    Yields
+    ------
+    chunk : fmc.FlightLog
+        a chunk of the flight log (the indices of the IATA codes in every chunk
+        refer to the same table of unique codes, which only ever grows)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import array
+    import calendar
+    import contextlib
+    import csv
+    import datetime
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .FlightLog import FlightLog
+
+    # **************************************************************************
+
+    # Populate default values ...
+    if maxYear is None:
+        maxYear = datetime.datetime.now(tz = datetime.UTC).year
+
+    # Create short-hands ...
+    purposeToID = {purpose : i for i, purpose in enumerate(FlightLog.purposeNames)}
+
+    # Initialize table of unique codes ...
+    codes = []
+    codeToID = {}
+
+    # Define a function to create an empty chunk ...
+    def empty():
+        return (
+            array.array("i"),
+            array.array("i"),
+            array.array("h"),
+            array.array("b"),
+            array.array("b"),
+            array.array("b"),
+        )
+
+    # Define a function to convert a chunk to a flight log ...
+    def convert(chunk):
+        return FlightLog(
+            codes,
+            *[numpy.frombuffer(column, dtype = column.typecode) for column in chunk],
+            maxYear = maxYear,
+            minYear = minYear,
+        )
+
+    # Initialize chunk ...
+    chunk = empty()
+    iatas1, iatas2, years, months, days, purposes = chunk
+
+    # Define a function to yield the rows of the flight log ...
+    def read_lines():
+        # Check if all of the flight log is read ...
+        if byteRange is None:
+            with open(flightLog, mode = "rt", encoding = "utf-8") as fObj:
+                yield from fObj
+            return
+
+        # Only read the rows which start within the range of bytes ...
+        # NOTE: A row which starts before the range of bytes belongs to the
+        #       previous range of bytes, even if it ends within this one.
+        start, stop = byteRange                                                 # [B], [B]
+        with open(flightLog, mode = "rb") as fObj:
+            pos = start                                                         # [B]
+            if start > 0:
+                fObj.seek(start - 1)
+                pos = start - 1 + len(fObj.readline())                          # [B]
+            while pos < stop:
+                line = fObj.readline()
+                if not line:
+                    break
+                pos += len(line)                                                # [B]
+                yield line.decode("utf-8")
+
+    # Open flight log ...
+    with contextlib.closing(read_lines()) as lines:
+        # Loop over all flights ...
+        for row in csv.reader(lines):
+            # Count this row (if required) ...
+            if stats is not None:
+                stats.rowsRead += 1
+
+            # Extract date that this flight started (silenty skipping rows which
+            # do not have a four digit year in the date) ...
+            # NOTE: The common case of a full ISO 8601 date (e.g.,
+            #       "2023-08-13") is validated without creating a Python
+            #       datetime object; anything else is parsed exactly like
+            #       before.
+            parts = row[2].split("-")
+            if len(parts[0]) != 4:
+                if debug:
+                    print(f"DEBUG: A row has a date column which does not have a year which is four characters long (\"{row[2]}\").")
+                if stats is not None:
+                    stats.rowsSkipped["yearNotFourCharacters"] += 1
+                continue
+            if not parts[0].isdigit():
+                if debug:
+                    print(f"DEBUG: A row has a date column which does not have a year which is made up of digits (\"{row[2]}\").")
+                if stats is not None:
+                    stats.rowsSkipped["yearNotDigits"] += 1
+                continue
+            match len(parts):
+                case 1:
+                    year, month, day = int(parts[0]), 1, 1
+                case 2:
+                    year, month, day = int(parts[0]), int(parts[1]), 1
+                case 3:
+                    if len(row[2]) == 10 and row[2].isascii() and parts[1].isdigit() and parts[2].isdigit():
+                        year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
+                    else:
+                        date = datetime.datetime.fromisoformat(row[2])
+                        year, month, day = date.year, date.month, date.day
+                case _:
+                    raise ValueError(f"I don't know how to convert \"{row[2]}\" in to a Python datetime object.") from None
+            if year < 1 or not 1 <= month <= 12 or not 1 <= day <= 28 and not 1 <= day <= calendar.monthrange(year, month)[1]:
+                # NOTE: Let Python raise the same exception as it always has
+                #       done for invalid dates.
+                datetime.datetime(
+                     year = year,
+                    month = month,
+                      day = day,
+                )
+
+            # Extract IATA codes for this flight ...
+            iata1 = row[0]
+            iata2 = row[1]
+
+            # Skip this flight if the codes are not what I expect ...
+            if len(iata1) != 3 or len(iata2) != 3:
+                if debug:
+                    print(f"DEBUG: A flight does not have valid IATA codes (\"{iata1}\" and/or \"{iata2}\").")
+                if stats is not None:
+                    stats.rowsSkipped["invalidIATA"] += 1
+                continue
+
+            # Set the minimum year (if required)...
+            if minYear is None:
+                minYear = year
+
+            # Skip this flight if the year that this flight started it is out of
+            # scope ...
+            if year < minYear:
+                if debug:
+                    print(f"DEBUG: A flight between {iata1} and {iata2} took place in {year:d}, which was before {minYear:d}.")
+                if stats is not None:
+                    stats.rowsSkipped["beforeMinYear"] += 1
+                continue
+            if year > maxYear:
+                if debug:
+                    print(f"DEBUG: A flight between {iata1} and {iata2} took place in {year:d}, which was after {maxYear:d}.")
+                if stats is not None:
+                    stats.rowsSkipped["afterMaxYear"] += 1
+                continue
+
+            # Intern the codes ...
+            if iata1 not in codeToID:
+                codeToID[iata1] = len(codes)
+                codes.append(iata1)
+            if iata2 not in codeToID:
+                codeToID[iata2] = len(codes)
+                codes.append(iata2)
+
+            # Save this flight ...
+            iatas1.append(codeToID[iata1])
+            iatas2.append(codeToID[iata2])
+            years.append(year)
+            months.append(month)
+            days.append(day)
+            purposes.append(purposeToID.get(row[3].lower(), 0))
+
+            # Yield the chunk if it is full ...
+            if len(years) == chunkSize:
+                yield convert(chunk)
+                chunk = empty()
+                iatas1, iatas2, years, months, days, purposes = chunk
+
+    # Yield the last chunk (if it is not empty) ...
+    if len(years) > 0:
+        yield convert(chunk)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_airports(
+    *,
+    binFile = None,
+     dbFile = None,
+      debug = __debug__,
+):
+    """Load the airport database
+
+    This function memory-maps the compiled airport database (compiling it from
+    the JSON airport database first, if it is missing or stale) and returns an
+    index of it. Many processes loading the same compiled airport database
+    share one page-cached copy of it.
+
+    Parameters
+    ----------
+    binFile : str, optional
+        the compiled airport database (defaults to "db.bin" next to the JSON
+        airport database)
+    dbFile : str, optional
+        the JSON airport database (defaults to the "db.json" which comes with
+        FMC)
+    debug : bool, optional
+        print debug messages
+
+    Returns
+    -------
+    airports : fmc.AirportIndex
+        the index of airports
+
+    Notes
+    -----
+    If the compiled airport database is stale (or truncated) and it cannot be
+    re-compiled (e.g., FMC is installed in a read-only location) then this
+    function falls back to loading the JSON airport database.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import json
+    import mmap
+    import os
+    import struct
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from ._consts import AIRPORTS_HEADER, AIRPORTS_MAGIC, AIRPORTS_VERSION
+    from .AirportIndex import AirportIndex
+    from .compile_airports import compile_airports
+
+    # **************************************************************************
+
+    # Populate default values ...
+    if dbFile is None:
+        dbFile = f"{os.path.dirname(__file__)}/db.json"
+    if binFile is None:
+        binFile = f'{dbFile.removesuffix(".json")}.bin'
+
+    # Define a function to load the JSON airport database (which is what is
+    # used if the compiled airport database cannot be used) ...
+    def load_json():
+        if debug:
+            print(f"DEBUG: \"{binFile}\" could not be used, falling back to \"{dbFile}\".")
+        with open(dbFile, mode = "rt", encoding = "utf-8") as fObj:
+            return AirportIndex(json.load(fObj))
+
+    # Define a function to read the header of the compiled airport database ...
+    # NOTE: A file which cannot be read (e.g., because of its permissions) is
+    #       treated as though it is missing.
+    def read_header():
+        try:
+            with open(binFile, mode = "rb") as fObj:
+                header = fObj.read(struct.calcsize(AIRPORTS_HEADER))
+        except OSError:
+            return None
+        if len(header) != struct.calcsize(AIRPORTS_HEADER):
+            return None
+        return struct.unpack(AIRPORTS_HEADER, header)
+
+    # Define a function to find the size of the compiled airport database
+    # which is implied by its header ...
+    def implied_size(header):
+        _, _, iataWidth, icaoWidth, nRows, nCountries, nBlob, _, _ = header
+        size = struct.calcsize(AIRPORTS_HEADER)                                 # [B]
+        for nBytes in [
+            8 * nRows,
+            8 * nRows,
+            4 * nRows,
+            iataWidth * nRows,
+            icaoWidth * nRows,
+            8 * (nCountries + 1),
+            nBlob,
+        ]:
+            size += nBytes + (-nBytes % 8)                                      # [B]
+        return size
+
+    # Define a function to check if the compiled airport database is complete
+    # (i.e., it is not shorter than its header says, which it would be if it
+    # were truncated) ...
+    def is_complete(header):
+        if header is None:
+            return False
+        try:
+            return os.path.getsize(binFile) >= implied_size(header)
+        except OSError:
+            return False
+
+    # Define a function to check if the compiled airport database is fresh ...
+    # NOTE: A file which is incomplete is treated as though it is stale.
+    def is_fresh(header):
+        if header is None:
+            return False
+        if header[0] != AIRPORTS_MAGIC or header[1] != AIRPORTS_VERSION:
+            return False
+        if not is_complete(header):
+            return False
+        if not os.path.exists(dbFile):
+            return True
+        stat = os.stat(dbFile)
+        return header[7] == stat.st_size and header[8] == stat.st_mtime_ns
+
+    # Check if the compiled airport database needs (re-)compiling ...
+    header = read_header()
+    if not is_fresh(header):
+        if debug:
+            print(f"DEBUG: \"{binFile}\" is missing or stale.")
+        try:
+            compile_airports(
+                dbFile,
+                binFile,
+                debug = debug,
+            )
+        except OSError:
+            return load_json()
+        header = read_header()
+        if not is_complete(header):
+            return load_json()
+
+    # Unpack header ...
+    _, _, iataWidth, icaoWidth, nRows, nCountries, nBlob, _, _ = header
+
+    # Memory-map the compiled airport database ...
+    # NOTE: The memory map stays open for as long as any of the arrays which
+    #       are views of it are still alive.
+    try:
+        with open(binFile, mode = "rb") as fObj:
+            buf = mmap.mmap(fObj.fileno(), 0, access = mmap.ACCESS_READ)
+    except OSError:
+        return load_json()
+    if len(buf) < implied_size(header):
+        return load_json()
+
+    # Define a function to create a view of the next section ...
+    offset = struct.calcsize(AIRPORTS_HEADER)
+    def view(dtype, count):
+        nonlocal offset
+        arr = numpy.frombuffer(buf, dtype = dtype, count = count, offset = offset)
+        offset += arr.nbytes + (-arr.nbytes % 8)
+        return arr
+
+    # Create views of the sections ...
+    lons = view("<f8", nRows)                                                   # [°]
+    lats = view("<f8", nRows)                                                   # [°]
+    countryIDs = view("<i4", nRows)
+    iatas = view(f"S{iataWidth:d}", nRows)
+    icaos = view(f"S{icaoWidth:d}", nRows)
+    countryOffsets = view("<i8", nCountries + 1)
+    countryBlob = buf[offset:offset + nBlob]
+    countryNames = [
+        countryBlob[countryOffsets[i]:countryOffsets[i + 1]].decode("utf-8")
+        for i in range(nCountries)
+    ]
+
+    # Return answer ...
+    return AirportIndex.from_columns(
+        lons,
+        lats,
+        countryIDs,
+        countryNames,
+        [iata.decode("utf-8") for iata in iatas.tolist()],
+        [icao.decode("utf-8") for icao in icaos.tolist()],
+    )
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_countries(
+    sfile,
+    /,
+    *,
+        cache = True,
+     cacheDir = None,
+        debug = __debug__,
+    onlyValid = True,
+       repair = True,
+):
+    """Load the country shapes
+
+    This function reads in the Natural Earth Shapefile of country shapes and
+    extracts (and validates, and repairs) the Polygons of each country once. The
+    result is saved in an on-disk cache, keyed by the path and the modification
+    time of the Shapefile and by the validation settings, so that later calls
+    skip both parsing the Shapefile and repairing the geometries.
+
+    Parameters
+    ----------
+    sfile : str
+        the Shapefile of country shapes
+    cache : bool, optional
+        use the on-disk cache
+    cacheDir : str, optional
+        the directory of the on-disk cache (defaults to "~/.cache/fmc")
+    debug : bool, optional
+        print debug messages
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+
+    Returns
+    -------
+    countries : list of tuple of str, list of shapely.geometry.polygon.Polygon
+        the name and the Polygons of each country (in the order of the records
+        in the Shapefile)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import os
+    import pathlib
+    import pickle
+    import tempfile
+
+    # Import special modules ...
+    try:
+        import cartopy
+        import cartopy.io.shapereader
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # **************************************************************************
+
+    # Populate default values ...
+    if cacheDir is None:
+        cacheDir = pathlib.PosixPath("~/.cache/fmc").expanduser()
+
+    # Create the name of the cache file ...
+    key = "|".join(
+        [
+            "countries-v1",
+            os.path.abspath(sfile),
+            f"{os.stat(sfile).st_mtime_ns:d}",
+            f"{onlyValid!r}",
+            f"{repair!r}",
+        ]
+    )
+    cfile = f"{cacheDir}/countries-{hashlib.sha256(key.encode('utf-8')).hexdigest()}.pickle"
+
+    # Return the country shapes from the cache (if they are in there) ...
+    # NOTE: A file which cannot be read (e.g., because it is corrupt) is
+    #       treated as though it does not exist, so that it is just rebuilt.
+    if cache and os.path.exists(cfile):
+        if debug:
+            print(f"DEBUG: Loading country shapes from \"{cfile}\".")
+        try:
+            with open(cfile, mode = "rb") as fObj:
+                return [
+                    (neName, list(shapely.from_wkb(wkb).geoms))
+                    for neName, wkb in pickle.load(fObj)
+                ]
+        except Exception as err:
+            if debug:
+                print(f"DEBUG: The country shapes could not be loaded ({err}).")
+
+    # Loop over records ...
+    countries = []
+    for record in cartopy.io.shapereader.Reader(sfile).records():
+        # Extract the Polygons of this country ...
+        countries.append(
+            (
+                pyguymer3.geo.getRecordAttribute(record, "NAME"),
+                pyguymer3.geo.extract_polys(
+                    record.geometry,
+                    onlyValid = onlyValid,
+                       repair = repair,
+                ),
+            )
+        )
+
+    # Save the country shapes in the cache (atomically, so that a concurrent
+    # reader never sees a partially written file) ...
+    if cache:
+        if debug:
+            print(f"DEBUG: Saving country shapes to \"{cfile}\".")
+        os.makedirs(cacheDir, exist_ok = True)
+        with tempfile.NamedTemporaryFile(
+              mode = "wb",
+            delete = False,
+               dir = cacheDir,
+            prefix = ".",
+            suffix = ".tmp",
+        ) as fObj:
+            try:
+                pickle.dump(
+                    [
+                        (neName, shapely.to_wkb(shapely.geometry.MultiPolygon(polys)))
+                        for neName, polys in countries
+                    ],
+                    fObj,
+                )
+            except:
+                os.remove(fObj.name)
+                raise
+        try:
+            os.replace(fObj.name, cfile)
+        except:
+            os.remove(fObj.name)
+            raise
+
+    # Return answer ...
+    return countries
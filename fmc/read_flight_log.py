@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def read_flight_log(
+    flightLog,
+    /,
+    *,
+    chunkSize = 1048576,
+        debug = __debug__,
+      maxYear = None,
+      minYear = None,
+        stats = None,
+):
+    """Read a CSV file of flights
+
+    This function streams the CSV file of flights in chunks (see
+    :func:`fmc.iter_flight_log`) and joins the chunks together.
+
+    Parameters
+    ----------
+    flightLog : str
+        the CSV of your flights
+    chunkSize : int, optional
+        the maximum number of flights in each chunk
+    debug : bool, optional
+        print debug messages
+    maxYear : int, optional
+        the maximum year to use for the survey (defaults to this year)
+    minYear : int, optional
+        the minimum year to use for the survey (defaults to the year of the
+        first valid flight)
+    stats : fmc.RunStats, optional
+        the statistics to add the number of rows read and skipped to
+
+    Returns
+    -------
+    log : fmc.FlightLog
+        the flight log
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import sub-functions ...
+    from .FlightLog import FlightLog
+    from .iter_flight_log import iter_flight_log
+
+    # **************************************************************************
+
+    # Read the flight log ...
+    log = FlightLog.concatenate(
+        list(
+            iter_flight_log(
+                flightLog,
+                chunkSize = chunkSize,
+                    debug = debug,
+                  maxYear = maxYear,
+                  minYear = minYear,
+                    stats = stats,
+            )
+        )
+    )
+
+    # Populate default values (if the flight log does not have any valid
+    # flights) ...
+    if log.maxYear is None:
+        log.maxYear = maxYear
+    if log.minYear is None:
+        log.minYear = minYear
+
+    # Return answer ...
+    return log
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def render_base_layer(
+    panel,
+    subplotpars,
+    /,
+    *,
+        cache = True,
+     cacheDir = None,
+    clipToFov = False,
+    countries = None,
+        debug = __debug__,
+          eps = 1.0e-12,
+     leftDist = 2392.7e3,
+      leftFov = None,
+      leftLat = +39.517,
+      leftLon = -97.763,
+          lod = False,
+      maxSize = 1024 * 1024 * 1024,
+         memo = None,
+        nIter = 100,
+    onlyValid = True,
+       repair = True,
+    rightDist = 2346.6e3,
+     rightFov = None,
+     rightLat = +49.901,
+     rightLon =  +3.156,
+        sfile = None,
+          tol = 1.0e-10,
+):
+    """Render the base layer of a map panel of a PNG map
+
+    This function renders the parts of a map panel which do not depend on the
+    flight log (the background, the coastlines, the gridlines and the outlines
+    of all of the countries) to a raster. The raster is saved (compressed) in
+    an on-disk cache, keyed by everything which affects it, so that later calls
+    just load it. The least recently used rasters are evicted when the total
+    size of them in the on-disk cache exceeds the limit.
+
+    Parameters
+    ----------
+    panel : str
+        the panel to render (one of "top", "left" and "right")
+    subplotpars : tuple of float
+        the left, bottom, right, top, wspace and hspace parameters of the
+        layout of the figure
+    cache : bool, optional
+        use the on-disk cache
+    cacheDir : str, optional
+        the directory of the on-disk cache (defaults to "~/.cache/fmc")
+    clipToFov : bool, optional
+        clip the countries to the field-of-view of the sub-maps (as well as
+        culling the ones which are outside of it)
+    countries : list of tuple of str, list of shapely.geometry.polygon.Polygon, optional
+        the name and the Polygons of each country
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    leftDist : float, optional
+        the field-of-view around the left-hand sub-map central point (in metres)
+    leftFov : shapely.geometry.polygon.Polygon, optional
+        the field-of-view of the left-hand sub-map (in degrees)
+    leftLat : float, optional
+        the latitude of the central point of the left-hand sub-map (in degrees)
+    leftLon : float, optional
+        the longitude of the central point of the left-hand sub-map (in degrees)
+    lod : bool, optional
+        simplify the countries to half of the size of a pixel of the map (see
+        :func:`fmc.simplify_countries`)
+    maxSize : int, optional
+        the maximum total size of the base layers in the on-disk cache (in
+        bytes)
+    memo : dict, fmc.MemoCache, optional
+        an in-memory cache of base layers (which is shared between calls, so
+        that a long-lived process only loads each base layer from disk once)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    rightDist : float, optional
+        the field-of-view around the right-hand sub-map central point (in metres)
+    rightFov : shapely.geometry.polygon.Polygon, optional
+        the field-of-view of the right-hand sub-map (in degrees)
+    rightLat : float, optional
+        the latitude of the central point of the right-hand sub-map (in degrees)
+    rightLon : float, optional
+        the longitude of the central point of the right-hand sub-map (in degrees)
+    sfile : str, optional
+        the Shapefile that the country shapes were loaded from (only used to
+        key the on-disk cache)
+    tol : float, optional
+        the Euclidean distance that defines two points as being the same (in
+        degrees)
+
+    Returns
+    -------
+    x0 : int
+        the offset of the left edge of the raster from the left edge of the
+        figure (in pixels)
+    y0 : int
+        the offset of the bottom edge of the raster from the bottom edge of the
+        figure (in pixels)
+    layer : numpy.ndarray
+        the RGBA raster (with non-premultiplied alpha and with the first row at
+        the top)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import glob
+    import hashlib
+    import importlib.metadata
+    import math
+    import os
+    import pathlib
+    import tempfile
+
+    # Import special modules ...
+    try:
+        import cartopy
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .calc_pixel_size import calc_pixel_size
+    from .create_figure import create_figure
+    from .draw_map import draw_map
+    from .simplify_countries import simplify_countries
+
+    # **************************************************************************
+
+    # Populate default values ...
+    if cacheDir is None:
+        cacheDir = pathlib.PosixPath("~/.cache/fmc").expanduser()
+    if countries is None:
+        countries = []
+
+    # Create the name of the cache file ...
+    # NOTE: The figure size, the resolution and the backgrounds are set by
+    #       "fmc.create_figure()"; the version at the start of the key must be
+    #       increased whenever they change.
+    match panel:
+        case "top":
+            view = []
+        case "left":
+            view = [leftLon, leftLat, leftDist]
+        case "right":
+            view = [rightLon, rightLat, rightDist]
+        case _:
+            raise ValueError(f"\"{panel}\" is not a map panel") from None
+    key = "|".join(
+        [
+            "base-v1",
+            panel,
+            *[float(par).hex() for par in subplotpars],
+            *[float(par).hex() for par in view],
+            f"{eps!r}",
+            f"{nIter!r}",
+            f"{tol!r}",
+            f"{onlyValid!r}",
+            f"{repair!r}",
+            f"{clipToFov!r}",
+            f"{lod!r}",
+            os.path.abspath(sfile) if sfile is not None else "",
+            f"{os.stat(sfile).st_mtime_ns:d}" if sfile is not None else "",
+            f"{len(countries):d}",
+            matplotlib.__version__,
+            cartopy.__version__,
+            importlib.metadata.version("pyguymer3"),
+        ]
+    )
+    cfile = f"{cacheDir}/base-{hashlib.sha256(key.encode('utf-8')).hexdigest()}.npz"
+
+    # Return the base layer from the in-memory cache (if it is in there) ...
+    if memo is not None:
+        ans = memo.get(cfile)
+        if ans is not None:
+            return ans
+
+    # Return the base layer from the on-disk cache (if it is in there) ...
+    # NOTE: The modification time of the file is updated each time that it is
+    #       loaded, so that the least recently used files are evicted first.
+    # NOTE: A file which cannot be read (e.g., because it is corrupt) is
+    #       treated as though it does not exist, so that it is just rebuilt.
+    if cache and os.path.exists(cfile):
+        if debug:
+            print(f"DEBUG: Loading base layer from \"{cfile}\".")
+        try:
+            with numpy.load(cfile) as fObj:
+                ans = int(fObj["x0"]), int(fObj["y0"]), fObj["layer"]
+        except Exception as err:
+            if debug:
+                print(f"DEBUG: The base layer could not be loaded ({err}).")
+        else:
+            try:
+                os.utime(cfile)
+            except OSError:
+                pass
+            if memo is not None:
+                memo[cfile] = ans
+            return ans
+
+    # Create figure and axes (only decorating the panel, but otherwise in
+    # exactly the same way as the full PNG map) ...
+    fg, axT, axL, axR, axB = create_figure(
+            debug = debug,
+              eps = eps,
+         leftDist = leftDist,
+          leftFov = leftFov,
+          leftLat = leftLat,
+          leftLon = leftLon,
+            nIter = nIter,
+        onlyValid = onlyValid,
+           panels = (panel,),
+           repair = repair,
+        rightDist = rightDist,
+         rightFov = rightFov,
+         rightLat = rightLat,
+         rightLon = rightLon,
+              tol = tol,
+    )
+
+    # Lay the figure out in exactly the same way as the full PNG map ...
+    left, bottom, right, top, wspace, hspace = subplotpars
+    fg.subplots_adjust(
+          left = left,
+        bottom = bottom,
+         right = right,
+           top = top,
+        wspace = wspace,
+        hspace = hspace,
+    )
+
+    # Find the axis and hide the other ones ...
+    ax, fov, name = {
+          "top" : (axT, None, "the top map"),
+         "left" : (axL, leftFov, "the left-hand sub-map"),
+        "right" : (axR, rightFov, "the right-hand sub-map"),
+    }[panel]
+    for other in [axT, axL, axR, axB]:
+        if other is not ax:
+            other.set_visible(False)
+    fg.patch.set_alpha(0.0)
+
+    # Simplify the countries to half of the size of a pixel of the axis (if
+    # required) ...
+    if lod:
+        countries = simplify_countries(
+            countries,
+            0.5 * calc_pixel_size(ax) / (pyguymer3.CIRCUMFERENCE_OF_EARTH / 360.0),
+                cache = cache,
+             cacheDir = cacheDir,
+                debug = debug,
+                 memo = memo,
+            onlyValid = onlyValid,
+               repair = repair,
+                sfile = sfile,
+        )
+
+    # Draw the outlines of all of the countries ...
+    draw_map(
+        ax,
+        [],
+        countries,
+        [((0.0, 0.0, 0.0, 0.25), "none")] * len(countries),
+        clipToFov = clipToFov,
+            debug = debug,
+              fov = fov,
+             name = name,
+    )
+
+    # Render the figure ...
+    fg.canvas.draw()
+    img = numpy.asarray(fg.canvas.buffer_rgba())
+
+    # Find the pixels which cover the axis (with a small margin for the width
+    # of the boundary of the axis) ...
+    ny, nx, _ = img.shape
+    x0 = max(0, math.floor(ax.bbox.x0) - 8)
+    x1 = min(nx, math.ceil(ax.bbox.x1) + 8)
+    y0 = max(0, math.floor(ax.bbox.y0) - 8)
+    y1 = min(ny, math.ceil(ax.bbox.y1) + 8)
+    layer = img[ny - y1:ny - y0, x0:x1, :].copy()
+
+    # Save the base layer in the cache (atomically, so that a concurrent reader
+    # never sees a partially written file) ...
+    if cache:
+        if debug:
+            print(f"DEBUG: Saving base layer to \"{cfile}\".")
+        os.makedirs(cacheDir, exist_ok = True)
+        with tempfile.NamedTemporaryFile(
+              mode = "wb",
+            delete = False,
+               dir = cacheDir,
+            prefix = ".",
+            suffix = ".tmp",
+        ) as fObj:
+            try:
+                numpy.savez_compressed(
+                    fObj,
+                    layer = layer,
+                       x0 = x0,
+                       y0 = y0,
+                )
+            except:
+                os.remove(fObj.name)
+                raise
+        try:
+            os.replace(fObj.name, cfile)
+        except:
+            os.remove(fObj.name)
+            raise
+
+        # Evict the least recently used base layers until the on-disk cache is
+        # small enough (apart from the new base layer, which is always kept) ...
+        # NOTE: Another process may evict the same files at the same time.
+        files = []
+        for bfile in glob.glob(f"{cacheDir}/base-*.npz"):
+            try:
+                stat = os.stat(bfile)
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, bfile))
+        files.sort()
+        total = sum(size for _, size, _ in files)                               # [B]
+        for _, size, bfile in files:
+            if total <= maxSize:
+                break
+            if bfile == cfile:
+                continue
+            if debug:
+                print(f"DEBUG: Evicting base layer \"{bfile}\".")
+            try:
+                os.remove(bfile)
+            except OSError:
+                pass
+            total -= size                                                       # [B]
+
+    # Save the base layer in the in-memory cache (if required) ...
+    if memo is not None:
+        memo[cfile] = x0, y0, layer
+
+    # Return answer ...
+    return x0, y0, layer
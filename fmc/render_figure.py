@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def render_figure(
+    panels,
+    /,
+    *,
+    baseLayers = False,
+      baseSize = 1024 * 1024 * 1024,
+     businessX = None,
+     businessY = None,
+            c0 = (0.0, 0.0, 1.0),
+            c1 = (1.0, 0.5, 0.0),
+         cache = True,
+      cacheDir = None,
+     clipToFov = False,
+     countries = None,
+         debug = __debug__,
+       density = False,
+           eps = 1.0e-12,
+            hw = 0.2,
+         label = "",
+       layered = False,
+           lod = False,
+      leftDist = 2392.7e3,
+       leftFov = None,
+       leftLat = +39.517,
+       leftLon = -97.763,
+       maxYear = None,
+       minYear = None,
+          memo = None,
+         nIter = 100,
+     onlyValid = True,
+   panelRoutes = None,
+     pleasureX = None,
+     pleasureY = None,
+        repair = True,
+     rightDist = 2346.6e3,
+      rightFov = None,
+      rightLat = +49.901,
+      rightLon =  +3.156,
+        routes = None,
+         sfile = None,
+         stats = None,
+        styles = None,
+           tol = 1.0e-10,
+):
+    """Render some (or all) of the panels of a PNG map
+
+    This function creates the figure, draws the histogram and the summary label
+    and lays the figure out. It then draws the great circles and the countries
+    on the map axes which are listed in ``panels``. The figure is laid out
+    before anything is drawn on the maps, therefore the layout does not depend
+    on which panels are drawn. If the base layers are drawn from cached rasters
+    then the figure is laid out with a reference histogram and label, so that
+    most flight logs share the same layout (and therefore the same base
+    layers).
+
+    Parameters
+    ----------
+    panels : tuple of str
+        the panels to draw (any of "top", "left", "right" and "bottom")
+    baseLayers : bool, optional
+        draw the parts of the map panels which do not depend on the flight log
+        (the background, the coastlines, the gridlines and the outlines of all
+        of the countries) from cached rasters (see :func:`fmc.render_base_layer`)
+        and only draw the great circles and the visited countries on top of them
+    baseSize : int, optional
+        the maximum total size of the base layers in the on-disk cache (in
+        bytes)
+    businessX : list of float, optional
+        the locations of the business bars
+    businessY : list of float, optional
+        the heights of the business bars (in 1000 km)
+    c0 : tuple of float, optional
+        the colour of the business bars
+    c1 : tuple of float, optional
+        the colour of the pleasure bars
+    cache : bool, optional
+        use the on-disk cache of base layers
+    cacheDir : str, optional
+        the directory of the on-disk cache of base layers (defaults to
+        "~/.cache/fmc")
+    clipToFov : bool, optional
+        clip the great circles and the countries to the field-of-view of the
+        sub-maps (as well as culling the ones which are outside of it)
+    countries : list of tuple of str, list of shapely.geometry.polygon.Polygon, optional
+        the name and the Polygons of each country
+    debug : bool, optional
+        print debug messages
+    density : bool, optional
+        draw the density of the great circles on each map as a single image
+        (see :func:`fmc.draw_density`), rather than drawing each great circle
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    hw : float, optional
+        the half-width of the bars
+    label : str, optional
+        the summary label to write under the top map
+    layered : bool, optional
+        hide the panels which are not drawn and make the figure background
+        transparent, so that the result can be composited with other layers
+    lod : bool, optional
+        simplify the countries and the great circles on each map to half of
+        the size of a pixel of that map (see :func:`fmc.simplify_countries`),
+        so that there are far fewer vertices to project and to rasterise but
+        the map looks the same
+    leftDist : float, optional
+        the field-of-view around the left-hand sub-map central point (in metres)
+    leftFov : shapely.geometry.polygon.Polygon, optional
+        the field-of-view of the left-hand sub-map (in degrees)
+    leftLat : float, optional
+        the latitude of the central point of the left-hand sub-map (in degrees)
+    leftLon : float, optional
+        the longitude of the central point of the left-hand sub-map (in degrees)
+    maxYear : int, optional
+        the maximum year of the survey
+    minYear : int, optional
+        the minimum year of the survey
+    memo : dict, fmc.MemoCache, optional
+        an in-memory cache of base layers and of simplified country shapes (see
+        :func:`fmc.render_base_layer` and :func:`fmc.simplify_countries`)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    panelRoutes : dict of str to list of tuple of shapely.geometry.multilinestring.MultiLineString, tuple of float, optional
+        the great circle and the colour of each route on each map panel (which
+        is used instead of ``routes`` on the map panels which are in it)
+    pleasureX : list of float, optional
+        the locations of the pleasure bars
+    pleasureY : list of float, optional
+        the heights of the pleasure bars (in 1000 km)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    rightDist : float, optional
+        the field-of-view around the right-hand sub-map central point (in metres)
+    rightFov : shapely.geometry.polygon.Polygon, optional
+        the field-of-view of the right-hand sub-map (in degrees)
+    rightLat : float, optional
+        the latitude of the central point of the right-hand sub-map (in degrees)
+    rightLon : float, optional
+        the longitude of the central point of the right-hand sub-map (in degrees)
+    routes : list of tuple of shapely.geometry.multilinestring.MultiLineString, tuple of float, optional
+        the great circle and the colour of each route
+    sfile : str, optional
+        the Shapefile that the country shapes were loaded from (only used to
+        key the on-disk cache of base layers)
+    stats : fmc.RunStats, optional
+        the statistics to add the number of artists created on the maps to
+    styles : list of tuple of tuple of float, tuple of float, optional
+        the edge colour and the face colour of each country
+    tol : float, optional
+        the Euclidean distance that defines two points as being the same (in
+        degrees)
+
+    Returns
+    -------
+    fg : matplotlib.figure.Figure
+        the figure
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import math
+
+    # Import special modules ...
+    try:
+        import matplotlib
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from ._consts import AXES_MARGIN, FONT_SIZE
+    from .calc_pixel_size import calc_pixel_size
+    from .create_figure import create_figure
+    from .draw_histogram import draw_histogram
+    from .draw_map import draw_map
+    from .render_base_layer import render_base_layer
+    from .simplify_countries import simplify_countries
+
+    # Populate default values ...
+    if businessX is None:
+        businessX = []
+    if businessY is None:
+        businessY = []
+    if countries is None:
+        countries = []
+    if panelRoutes is None:
+        panelRoutes = {}
+    if pleasureX is None:
+        pleasureX = []
+    if pleasureY is None:
+        pleasureY = []
+    if routes is None:
+        routes = []
+    if styles is None:
+        styles = []
+
+    # **************************************************************************
+
+    # Create figure and axes ...
+    fg, axT, axL, axR, axB = create_figure(
+            debug = debug,
+              eps = eps,
+         leftDist = leftDist,
+          leftFov = leftFov,
+          leftLat = leftLat,
+          leftLon = leftLon,
+            nIter = nIter,
+        onlyValid = onlyValid,
+           panels = () if baseLayers else panels,
+           repair = repair,
+        rightDist = rightDist,
+         rightFov = rightFov,
+         rightLat = rightLat,
+         rightLon = rightLon,
+              tol = tol,
+    )
+
+    # Check if the base layers are drawn from cached rasters ...
+    if baseLayers:
+        # Find the height of the reference histograms ...
+        # NOTE: The reference bars are the largest number with the same number
+        #       of digits as the tallest tick of the real histograms (and at
+        #       least four of them), so that the tick labels of the reference
+        #       histograms are at least as wide as the real ones whilst there
+        #       are only a few different layouts.
+        tallest = (1.0 + AXES_MARGIN) * max([1000.0, *businessY, *pleasureY])
+        height = 9.0 * 10.0 ** math.floor(math.log10(tallest))
+
+        # Plot reference histograms and add reference annotation ...
+        # NOTE: The figure is laid out with a histogram and an annotation which
+        #       do not depend on the details of the flight log, so that the
+        #       layout (and therefore the base layers of the maps) is the same
+        #       for most flight logs.
+        draw_histogram(
+            axB,
+            [year - hw for year in range(2000, 2030)],
+            [height] * 30,
+            [year + hw for year in range(2000, 2030)],
+            [height] * 30,
+                 c0 = c0,
+                 c1 = c1,
+                 hw = hw,
+            maxYear = 2029,
+            minYear = 2000,
+        )
+        text = axT.text(
+            0.5,
+            -0.02,
+            "You have flown 0.0 km.",
+                       fontsize = FONT_SIZE,
+            horizontalalignment = "center",
+                      transform = axT.transAxes,
+              verticalalignment = "center",
+        )
+    else:
+        # Plot histograms and add annotation ...
+        # NOTE: The figure is laid out with the real histogram and annotation,
+        #       so that nothing is clipped.
+        draw_histogram(
+            axB,
+            businessX,
+            businessY,
+            pleasureX,
+            pleasureY,
+                 c0 = c0,
+                 c1 = c1,
+                 hw = hw,
+            maxYear = maxYear,
+            minYear = minYear,
+        )
+        text = axT.text(
+            0.5,
+            -0.02,
+            label,
+                       fontsize = FONT_SIZE,
+            horizontalalignment = "center",
+                      transform = axT.transAxes,
+              verticalalignment = "center",
+        )
+
+    # Configure figure ...
+    # NOTE: The figure is laid out before anything is drawn on the maps, so that
+    #       the layout does not depend on which panels are drawn.
+    # NOTE: The padding is in units of the global font size, therefore it is
+    #       scaled so that it is always the default padding in units of the
+    #       font size of the figure.
+    fg.tight_layout(pad = 1.08 * FONT_SIZE / matplotlib.rcParams["font.size"])
+
+    # Replace the reference histograms and annotation with the real ones (if
+    # required) ...
+    if baseLayers:
+        axB.clear()
+        draw_histogram(
+            axB,
+            businessX,
+            businessY,
+            pleasureX,
+            pleasureY,
+                 c0 = c0,
+                 c1 = c1,
+                 hw = hw,
+            maxYear = maxYear,
+            minYear = minYear,
+        )
+        text.set_text(label)
+
+    # Loop over axes ...
+    for panel, ax, fov, name in [
+        ("top", axT, None, "the top map"),
+        ("left", axL, leftFov, "the left-hand sub-map"),
+        ("right", axR, rightFov, "the right-hand sub-map"),
+    ]:
+        # Skip this axis if it is not required ...
+        if panel not in panels:
+            continue
+
+        # Find the great circles of this axis ...
+        axRoutes = panelRoutes.get(panel, routes)
+
+        # Simplify the countries to half of the size of a pixel of this axis
+        # (if required) ...
+        # NOTE: The great circles are simplified to the same tolerance when
+        #       they are drawn.
+        panelCountries = countries
+        simp = None
+        if lod:
+            simp = 0.5 * calc_pixel_size(ax) / (pyguymer3.CIRCUMFERENCE_OF_EARTH / 360.0)
+            panelCountries = simplify_countries(
+                countries,
+                simp,
+                    cache = cache,
+                 cacheDir = cacheDir,
+                    debug = debug,
+                     memo = memo,
+                onlyValid = onlyValid,
+                   repair = repair,
+                    sfile = sfile,
+            )
+
+        # Check if the base layer is drawn from a raster ...
+        if baseLayers:
+            # Render (or load) the base layer ...
+            x0, y0, layer = render_base_layer(
+                panel,
+                (
+                    fg.subplotpars.left,
+                    fg.subplotpars.bottom,
+                    fg.subplotpars.right,
+                    fg.subplotpars.top,
+                    fg.subplotpars.wspace,
+                    fg.subplotpars.hspace,
+                ),
+                    cache = cache,
+                 cacheDir = cacheDir,
+                clipToFov = clipToFov,
+                countries = countries,
+                    debug = debug,
+                      eps = eps,
+                 leftDist = leftDist,
+                  leftFov = leftFov,
+                  leftLat = leftLat,
+                  leftLon = leftLon,
+                      lod = lod,
+                  maxSize = baseSize,
+                     memo = memo,
+                    nIter = nIter,
+                onlyValid = onlyValid,
+                   repair = repair,
+                rightDist = rightDist,
+                 rightFov = rightFov,
+                 rightLat = rightLat,
+                 rightLon = rightLon,
+                    sfile = sfile,
+                      tol = tol,
+            )
+
+            # Draw the base layer underneath the axis and make the axis
+            # transparent (the base layer already has the background and the
+            # boundary of the axis) ...
+            # NOTE: The base layer was rendered on a figure with exactly the
+            #       same size and layout, so it lines up pixel-for-pixel.
+            fg.figimage(
+                layer,
+                interpolation = "none",
+                       origin = "upper",
+                     resample = False,
+                           xo = x0,
+                           yo = y0,
+                       zorder = -1.0,
+            )
+            ax.patch.set_visible(False)
+            for spine in ax.spines.values():
+                spine.set_visible(False)
+
+            # Draw the great circles and the visited countries ...
+            # NOTE: The outlines of all of the countries are in the base layer.
+            artists = draw_map(
+                ax,
+                axRoutes,
+                [country for country, style in zip(panelCountries, styles, strict = True) if style[1] != "none"],
+                [style for style in styles if style[1] != "none"],
+                clipToFov = clipToFov,
+                    debug = debug,
+                  density = density,
+                      fov = fov,
+                     name = name,
+                     simp = simp,
+            )
+            if stats is not None:
+                stats.artists += artists
+            continue
+
+        # Draw the great circles and the countries ...
+        artists = draw_map(
+            ax,
+            axRoutes,
+            panelCountries,
+            styles,
+            clipToFov = clipToFov,
+                debug = debug,
+              density = density,
+                  fov = fov,
+                 name = name,
+                 simp = simp,
+        )
+        if stats is not None:
+            stats.artists += artists
+
+    # Hide the panels which are not drawn (if required) ...
+    if layered:
+        for panel, ax in [
+            ("top", axT),
+            ("left", axL),
+            ("right", axR),
+            ("bottom", axB),
+        ]:
+            if panel not in panels:
+                ax.set_visible(False)
+        fg.patch.set_alpha(0.0)
+
+    # Return answer ...
+    return fg
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def render_layer(
+    panel,
+    /,
+    **kwargs,
+):
+    """Render one panel of a PNG map to its own raster
+
+    This function is run in a worker process by :func:`fmc.run` (when it is
+    asked to use more than one job). It renders a single panel on a transparent
+    figure with exactly the same layout and size as the full PNG map, so that
+    the layers of all of the panels can be composited together.
+
+    Parameters
+    ----------
+    panel : str
+        the panel to draw (one of "top", "left", "right" and "bottom")
+    **kwargs
+        the keyword arguments to pass to :func:`fmc.render_figure`
+
+    Returns
+    -------
+    layer : numpy.ndarray
+        the RGBA raster of the panel (with non-premultiplied alpha)
+    artists : int
+        the number of artists created on the map (if the panel is a map)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .RunStats import RunStats
+    from .render_figure import render_figure
+
+    # **************************************************************************
+
+    # Render the panel ...
+    stats = RunStats()
+    fg = render_figure(
+        (panel,),
+        layered = True,
+          stats = stats,
+        **kwargs,
+    )
+    fg.canvas.draw()
+
+    # Copy the raster out of the canvas (so that it survives the figure) ...
+    layer = numpy.array(fg.canvas.buffer_rgba(), dtype = numpy.uint8)
+
+    # Return answer ...
+    return layer, stats.artists
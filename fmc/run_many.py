@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def run_many(
+    jobs,
+    /,
+    *,
+    optimiseJobs = 1,
+     returnStats = False,
+         timeout = 60.0,
+    **kwargs,
+):
+    """Make many PNG maps from many CSV files
+
+    This function loads everything which does not depend on a flight log once
+    (see :class:`fmc.Renderer`) and then makes a PNG map for each job in turn,
+    so that the fixed setup is not repeated for every flight log. The PNG maps
+    are optimised in the background (see :class:`fmc.Optimiser`), so that
+    making the next PNG map overlaps with optimising the previous ones; this
+    function returns once all of them have been optimised.
+
+    Parameters
+    ----------
+    jobs : list of tuple of str, str, dict
+        the CSV of the flights, the PNG map and the keyword arguments to pass
+        to :meth:`fmc.Renderer.render` of each job
+    optimiseJobs : int, optional
+        the number of worker threads to optimise the PNG maps in the
+        background (if it is zero then each PNG map is optimised before the
+        next one is made)
+    returnStats : bool, optional
+        return the statistics of making each PNG map too
+    timeout : float, optional
+        the timeout for any subprocess calls made by the workers which optimise
+        the PNG maps in the background (in seconds)
+    **kwargs
+        the keyword arguments to pass to :class:`fmc.Renderer`
+
+    Returns
+    -------
+    times : list of float
+        the time taken to make each PNG map (in seconds; this does not include
+        the time taken to optimise it, if it was optimised in the background)
+    stats : list of dict
+        the statistics of making each PNG map (see
+        :meth:`fmc.RunStats.to_dict`), including the time taken by each stage
+        (only if ``returnStats`` is ``True``)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import contextlib
+    import time
+
+    # Import sub-functions ...
+    from .Optimiser import Optimiser
+    from .Renderer import Renderer
+
+    # **************************************************************************
+
+    # Initialize lists ...
+    stats = []
+    times = []                                                                  # [s]
+
+    # Load everything which does not depend on the flight logs and create the
+    # pool of workers which optimise the PNG maps in the background ...
+    # NOTE: The renderer is closed after the pool of workers, therefore all of
+    #       the PNG maps have been optimised by the time that it is closed.
+    with Renderer(**kwargs) as renderer, (
+        Optimiser(
+              debug = renderer.debug,
+               jobs = optimiseJobs,
+            timeout = timeout,
+        ) if optimiseJobs > 0 else contextlib.nullcontext()
+    ) as optimiser:
+        # Loop over jobs ...
+        for flightLog, flightMap, options in jobs:
+            # Make the PNG map ...
+            t0 = time.perf_counter()
+            stats.append(
+                renderer.render(
+                    flightLog,
+                    flightMap = flightMap,
+                    optimiser = optimiser,
+                    **options,
+                )
+            )
+            times.append(time.perf_counter() - t0)                              # [s]
+
+            if renderer.debug:
+                print(f"DEBUG: Made \"{flightMap}\" from \"{flightLog}\" in {times[-1]:,.3f} s.")
+
+    # Return answer ...
+    # NOTE: The statistics are converted once all of the PNG maps have been
+    #       optimised, so that they include the optimisation stage too.
+    if returnStats:
+        return times, [jobStats.to_dict() for jobStats in stats]
+    return times
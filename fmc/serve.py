@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def serve(
+    *,
+      debug = __debug__,
+       host = "127.0.0.1",
+       jobs = 1,
+    maxSize = 256 * 1024 * 1024,
+       port = 8000,
+    **kwargs,
+):
+    """Serve PNG maps of flight logs over HTTP
+
+    This function runs a small local HTTP server (with one thread per request)
+    in front of a :class:`fmc.RenderService` (with a pool of worker processes
+    which stay warm between requests) until it is interrupted. It has two
+    endpoints:
+
+    * "POST /render", which takes a JSON object with the text of the CSV of
+      the flights ("flightLog") and, optionally, the options of
+      :meth:`fmc.Renderer.render` ("options") and returns the PNG map (the
+      "X-FMC-Source" header says whether it came from the cache, was shared
+      with a concurrent identical request or was made for this request); and
+    * "GET /stats", which returns the statistics of the service as JSON (see
+      :meth:`fmc.RenderService.to_dict`).
+
+    Parameters
+    ----------
+    debug : bool, optional
+        print debug messages
+    host : str, optional
+        the address to listen on
+    jobs : int, optional
+        the number of worker processes to make the PNG maps in
+    maxSize : int, optional
+        the maximum total size of the PNG maps in the cache (in bytes)
+    port : int, optional
+        the port to listen on
+    **kwargs
+        the keyword arguments to pass to :class:`fmc.Renderer` in each worker
+        process
+
+    Notes
+    -----
+    There is no authentication, therefore the server should only listen on
+    addresses which are trusted.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import http
+    import http.server
+    import json
+
+    # Import sub-functions ...
+    from .RenderService import RenderService
+
+    # **************************************************************************
+
+    # Define the handler of the requests ...
+    class Handler(http.server.BaseHTTPRequestHandler):
+        # Define function ...
+        def reply(self, status, contentType, body, /, *, headers = None):
+            self.send_response(status)
+            self.send_header("Content-Type", contentType)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        # Define function ...
+        def reply_json(self, status, obj, /):
+            self.reply(status, "application/json", json.dumps(obj).encode("utf-8"))
+
+        # Define function ...
+        def do_GET(self):
+            # Check the endpoint ...
+            if self.path != "/stats":
+                self.reply_json(http.HTTPStatus.NOT_FOUND, {"error" : f"\"{self.path}\" is not an endpoint"})
+                return
+
+            # Return the statistics ...
+            self.reply_json(http.HTTPStatus.OK, service.to_dict())
+
+        # Define function ...
+        def do_POST(self):
+            # Check the endpoint ...
+            if self.path != "/render":
+                self.reply_json(http.HTTPStatus.NOT_FOUND, {"error" : f"\"{self.path}\" is not an endpoint"})
+                return
+
+            # Parse the request ...
+            try:
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                flightLog = request["flightLog"]
+                options = request.get("options", {})
+                if not isinstance(flightLog, str) or not isinstance(options, dict):
+                    raise TypeError("\"flightLog\" must be a string and \"options\" must be an object") from None
+            except Exception as err:
+                self.reply_json(http.HTTPStatus.BAD_REQUEST, {"error" : f"the request is not valid ({err})"})
+                return
+
+            # Make (or find) the PNG map ...
+            try:
+                png, source = service.render(flightLog, **options)
+            except ValueError as err:
+                self.reply_json(http.HTTPStatus.BAD_REQUEST, {"error" : str(err)})
+                return
+            except Exception as err:
+                self.reply_json(http.HTTPStatus.INTERNAL_SERVER_ERROR, {"error" : f"the PNG map could not be made ({err})"})
+                return
+
+            # Return the PNG map ...
+            self.reply(
+                http.HTTPStatus.OK,
+                "image/png",
+                png,
+                headers = {
+                    "X-FMC-Source" : source,
+                },
+            )
+
+        # Define function ...
+        def log_message(self, fmt, /, *args):
+            # Only log the requests when debugging ...
+            if debug:
+                super().log_message(fmt, *args)
+
+    # Start the service and the server ...
+    with RenderService(
+          debug = debug,
+           jobs = jobs,
+        maxSize = maxSize,
+        **kwargs,
+    ) as service, http.server.ThreadingHTTPServer((host, port), Handler) as server:
+        print(f"Serving PNG maps on http://{host}:{server.server_address[1]:d}/ (press Ctrl+C to stop).")
+
+        # Serve until interrupted ...
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
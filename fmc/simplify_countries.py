@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def simplify_countries(
+    countries,
+    simp,
+    /,
+    *,
+        cache = True,
+     cacheDir = None,
+        debug = __debug__,
+         memo = None,
+    onlyValid = True,
+       repair = True,
+        sfile = None,
+):
+    """Simplify the country shapes
+
+    This function simplifies the Polygons of each country to a tolerance (e.g.,
+    the size of half a pixel of the map axis that they are drawn on), so that
+    there are far fewer vertices to project and to rasterise but the drawn map
+    looks the same. The topology is preserved, therefore no country (or island)
+    is removed. The result is saved in an on-disk cache, keyed by the
+    Shapefile, by the validation settings and by the tolerance, so that later
+    calls just load it. The tolerance is rounded down to a power of two, so
+    that small changes to the layout of the figure reuse the cache.
+
+    Parameters
+    ----------
+    countries : list of tuple of str, list of shapely.geometry.polygon.Polygon
+        the name and the Polygons of each country
+    simp : float
+        the tolerance of the simplification (in degrees)
+    cache : bool, optional
+        use the on-disk cache
+    cacheDir : str, optional
+        the directory of the on-disk cache (defaults to "~/.cache/fmc")
+    debug : bool, optional
+        print debug messages
+    memo : dict, fmc.MemoCache, optional
+        an in-memory cache of simplified country shapes (which is shared
+        between calls, so that a long-lived process only loads each set of
+        simplified country shapes from disk once)
+    onlyValid : bool, optional
+        the country shapes only contain valid Polygons (only used to key the
+        on-disk cache)
+    repair : bool, optional
+        the country shapes had their invalid Polygons repaired (only used to
+        key the on-disk cache)
+    sfile : str, optional
+        the Shapefile that the country shapes were loaded from (only used to
+        key the on-disk cache; if it is not given then the on-disk cache is not
+        used)
+
+    Returns
+    -------
+    countries : list of tuple of str, list of shapely.geometry.polygon.Polygon
+        the name and the simplified Polygons of each country (in the same order)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import math
+    import os
+    import pathlib
+    import pickle
+    import tempfile
+
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # **************************************************************************
+
+    # Populate default values ...
+    if cacheDir is None:
+        cacheDir = pathlib.PosixPath("~/.cache/fmc").expanduser()
+
+    # Round the tolerance down to a power of two ...
+    simp = 2.0 ** math.floor(math.log2(simp))                                   # [°]
+
+    # Create the name of the cache file ...
+    cfile = None
+    if sfile is not None:
+        key = "|".join(
+            [
+                "simplified-v1",
+                os.path.abspath(sfile),
+                f"{os.stat(sfile).st_mtime_ns:d}",
+                f"{onlyValid!r}",
+                f"{repair!r}",
+                f"{len(countries):d}",
+                float(simp).hex(),
+            ]
+        )
+        cfile = f"{cacheDir}/simplified-{hashlib.sha256(key.encode('utf-8')).hexdigest()}.pickle"
+
+    # Return the simplified country shapes from the in-memory cache (if they are
+    # in there) ...
+    if memo is not None and cfile is not None:
+        ans = memo.get(cfile)
+        if ans is not None:
+            return ans
+
+    # Return the simplified country shapes from the on-disk cache (if they are
+    # in there) ...
+    # NOTE: A file which cannot be read (e.g., because it is corrupt) is
+    #       treated as though it does not exist, so that it is just rebuilt.
+    if cache and cfile is not None and os.path.exists(cfile):
+        if debug:
+            print(f"DEBUG: Loading simplified country shapes from \"{cfile}\".")
+        try:
+            with open(cfile, mode = "rb") as fObj:
+                ans = [
+                    (neName, list(shapely.from_wkb(wkb).geoms))
+                    for neName, wkb in pickle.load(fObj)
+                ]
+        except Exception as err:
+            if debug:
+                print(f"DEBUG: The simplified country shapes could not be loaded ({err}).")
+        else:
+            if memo is not None:
+                memo[cfile] = ans
+            return ans
+
+    # Simplify all of the countries at once ...
+    # NOTE: Each country is simplified as a whole (rather than Polygon by
+    #       Polygon) so that its Polygons stay valid with respect to each
+    #       other.
+    geoms = [shapely.geometry.MultiPolygon(polys) for _, polys in countries]
+    simplified = shapely.simplify(
+        geoms,
+        simp,
+        preserve_topology = True,
+    )
+    ans = [
+        (neName, [poly for poly in shapely.get_parts(geom) if not poly.is_empty])
+        for (neName, _), geom in zip(countries, simplified, strict = True)
+    ]
+
+    if debug:
+        nOld = int(shapely.get_num_coordinates(geoms).sum())
+        nNew = int(shapely.get_num_coordinates(simplified).sum())
+        print(f"DEBUG: Simplified the country shapes to {simp:.3e}° from {nOld:,d} to {nNew:,d} vertices.")
+
+    # Save the simplified country shapes in the cache (atomically, so that a
+    # concurrent reader never sees a partially written file) ...
+    if cache and cfile is not None:
+        if debug:
+            print(f"DEBUG: Saving simplified country shapes to \"{cfile}\".")
+        os.makedirs(cacheDir, exist_ok = True)
+        with tempfile.NamedTemporaryFile(
+              mode = "wb",
+            delete = False,
+               dir = cacheDir,
+            prefix = ".",
+            suffix = ".tmp",
+        ) as fObj:
+            try:
+                pickle.dump(
+                    [
+                        (neName, shapely.to_wkb(shapely.geometry.MultiPolygon(polys)))
+                        for neName, polys in ans
+                    ],
+                    fObj,
+                )
+            except:
+                os.remove(fObj.name)
+                raise
+        try:
+            os.replace(fObj.name, cfile)
+        except:
+            os.remove(fObj.name)
+            raise
+
+    # Save the simplified country shapes in the in-memory cache ...
+    if memo is not None and cfile is not None:
+        memo[cfile] = ans
+
+    # Return answer ...
+    return ans
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def summarise_flight_logs(
+    flightLogs,
+    /,
+    *,
+         chunkSize = 1048576,
+             debug = __debug__,
+               eps = 1.0e-12,
+    extraCountries = None,
+              jobs = 1,
+           maxYear = None,
+           minYear = None,
+             nIter = 100,
+        notVisited = None,
+           renames = None,
+            shards = 1,
+):
+    """Summarise many CSV files of flights without making a PNG map
+
+    This function computes the statistics that :func:`fmc.run` writes on the
+    PNG map (the total distance, the distance flown each year for each
+    purpose and the visited countries) for one or more CSV files of flights
+    (e.g., the shards of a fleet-wide flight log), without loading any of the
+    plotting dependencies. Each CSV file is split into ``shards`` ranges of
+    bytes, each range is tallied on its own (in a pool of worker processes, if
+    ``jobs`` is more than one) and the tallies are merged in order (see
+    :class:`fmc.FlightTally`), so that the answer does not depend on how the
+    flight logs were split up or on how many worker processes were used.
+
+    Parameters
+    ----------
+    flightLogs : str, list of str
+        the CSV(s) of your flights (in order, as if they were one flight log)
+    chunkSize : int, optional
+        the maximum number of flights in each chunk
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    extraCountries : list of str, optional
+        a list of extra countries that you have visited but which you have not
+        flown to (e.g., you took a train)
+    jobs : int, optional
+        the number of worker processes to tally the shards in
+    maxYear : int, optional
+        the maximum year to use for the survey (defaults to this year)
+    minYear : int, optional
+        the minimum year to use for the survey (defaults to the year of the
+        first valid flight)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    notVisited : list of str, optional
+        a list of countries which you have flown to but not visited (e.g., you
+        just transferred planes)
+    renames : dict, optional
+        a mapping from OpenFlights country names to other country names (e.g.,
+        Natural Earth country names)
+    shards : int, optional
+        the number of ranges of bytes to split each CSV into
+
+    Returns
+    -------
+    summary : dict
+        the summary (see :meth:`fmc.FlightTally.summary`)
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+    import os
+
+    # Import sub-functions ...
+    from .FlightTally import FlightTally
+    from .load_airports import load_airports
+    from .tally_flight_log import tally_flight_log
+
+    # **************************************************************************
+
+    # Populate default values ...
+    if isinstance(flightLogs, str):
+        flightLogs = [flightLogs]
+
+    # Split each CSV into ranges of bytes ...
+    tasks = []
+    for flightLog in flightLogs:
+        size = os.path.getsize(flightLog)                                       # [B]
+        for i in range(shards):
+            tasks.append((flightLog, (i * size // shards, (i + 1) * size // shards)))
+
+    # Tally the shards (either in this process or in the pool of worker
+    # processes) ...
+    if jobs > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers = jobs) as pool:
+            futures = [
+                pool.submit(
+                    tally_flight_log,
+                    flightLog,
+                    byteRange = byteRange,
+                    chunkSize = chunkSize,
+                        debug = debug,
+                )
+                for flightLog, byteRange in tasks
+            ]
+            tallies = [future.result() for future in futures]
+    else:
+        tallies = [
+            tally_flight_log(
+                flightLog,
+                byteRange = byteRange,
+                chunkSize = chunkSize,
+                    debug = debug,
+            )
+            for flightLog, byteRange in tasks
+        ]
+
+    # Merge the tallies in order ...
+    tally = FlightTally()
+    for other in tallies:
+        tally.merge(other)
+
+    if debug:
+        print(f"DEBUG: Merged {len(tallies):,d} tallies of {tally.stats.rowsRead:,d} rows.")
+
+    # Return answer ...
+    return tally.summary(
+        load_airports(debug = debug),
+                   eps = eps,
+        extraCountries = extraCountries,
+               maxYear = maxYear,
+               minYear = minYear,
+                 nIter = nIter,
+            notVisited = notVisited,
+               renames = renames,
+    )
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def tally_flight_log(
+    flightLog,
+    /,
+    *,
+    byteRange = None,
+    chunkSize = 1048576,
+        debug = __debug__,
+):
+    """Tally (a shard of) a CSV file of flights
+
+    This function streams (a range of bytes of) a CSV file of flights and
+    counts the valid flights (see :class:`fmc.FlightTally`). The survey is not
+    applied here (every valid flight is counted, whatever its year), so that
+    the tallies of the shards of a flight log can be merged before the survey
+    is applied.
+
+    Parameters
+    ----------
+    flightLog : str
+        the CSV of your flights
+    byteRange : tuple of int, optional
+        only read the rows which start within this range of bytes of the CSV
+        (see :func:`fmc.iter_flight_log`)
+    chunkSize : int, optional
+        the maximum number of flights in each chunk
+    debug : bool, optional
+        print debug messages
+
+    Returns
+    -------
+    tally : fmc.FlightTally
+        the tally
+
+    Notes
+    -----
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import sub-functions ...
+    from .FlightTally import FlightTally
+    from .iter_flight_log import iter_flight_log
+
+    # **************************************************************************
+
+    # Tally the flight log ...
+    # NOTE: Every year is four digits long, therefore these limits do not skip
+    #       any flights.
+    tally = FlightTally()
+    for chunk in iter_flight_log(
+        flightLog,
+        byteRange = byteRange,
+        chunkSize = chunkSize,
+            debug = debug,
+          maxYear = 9999,
+          minYear = 0,
+            stats = tally.stats,
+    ):
+        tally.add(chunk)
+
+    # Return answer ...
+    return tally
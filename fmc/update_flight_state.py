@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def update_flight_state(
+    flightLog,
+    airports,
+    /,
+    *,
+    chunkSize = 1048576,
+        debug = __debug__,
+          eps = 1.0e-12,
+      maxYear = None,
+      minYear = None,
+        nIter = 100,
+    stateFile = None,
+        stats = None,
+):
+    """Update the persisted state of a CSV file of flights
+
+    This function loads the state of a flight log (see
+    :class:`fmc.FlightState`) from the file next to it, checks that the part of
+    the flight log which it was made from has not changed since and then only
+    reads the rows which have been appended to the flight log since. If the
+    state does not exist, if it was made with different settings (or with a
+    different airport database) or if the part of the flight log which it was
+    made from has changed (or has been truncated) then the state is rebuilt
+    from the whole flight log. The updated
+    state is saved next to the flight log again.
+
+    Parameters
+    ----------
+    flightLog : str
+        the CSV of your flights
+    airports : fmc.AirportIndex
+        the index of the airports
+    chunkSize : int, optional
+        the maximum number of flights in each chunk
+    debug : bool, optional
+        print debug messages
+    eps : float, optional
+        the tolerance of the Vincenty formula iterations
+    maxYear : int, optional
+        the maximum year to use for the survey (defaults to this year)
+    minYear : int, optional
+        the minimum year to use for the survey (defaults to the year of the
+        first valid flight)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    stateFile : str, optional
+        the file of the state (defaults to the flight log with a
+        ".state.pickle" extension instead of a ".csv" extension)
+    stats : fmc.RunStats, optional
+        the statistics to add the number of rows read and skipped to (only the
+        rows which are read by this call are counted)
+
+    Returns
+    -------
+    state : fmc.FlightState
+        the updated state
+
+    Notes
+    -----
+    Checking that the flight log has not changed only needs the SHA-256
+    checksum of the bytes which have already been processed (rather than
+    parsing their rows and finding their distances again), therefore the cost
+    of an update is dominated by the number of rows which have been appended.
+    Only the rows which end with a newline are read, so that a row which is
+    still being appended is read by the next update instead.
+
+    Copyright 2016 Thomas Guymer [1]_
+
+    References
+    ----------
+    .. [1] FMC, https://github.com/Guymer/fmc
+    """
+
+    # Import standard modules ...
+    import datetime
+    import hashlib
+    import os
+
+    # Import sub-functions ...
+    from .FlightState import FlightState
+    from .iter_flight_log import iter_flight_log
+
+    # **************************************************************************
+
+    # Populate default values ...
+    if maxYear is None:
+        maxYear = datetime.datetime.now(tz = datetime.UTC).year
+    if stateFile is None:
+        stateFile = f'{flightLog.removesuffix(".csv")}.state.pickle'
+
+    # Define a function to add a range of bytes of the flight log to a
+    # checksum ...
+    def add_bytes(hashObj, start, stop):
+        with open(flightLog, mode = "rb") as fObj:
+            fObj.seek(start)
+            while start < stop:
+                block = fObj.read(min(stop - start, 1048576))
+                if not block:
+                    break
+                hashObj.update(block)
+                start += len(block)                                             # [B]
+
+    # Define a function to find the end of the last whole row of the flight
+    # log in a range of bytes ...
+    def find_stop(start, stop):
+        with open(flightLog, mode = "rb") as fObj:
+            while stop > start:
+                first = max(start, stop - 1048576)                              # [B]
+                fObj.seek(first)
+                index = fObj.read(stop - first).rfind(b"\n")
+                if index != -1:
+                    return first + index + 1
+                stop = first                                                    # [B]
+        return start
+
+    # Find the size of the flight log ...
+    size = os.path.getsize(flightLog)                                           # [B]
+
+    # Load the state and check that it is still valid ...
+    # NOTE: The checksum of the airport database is part of the settings, so
+    #       that the state is rebuilt if the airport database changes (e.g., if
+    #       the coordinates of an airport are corrected).
+    settings = (airports.checksum(), eps, maxYear, minYear, nIter)
+    state = FlightState.load(stateFile, debug = debug)
+    hashObj = hashlib.sha256()
+    if state is not None:
+        if state.settings != settings:
+            if debug:
+                print("DEBUG: The state of the flight log was made with different settings (or a different airport database).")
+            state = None
+        elif state.offset > size:
+            if debug:
+                print("DEBUG: The flight log has been truncated since the state of it was made.")
+            state = None
+        else:
+            add_bytes(hashObj, 0, state.offset)
+            if hashObj.hexdigest() != state.checksum:
+                if debug:
+                    print("DEBUG: The flight log has been changed since the state of it was made.")
+                state = None
+
+    # Rebuild the state (if required) ...
+    if state is None:
+        if debug:
+            print(f"DEBUG: Rebuilding the state of \"{flightLog}\".")
+        state = FlightState(settings)
+        hashObj = hashlib.sha256()
+
+    # Find the end of the last whole row of the flight log ...
+    # NOTE: Any bytes after the last newline are a row which is still being
+    #       appended, therefore they are left for the next update.
+    stop = find_stop(state.offset, size)                                        # [B]
+
+    # Check that rows have been appended to the flight log ...
+    if state.checksum is not None and state.offset == stop:
+        if debug:
+            print(f"DEBUG: No rows have been appended to \"{flightLog}\".")
+        return state
+
+    # Add the rows which have been appended to the flight log to the state ...
+    if debug:
+        print(f"DEBUG: Reading bytes {state.offset:,d} to {stop:,d} of \"{flightLog}\".")
+    for chunk in iter_flight_log(
+        flightLog,
+        byteRange = (state.offset, stop),
+        chunkSize = chunkSize,
+            debug = debug,
+          maxYear = maxYear,
+          minYear = minYear if state.minYear is None else state.minYear,
+            stats = stats,
+    ):
+        state.add(
+            chunk,
+            airports,
+              eps = eps,
+            nIter = nIter,
+        )
+
+    # Update the checksum and save the state ...
+    add_bytes(hashObj, state.offset, stop)
+    state.checksum = hashObj.hexdigest()
+    state.offset = stop                                                         # [B]
+    state.save(stateFile, debug = debug)
+
+    # Return answer ...
+    return state